@@ -0,0 +1,284 @@
+import json
+import time
+import argparse
+
+import scraping_v1
+from mock_getprog_server import start_mock_server
+
+# End-to-end crawl benchmark against the local mock site, headless Chrome, no network
+
+PHASES = [
+    "login",
+    "navigate_to_page",
+    "extract_candidate_info_from_page",
+    "clean_data",
+    "remove_duplicates",
+]
+
+
+def configure_crawler(base_url, size, mode=None):
+    """Point the crawler at the mock site"""
+    scraping_v1.LOGIN_URL = f"{base_url}/login"
+    scraping_v1.BASE_SEARCH_URL = f"{base_url}/search/results?text=benchmark"
+    scraping_v1.RESULTS_PER_PAGE = size
+    scraping_v1.HEADLESS = True
+    if mode:
+        scraping_v1.EXTRACTION_MODE = mode
+
+
+def timed(timings, phase, func, *args):
+    """Call func and record its wall-clock time under phase"""
+    start = time.perf_counter()
+    result = func(*args)
+    timings.setdefault(phase, []).append(time.perf_counter() - start)
+    return result
+
+
+def run_benchmark(pages, autotune=False):
+    """Crawl pages from the configured site, return timings per phase and throughput
+
+    With autotune the page size is picked by autotune_page_size after login first.
+    """
+    timings = {}
+    all_candidates = []
+    driver = scraping_v1.setup_driver_no_image()
+    try:
+        start = time.perf_counter()
+        if not timed(
+            timings, "login", scraping_v1.login, driver, "bench@example.com", "bench"
+        ):
+            raise RuntimeError("Login to the mock site failed")
+        if autotune:
+            timed(timings, "autotune", scraping_v1.autotune_page_size, driver)
+
+        for page_number in range(pages):
+            timed(
+                timings,
+                "navigate_to_page",
+                scraping_v1.navigate_to_page,
+                driver,
+                page_number,
+            )
+            candidates = timed(
+                timings,
+                "extract_candidate_info_from_page",
+                scraping_v1.extract_candidate_info_from_page,
+                driver,
+                page_number,
+            )
+            candidates = timed(
+                timings, "clean_data", scraping_v1.clean_data, candidates
+            )
+            all_candidates.extend(candidates)
+
+        unique_candidates = timed(
+            timings, "remove_duplicates", scraping_v1.remove_duplicates, all_candidates
+        )
+        total_seconds = time.perf_counter() - start
+    finally:
+        driver.quit()
+
+    # Throughput excludes the one-off login and page size tuning
+    crawl_seconds = (
+        total_seconds - sum(timings["login"]) - sum(timings.get("autotune", []))
+    )
+    return {
+        "mode": scraping_v1.EXTRACTION_MODE,
+        "pages": pages,
+        "page_size": scraping_v1.RESULTS_PER_PAGE,
+        "candidates": len(all_candidates),
+        "unique_candidates": len(unique_candidates),
+        "total_seconds": total_seconds,
+        "crawl_seconds": crawl_seconds,
+        "pages_per_second": pages / crawl_seconds,
+        "candidates_per_second": len(all_candidates) / crawl_seconds,
+        "phases": {
+            phase: {
+                "calls": len(timings.get(phase, [])),
+                "total_seconds": sum(timings.get(phase, [])),
+                "mean_seconds": sum(timings.get(phase, []))
+                / max(1, len(timings.get(phase, []))),
+            }
+            for phase in PHASES
+        },
+    }
+
+
+def measure_page_loads(pages):
+    """Load pages with resource blocking off and on, return load time, JS heap per tab and
+    browser process memory"""
+    results = {}
+    for block in [False, True]:
+        scraping_v1.BLOCK_RESOURCES = block
+        driver = scraping_v1.setup_driver_no_image()
+        try:
+            if not scraping_v1.login(driver, "bench@example.com", "bench"):
+                raise RuntimeError("Login to the mock site failed")
+            driver.execute_cdp_cmd("Performance.enable", {})
+            load_seconds = []
+            heap_bytes = []
+            browser_mb = []
+            for page_number in range(pages):
+                start = time.perf_counter()
+                driver.get(scraping_v1.get_search_url(page_number))
+                scraping_v1.wait_for_results_ready(driver, scraping_v1.RESULTS_PER_PAGE)
+                load_seconds.append(time.perf_counter() - start)
+                metrics = driver.execute_cdp_cmd("Performance.getMetrics", {})
+                values = {
+                    metric["name"]: metric["value"] for metric in metrics["metrics"]
+                }
+                heap_bytes.append(values["JSHeapUsedSize"])
+                # None where /proc is unavailable
+                browser_mb.append(
+                    scraping_v1.process_tree_rss_mb(driver.service.process.pid)
+                )
+        finally:
+            driver.quit()
+        results["blocked" if block else "unblocked"] = {
+            "pages": pages,
+            "mean_load_seconds": sum(load_seconds) / pages,
+            "mean_heap_mb": sum(heap_bytes) / pages / 2**20,
+            "max_heap_mb": max(heap_bytes) / 2**20,
+            "max_browser_mb": max(browser_mb) if None not in browser_mb else None,
+        }
+    return results
+
+
+def print_load_report(results):
+    """Print page load time and JS heap with resource blocking off and on"""
+    print("\n==== Page loads: resource blocking off vs on ====")
+    print(
+        f"{'Setting':<12}{'Load (s)':>12}{'Heap (MB)':>12}{'Max heap (MB)':>16}"
+        f"{'Browser (MB)':>16}"
+    )
+    for setting, stats in results.items():
+        browser = stats["max_browser_mb"]
+        browser = "n/a" if browser is None else f"{browser:.0f}"
+        print(
+            f"{setting:<12}{stats['mean_load_seconds']:>12.3f}"
+            f"{stats['mean_heap_mb']:>12.2f}{stats['max_heap_mb']:>16.2f}{browser:>16}"
+        )
+    unblocked, blocked = results["unblocked"], results["blocked"]
+    changes = [
+        f"Load time {_change(blocked['mean_load_seconds'], unblocked['mean_load_seconds'])}",
+        f"JS heap {_change(blocked['mean_heap_mb'], unblocked['mean_heap_mb'])}",
+    ]
+    if blocked["max_browser_mb"] and unblocked["max_browser_mb"]:
+        changes.append(
+            f"browser memory {_change(blocked['max_browser_mb'], unblocked['max_browser_mb'])}"
+        )
+    print(", ".join(changes))
+
+
+def _change(value, baseline_value):
+    if not baseline_value:
+        return ""
+    return f"{(value - baseline_value) / baseline_value * 100:+.1f}%"
+
+
+def print_report(result, baseline=None):
+    """Print phase timings and throughput, with change against a baseline if given"""
+    print(
+        f"\n==== Benchmark: {result['pages']} pages x {result['page_size']} results, mode={result['mode']} ===="
+    )
+    print(f"{'Phase':<36}{'Calls':>7}{'Total (s)':>12}{'Mean (s)':>12}{'vs base':>10}")
+    for phase, stats in result["phases"].items():
+        base = baseline["phases"][phase]["mean_seconds"] if baseline else None
+        print(
+            f"{phase:<36}{stats['calls']:>7}{stats['total_seconds']:>12.3f}"
+            f"{stats['mean_seconds']:>12.4f}{_change(stats['mean_seconds'], base):>10}"
+        )
+    for key, label in [
+        ("pages_per_second", "Pages/sec"),
+        ("candidates_per_second", "Candidates/sec"),
+    ]:
+        base = baseline[key] if baseline else None
+        print(f"{label:<36}{result[key]:>31.3f}{_change(result[key], base):>10}")
+    print(
+        f"Candidates: {result['candidates']} extracted, {result['unique_candidates']} unique"
+    )
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description="Benchmark the crawler against a local mock of GetProg.ai"
+    )
+    parser.add_argument("--pages", type=int, default=5, help="Result pages to crawl")
+    parser.add_argument("--size", type=int, default=20, help="Results per page")
+    parser.add_argument(
+        "--latency", type=float, default=0.0, help="Seconds added to every response"
+    )
+    parser.add_argument(
+        "--lazy-batch",
+        type=int,
+        default=0,
+        help="Cards rendered per scroll, 0 renders the whole page at once",
+    )
+    parser.add_argument(
+        "--mode",
+        choices=["script", "html", "webdriver", "api"],
+        help="Extraction mode, defaults to scraping_v1.EXTRACTION_MODE",
+    )
+    parser.add_argument(
+        "--autotune",
+        action="store_true",
+        help="Pick the page size with scraping_v1.autotune_page_size before crawling",
+    )
+    parser.add_argument(
+        "--heavy-assets",
+        action="store_true",
+        help="Serve fonts, images, video and a tag manager with every results page",
+    )
+    parser.add_argument(
+        "--measure-load",
+        action="store_true",
+        help="Only measure page load time and memory with resource blocking off and on",
+    )
+    parser.add_argument("--output", help="Write the result as JSON to this file")
+    parser.add_argument(
+        "--baseline", help="Compare against a result file from --output"
+    )
+    args = parser.parse_args()
+
+    # Enough candidates for every page at the largest size the autotuner may pick
+    max_size = max(
+        [args.size] + (scraping_v1.PAGE_SIZE_CANDIDATES if args.autotune else [])
+    )
+    server, base_url = start_mock_server(
+        total=args.pages * max_size,
+        size=args.size,
+        latency=args.latency,
+        lazy_batch=args.lazy_batch,
+        heavy_assets=args.heavy_assets,
+    )
+    try:
+        configure_crawler(base_url, args.size, args.mode)
+        if args.measure_load:
+            result = measure_page_loads(args.pages)
+        else:
+            result = run_benchmark(args.pages, args.autotune)
+    finally:
+        server.shutdown()
+
+    if args.measure_load:
+        print_load_report(result)
+        if args.output:
+            with open(args.output, "w", encoding="utf-8") as f:
+                json.dump(result, f, indent=2)
+            print(f"Result saved to {args.output}")
+        return
+
+    baseline = None
+    if args.baseline:
+        with open(args.baseline, "r", encoding="utf-8") as f:
+            baseline = json.load(f)
+    print_report(result, baseline)
+
+    if args.output:
+        with open(args.output, "w", encoding="utf-8") as f:
+            json.dump(result, f, indent=2)
+        print(f"Result saved to {args.output}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,437 @@
+import json
+import time
+import random
+import argparse
+import threading
+from http.server import ThreadingHTTPServer, BaseHTTPRequestHandler
+from urllib.parse import urlparse, parse_qs, urlencode
+
+# Local stand-in for app.getprog.ai: two-step login, client-rendered paginated search
+# results with lazy loading, and the JSON search API behind them
+
+SESSION_COOKIE = "mock_session"
+SESSION_TOKEN = "mock-session-token"
+
+FIRST_NAMES = [
+    "Alice",
+    "Brian",
+    "Carla",
+    "Daniel",
+    "Elena",
+    "Farid",
+    "Grace",
+    "Hiro",
+    "Irene",
+    "Jonas",
+    "Keiko",
+    "Liam",
+    "Maya",
+    "Nikhil",
+    "Olivia",
+    "Pedro",
+]
+LAST_NAMES = [
+    "Anderson",
+    "Bennett",
+    "Chen",
+    "Dubois",
+    "Evans",
+    "Fischer",
+    "Garcia",
+    "Hoffman",
+    "Ivanova",
+    "Johnson",
+    "Kim",
+    "Lopez",
+    "Morgan",
+    "Nguyen",
+    "Okafor",
+    "Patel",
+]
+POSITIONS = [
+    "Software Engineer",
+    "Senior Data Engineer",
+    "Machine Learning Engineer",
+    "Research Scientist",
+    "Backend Developer",
+    "Data Infrastructure Engineer",
+]
+COMPANIES = ["Acme", "Globex", "Initech", "Umbrella", "Hooli", "Stark Industries"]
+CITIES = [
+    "San Francisco, California",
+    "San Jose, California",
+    "Berkeley, California",
+    "Oakland, California",
+    "Palo Alto, California",
+    "Mountain View, California",
+]
+SCHOOLS = [
+    "Stanford University",
+    "University of California, Berkeley",
+    "Carnegie Mellon University",
+    "Massachusetts Institute of Technology",
+]
+SKILLS = ["Python", "Rust", "Spark", "AWS", "Docker", "Kubernetes", "SQL", "Go"]
+
+LOGIN_EMAIL_PAGE = """<!DOCTYPE html>
+<html><head><title>Login</title></head><body>
+<form method="post" action="/login/email">
+  <input type="email" name="email" placeholder="Email">
+  <button type="submit">Continue</button>
+</form>
+</body></html>"""
+
+LOGIN_PASSWORD_PAGE = """<!DOCTYPE html>
+<html><head><title>Login</title></head><body>
+<form method="post" action="/login/password">
+  <input type="hidden" name="email" value="{email}">
+  <input type="password" name="password" placeholder="Password">
+  <button type="submit">Sign in</button>
+</form>
+</body></html>"""
+
+# The results page is rendered by the browser from /api/search, like the real app.
+# Only the first lazy_batch cards are rendered, the rest appear as the user scrolls.
+RESULTS_PAGE = """<!DOCTYPE html>
+<html><head><title>Search results</title>
+<style>.candidate-card {{ min-height: 220px; margin: 12px; }}</style>
+{assets}
+</head><body>
+<div class="search-results-container">
+  <div class="results-list" id="results"></div>
+  <nav class="pagination" id="pagination"></nav>
+</div>
+<script>
+const page = {page};
+const size = {size};
+const lazyBatch = {lazy_batch};
+const lazyDelay = {lazy_delay_ms};
+const fieldPrefix = "{field_prefix}";
+let profiles = [];
+let rendered = 0;
+let loading = false;
+
+function escapeHtml(value) {{
+    const div = document.createElement("div");
+    div.textContent = value;
+    return div.innerHTML;
+}}
+
+function renderCard(profile) {{
+    return `<div class="candidate-card">
+        <div class="${{fieldPrefix}}name">${{escapeHtml(profile.name)}}</div>
+        <div class="${{fieldPrefix}}title">${{escapeHtml(profile.title)}}</div>
+        <div class="${{fieldPrefix}}location">${{escapeHtml(profile.location)}}</div>
+        <div class="${{fieldPrefix}}experience">${{profile.years_of_experience}} years experience</div>
+        <div class="${{fieldPrefix}}education">${{escapeHtml(profile.education)}}</div>
+        <div class="${{fieldPrefix}}skills">${{profile.skills.map((s) => `<span>${{s}}</span>`).join(" ")}}</div>
+        <a href="${{profile.github}}">GitHub</a> <a href="${{profile.linkedin}}">LinkedIn</a>
+    </div>`;
+}}
+
+function renderMore() {{
+    const list = document.getElementById("results");
+    const next = profiles.slice(rendered, rendered + lazyBatch);
+    list.insertAdjacentHTML("beforeend", next.map(renderCard).join(""));
+    rendered += next.length;
+}}
+
+function renderPagination(total) {{
+    const pages = Math.ceil(total / size);
+    const nav = document.getElementById("pagination");
+    const link = (p) => {{
+        const params = new URLSearchParams(window.location.search);
+        params.set("page", p);
+        params.set("size", size);
+        return `${{window.location.pathname}}?${{params.toString()}}`;
+    }};
+    let html = "";
+    if (page > 1) {{
+        html += `<button onclick="window.location.href='${{link(page - 1)}}'">Prev</button>`;
+    }}
+    for (let p = Math.max(1, page - 2); p <= Math.min(pages, page + 2); p++) {{
+        html += `<button onclick="window.location.href='${{link(p)}}'">${{p}}</button>`;
+    }}
+    html += `<button aria-label="Next page" ${{page >= pages ? "disabled" : ""}}
+        onclick="window.location.href='${{link(page + 1)}}'">Next</button>`;
+    nav.innerHTML = html;
+}}
+
+window.addEventListener("scroll", () => {{
+    if (loading || rendered >= profiles.length) {{
+        return;
+    }}
+    if (window.innerHeight + window.scrollY >= document.body.scrollHeight - 300) {{
+        loading = true;
+        setTimeout(() => {{
+            renderMore();
+            loading = false;
+        }}, lazyDelay);
+    }}
+}});
+
+fetch(`/api/search?page=${{page}}&size=${{size}}`)
+    .then((response) => response.json())
+    .then((data) => {{
+        profiles = data.results;
+        if (!profiles.length) {{
+            document.getElementById("results").textContent = "No results";
+            return;
+        }}
+        renderMore();
+        renderPagination(data.total);
+    }});
+</script>
+</body></html>"""
+
+
+# Third-party weight of a typical SPA: web font, hero image, autoplay video and a tag manager
+HEAVY_ASSETS = """<style>@font-face { font-family: Mock; src: url(/static/mock.woff2); }
+body { font-family: Mock, sans-serif; }</style>
+<link rel="stylesheet" href="/static/site.css">
+<script async src="/gtag/js?id=MOCK"></script>"""
+HEAVY_BODY_ASSETS = """<img src="/static/hero.png" alt="">
+<video src="/static/intro.mp4" autoplay muted></video>"""
+
+STATIC_TYPES = {
+    ".woff2": "font/woff2",
+    ".css": "text/css",
+    ".png": "image/png",
+    ".mp4": "video/mp4",
+    ".js": "application/javascript",
+}
+STATIC_SIZE = 256 * 1024
+
+
+def generate_profiles(total, seed=0):
+    """Generate deterministic fake candidate profiles"""
+    rng = random.Random(seed)
+    profiles = []
+    for i in range(total):
+        first = rng.choice(FIRST_NAMES)
+        last = rng.choice(LAST_NAMES)
+        handle = f"{first.lower()}{last.lower()}{i}"
+        profiles.append(
+            {
+                "id": i + 1,
+                "name": f"{first} {last}",
+                "title": f"{rng.choice(POSITIONS)} @ {rng.choice(COMPANIES)}",
+                "location": rng.choice(CITIES),
+                "years_of_experience": rng.randint(1, 12),
+                "education": rng.choice(SCHOOLS),
+                "skills": sorted(rng.sample(SKILLS, 3)),
+                "github": f"https://github.com/{handle}",
+                "linkedin": f"https://www.linkedin.com/in/{handle}",
+            }
+        )
+    return profiles
+
+
+def make_handler(options):
+    """Build a request handler class bound to the server options"""
+    profiles = generate_profiles(options["total"], options["seed"])
+
+    class MockGetProgHandler(BaseHTTPRequestHandler):
+        def log_message(self, format, *args):
+            if options["verbose"]:
+                super().log_message(format, *args)
+
+        def send_body(self, body, content_type="text/html", status=200, headers=None):
+            data = body if isinstance(body, bytes) else body.encode("utf-8")
+            self.send_response(status)
+            self.send_header("Content-Type", f"{content_type}; charset=utf-8")
+            self.send_header("Content-Length", str(len(data)))
+            for name, value in (headers or {}).items():
+                self.send_header(name, value)
+            self.end_headers()
+            self.wfile.write(data)
+
+        def redirect(self, location, headers=None):
+            self.send_response(303)
+            self.send_header("Location", location)
+            self.send_header("Content-Length", "0")
+            for name, value in (headers or {}).items():
+                self.send_header(name, value)
+            self.end_headers()
+
+        def is_logged_in(self):
+            return f"{SESSION_COOKIE}={SESSION_TOKEN}" in self.headers.get("Cookie", "")
+
+        def read_form(self):
+            length = int(self.headers.get("Content-Length", 0))
+            form = parse_qs(self.rfile.read(length).decode("utf-8"))
+            return {key: values[0] for key, values in form.items()}
+
+        def do_GET(self):
+            url = urlparse(self.path)
+            query = {key: values[0] for key, values in parse_qs(url.query).items()}
+            time.sleep(options["latency"])
+
+            if url.path == "/login":
+                self.send_body(LOGIN_EMAIL_PAGE)
+            elif url.path == "/login/password":
+                self.send_body(LOGIN_PASSWORD_PAGE.format(email=query.get("email", "")))
+            elif url.path == "/search/results":
+                if not self.is_logged_in():
+                    self.redirect("/login")
+                    return
+                page = RESULTS_PAGE.format(
+                    page=int(query.get("page", 1)),
+                    size=int(query.get("size", options["size"])),
+                    lazy_batch=options["lazy_batch"] or options["size"],
+                    lazy_delay_ms=int(options["lazy_delay"] * 1000),
+                    assets=HEAVY_ASSETS if options["heavy_assets"] else "",
+                    field_prefix="candidate-" if options["nested_classes"] else "c-",
+                )
+                if options["heavy_assets"]:
+                    page = page.replace("<body>", "<body>" + HEAVY_BODY_ASSETS, 1)
+                self.send_body(page)
+            elif url.path.startswith("/static/") or url.path == "/gtag/js":
+                extension = (
+                    url.path[url.path.rfind(".") :] if "." in url.path else ".js"
+                )
+                content_type = STATIC_TYPES.get(extension, "application/octet-stream")
+                if content_type.startswith("text/") or extension == ".js":
+                    self.send_body(
+                        "/* mock asset */\n" + " " * STATIC_SIZE, content_type
+                    )
+                else:
+                    self.send_body(bytes(STATIC_SIZE), content_type)
+            elif url.path == "/api/search":
+                if not self.is_logged_in():
+                    self.send_body('{"error": "unauthorized"}', "application/json", 401)
+                    return
+                page = int(query.get("page", 1))
+                size = int(query.get("size", options["size"]))
+                start = (page - 1) * size
+                self.send_body(
+                    json.dumps(
+                        {
+                            "page": page,
+                            "size": size,
+                            "total": len(profiles),
+                            "results": profiles[start : start + size],
+                        }
+                    ),
+                    "application/json",
+                )
+            else:
+                self.send_body("Not found", "text/plain", 404)
+
+        def do_POST(self):
+            url = urlparse(self.path)
+            form = self.read_form()
+            time.sleep(options["latency"])
+
+            if url.path == "/login/email":
+                self.redirect(
+                    "/login/password?" + urlencode({"email": form.get("email", "")})
+                )
+            elif url.path == "/login/password":
+                if not form.get("password"):
+                    self.redirect("/login")
+                    return
+                self.redirect(
+                    "/search/results",
+                    {"Set-Cookie": f"{SESSION_COOKIE}={SESSION_TOKEN}; Path=/"},
+                )
+            else:
+                self.send_body("Not found", "text/plain", 404)
+
+    return MockGetProgHandler
+
+
+def start_mock_server(
+    port=0,
+    total=100,
+    size=20,
+    latency=0.0,
+    lazy_batch=0,
+    lazy_delay=0.2,
+    seed=0,
+    verbose=False,
+    heavy_assets=False,
+    nested_classes=False,
+):
+    """Start the mock site in a background thread, return (server, base_url)
+
+    lazy_batch=0 renders every card of a page at once, otherwise cards are rendered in
+    batches of lazy_batch as the page is scrolled. heavy_assets adds a web font, stylesheet,
+    image, video and tag manager script to every results page. nested_classes names the
+    fields inside each card candidate-name, candidate-title, ..., so they also match
+    the crawler's broad result selectors.
+    """
+    options = {
+        "total": total,
+        "size": size,
+        "latency": latency,
+        "lazy_batch": lazy_batch,
+        "lazy_delay": lazy_delay,
+        "seed": seed,
+        "verbose": verbose,
+        "heavy_assets": heavy_assets,
+        "nested_classes": nested_classes,
+    }
+    server = ThreadingHTTPServer(("127.0.0.1", port), make_handler(options))
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    return server, f"http://127.0.0.1:{server.server_address[1]}"
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Serve a local mock of GetProg.ai")
+    parser.add_argument("--port", type=int, default=8765)
+    parser.add_argument("--total", type=int, default=100, help="Number of candidates")
+    parser.add_argument("--size", type=int, default=20, help="Default page size")
+    parser.add_argument(
+        "--latency", type=float, default=0.0, help="Seconds added to every response"
+    )
+    parser.add_argument(
+        "--lazy-batch",
+        type=int,
+        default=0,
+        help="Cards rendered per scroll, 0 renders the whole page at once",
+    )
+    parser.add_argument(
+        "--lazy-delay",
+        type=float,
+        default=0.2,
+        help="Seconds before the next lazy batch appears",
+    )
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument(
+        "--heavy-assets",
+        action="store_true",
+        help="Add fonts, images, video and a tag manager to the results pages",
+    )
+    parser.add_argument(
+        "--nested-classes",
+        action="store_true",
+        help="Give the fields inside each card candidate-* classes",
+    )
+    args = parser.parse_args()
+
+    server, base_url = start_mock_server(
+        args.port,
+        args.total,
+        args.size,
+        args.latency,
+        args.lazy_batch,
+        args.lazy_delay,
+        args.seed,
+        verbose=True,
+        heavy_assets=args.heavy_assets,
+        nested_classes=args.nested_classes,
+    )
+    print(f"Mock GetProg.ai running at {base_url}")
+    print(f"Login page: {base_url}/login")
+    print(f"Search results: {base_url}/search/results")
+    try:
+        while True:
+            time.sleep(1)
+    except KeyboardInterrupt:
+        server.shutdown()
+
+
+if __name__ == "__main__":
+    main()
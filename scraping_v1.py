@@ -1,7 +1,22 @@
+import io
 import time
 import json
+import gzip
+import math
 import getpass
 import re
+import bisect
+import os
+import queue
+import argparse
+import threading
+import hashlib
+import functools
+import itertools
+from concurrent.futures import ProcessPoolExecutor
+from contextlib import contextmanager, nullcontext, redirect_stdout
+from html.parser import HTMLParser
+from urllib.parse import urljoin, quote, urlsplit, parse_qs
 from selenium import webdriver
 from selenium.webdriver.chrome.options import Options
 from selenium.webdriver.common.by import By
@@ -12,15 +27,554 @@ from selenium.common.exceptions import (
     NoSuchElementException,
     ElementNotInteractableException,
     ElementClickInterceptedException,
+    JavascriptException,
 )
 
+try:
+    import zstandard
+except ImportError:
+    zstandard = None
+
+try:
+    import pyarrow
+    import pyarrow.feather
+    import pyarrow.parquet
+except ImportError:
+    pyarrow = None
+
 # Base URL part - corrected yo_employment parameter
 LOGIN_URL = "https://app.getprog.ai/login"
 BASE_SEARCH_URL = "https://app.getprog.ai/search/results?countries[]=United%20States&locations[]=San%20Francisco%2C%20California,San%20Jose%2C%20California,Berkeley%2C%20California,Oakland%2C%20California,Palo%20Alto%2C%20California,Mountain%20View%2C%20California&text=Software%20Engineer%20–%20Data%20Infrastructure%20%28Pretraining%20Data%29%0AMust-Have%0APython%0AJAX%0ARust%0ASpark%0APB-scale%20high-throughput%20data%20processing%0ACloud%20cluster%20job%20management%0AAI%20training%20data%20preprocessing%20pipelines%0ANice-to-Have%0ANVIDIA%20tools%20%28Omniverse%20%2F%20IsaacSim%20%2F%20Unity%29%0AMulti-cloud%2C%20multi-modal%20data%20management%20experience%0AExperience%20designing%20distributed%20systems%20from%20scratch%0ARobotics%20Experience&yo_employment[]=0-3,3-5"
 
-# Number of results per page
+# Search specs build search URLs from structured inputs, see build_search_url. List fields
+# are sent as one comma separated parameter, in this order, like the web app does.
+SEARCH_RESULTS_URL = "https://app.getprog.ai/search/results"
+SEARCH_SPEC_FIELDS = [
+    "countries",
+    "locations",
+    "text",
+    "yo_employment",
+    "yo_experience",
+]
+
+# Number of results per page, --page-size or --autotune change it
 RESULTS_PER_PAGE = 20
 MAX_CANDIDATES = 60
+# Page sizes tried by --autotune, the fastest one that still returns complete pages wins
+PAGE_SIZE_CANDIDATES = [20, 50, 100]
+# A page is complete with at least this share of RESULTS_PER_PAGE candidates
+MIN_PAGE_COMPLETENESS = 0.8
+
+# Page readiness: waits return as soon as the result list is stable, these are upper bounds
+PAGE_READY_TIMEOUT = 20
+DOM_QUIET_PERIOD = 1.0  # Seconds without DOM mutations or pending requests
+SCROLL_WAIT_TIMEOUT = 3  # Longest wait for new cards after one scroll to the bottom
+# Lazy loading: stop scrolling after this many rounds without new cards or page growth
+SCROLL_STALL_ROUNDS = 2
+MAX_SCROLL_ROUNDS = 20
+CLICK_NAVIGATION_TIMEOUT = 5
+PAGE_DELAY = 10  # Pause between pages to avoid too rapid requests
+MAX_PAGE_RETRIES = 3  # Maximum number of retries per page
+# How to reach pages after the first: "auto" confirms once per search that page=/size= URLs
+# load the requested page, then navigates by URL with pagination clicks as the fallback;
+# "url" and "click" force one way
+PAGINATION_MODE = "auto"
+RETRY_DELAY = 10  # Seconds to wait between retries
+
+# Output: cleaned pages are appended to the NDJSON stream as they finish, the final
+# compaction step deduplicates the stream into the JSON array
+OUTPUT_FILE = "getprog_candidates.json"
+STREAM_FILE = "getprog_candidates.ndjson"
+# --export: the deduplicated candidates also written as a typed columnar table, needs pyarrow
+EXPORT_FILES = {
+    "parquet": "getprog_candidates.parquet",
+    "arrow": "getprog_candidates.arrow",
+}
+# Journal of finished pages per search URL, used by --resume
+CHECKPOINT_FILE = "getprog_checkpoint.jsonl"
+# --incremental: identity keys and content hashes of every candidate seen so far, and the
+# new and changed candidates of the last run
+KNOWN_CANDIDATES_FILE = "getprog_known_candidates.json"
+CHANGES_FILE = "getprog_candidate_changes.json"
+# Stop an incremental crawl after this many consecutive pages with only known, unchanged
+# candidates
+INCREMENTAL_STOP_PAGES = 2
+# --reextract: saved results pages parsed offline, one process per CPU core by default.
+# The page number is the last number in the file name (page_12.html is page 12).
+SAVED_PAGE_EXTENSIONS = [".html", ".htm", ".gz", ".zst"]
+REEXTRACT_PROCESSES = None
+# --archive: raw results pages, compressed and stored once per content hash under
+# ARCHIVE_DIR/objects, indexed by search and page number in ARCHIVE_DIR/index.jsonl.
+# ARCHIVE_CONTENT "cards" keeps only the card elements of the cached page layout.
+ARCHIVE_DIR = "getprog_archive"
+ARCHIVE_CONTENT = "page"
+# zstd needs the zstandard package, gzip is used without it
+ARCHIVE_COMPRESSION = "zstd"
+ARCHIVE_COMPRESSION_LEVELS = {"zstd": 10, "gzip": 9}
+ARCHIVE_EXTENSIONS = {"zstd": ".zst", "gzip": ".gz"}
+
+# Saved login session (cookies and localStorage) reused across runs and workers
+SESSION_FILE = "getprog_session.json"
+# Print every input field and button seen during login
+VERBOSE_LOGIN = False
+
+# Run Chrome without a window, used for unattended runs and benchmarks
+HEADLESS = False
+
+# Lightweight browser profile for the crawl browsers: requests for the resource types below
+# and for URLs matching BLOCKED_URL_PATTERNS are blocked with the DevTools protocol.
+# Stylesheets stay allowed by default, lazy loading and visibility checks depend on layout.
+BLOCK_RESOURCES = True
+BLOCKED_RESOURCE_TYPES = ["Image", "Media", "Font"]
+# Network.setBlockedURLs only matches URLs, resource types map to file extensions
+RESOURCE_TYPE_URL_PATTERNS = {
+    "Image": ["*.png*", "*.jpg*", "*.jpeg*", "*.gif*", "*.webp*", "*.svg*", "*.ico*"],
+    "Media": ["*.mp4*", "*.webm*", "*.mp3*", "*.m3u8*"],
+    "Font": ["*.woff*", "*.woff2*", "*.ttf*", "*.otf*", "*.eot*"],
+    "Stylesheet": ["*.css*"],
+}
+# Analytics, tag managers and trackers
+BLOCKED_URL_PATTERNS = [
+    "*google-analytics.com*",
+    "*googletagmanager.com*",
+    "*/gtag/js*",
+    "*doubleclick.net*",
+    "*connect.facebook.net*",
+    "*hotjar.com*",
+    "*segment.io*",
+    "*sentry.io*",
+    "*intercom.io*",
+    "*fullstory.com*",
+    "*clarity.ms*",
+]
+# Background features a crawl browser does not need
+LIGHTWEIGHT_CHROME_FLAGS = [
+    "--disable-extensions",
+    "--disable-background-networking",
+    "--disable-component-update",
+    "--disable-default-apps",
+    "--disable-sync",
+    "--disable-features=Translate,MediaRouter,OptimizationHints",
+    "--mute-audio",
+    "--no-first-run",
+]
+
+# Worker pool crawl: each worker runs its own logged-in Chrome with a separate profile
+DEFAULT_WORKERS = 1
+WORKER_PROFILE_ROOT = "chrome_profiles"
+# Browsers are replaced after this many pages or once their memory reaches the limit. The
+# memory is the resident size of chromedriver, Chrome and its renderers, read from /proc
+# on Linux; elsewhere the JS heap of the tab stands in for it, which misses the DOM, layout
+# and image memory of the renderer. The replacement starts in the background at
+# DRIVER_PREWARM_AT of either limit.
+DRIVER_MAX_PAGES = 200
+DRIVER_MAX_MEMORY_MB = 2048
+DRIVER_PREWARM_AT = 0.9
+
+# Pipelined crawl: the browser thread only loads pages and snapshots them, parser threads
+# extract and clean the snapshots while the next page loads
+PARSER_WORKERS = 2
+# Snapshots waiting for a parser, the browser thread blocks when parsing falls this far behind
+SNAPSHOT_QUEUE_SIZE = 4
+
+# How candidate cards are read from a results page:
+# "script" harvests all cards with one execute_script call, "html" parses one page_source
+# snapshot in-process, "webdriver" queries every card element, "api" maps the JSON search
+# responses recorded in the Chrome performance log
+EXTRACTION_MODE = "script"
+
+# API capture mode: which JSON responses to inspect and where profile fields may live
+API_URL_KEYWORDS = ["search", "candidate", "profile", "result"]
+# Request parameters naming the page (1-based), page size and offset of a search API call.
+# A response is only used for the page it was requested for; URLs without them match any.
+API_PAGE_KEYS = ["page", "page_number", "pageNumber"]
+API_SIZE_KEYS = ["size", "page_size", "pageSize", "per_page", "limit"]
+API_OFFSET_KEYS = ["offset", "from", "start", "skip"]
+API_FIELD_KEYS = {
+    "name": ["name", "full_name", "fullName"],
+    "position": [
+        "title",
+        "position",
+        "headline",
+        "job_title",
+        "jobTitle",
+        "current_position",
+        "currentPosition",
+    ],
+    "location": ["location", "location.name", "city", "address"],
+    "experience": [
+        "years_of_experience",
+        "yearsOfExperience",
+        "experience_years",
+        "experienceYears",
+        "experience",
+    ],
+    "github": ["github", "github_url", "githubUrl", "links.github", "social.github"],
+    "linkedin": [
+        "linkedin",
+        "linkedin_url",
+        "linkedinUrl",
+        "links.linkedin",
+        "social.linkedin",
+    ],
+    "education": ["education", "educations", "school"],
+    "skills": ["skills", "technologies", "tags"],
+}
+
+# Keywords used to parse card text
+JOB_KEYWORDS = [
+    "engineer",
+    "developer",
+    "scientist",
+    "manager",
+    "lead",
+    "head",
+    "architect",
+    "specialist",
+    "analyst",
+    "consultant",
+    "intern",
+    "researcher",
+    "software",
+    "data",
+    "system",
+    "director",
+    "@",
+]
+EDU_KEYWORDS = [
+    "University",
+    "College",
+    "Bachelor",
+    "Master",
+    "PhD",
+    "B.S.",
+    "M.S.",
+    "Ph.D.",
+]
+SKILL_KEYWORDS = [
+    "Python",
+    "Java",
+    "JavaScript",
+    "C++",
+    "Rust",
+    "Go",
+    "SQL",
+    "Spark",
+    "Hadoop",
+    "AWS",
+    "Azure",
+    "GCP",
+    "Docker",
+    "Kubernetes",
+    "React",
+    "Angular",
+    "Vue",
+    "Data Science",
+    "Machine Learning",
+    "AI",
+    "Deep Learning",
+    "Cloud",
+    "Big Data",
+]
+
+# Elements that show a results page has loaded, and whose first texts identify the page
+RESULT_ELEMENT_SELECTOR = (
+    "[class*='profile'], [class*='candidate'], [class*='card'], [class*='result-item']"
+)
+# Selectors for the three card detection strategies. Card and row selectors are tried one
+# at a time, in the order learned from earlier pages (see SelectorLearner).
+CARD_SELECTORS = [
+    "div[class*='candidate-card']",
+    "div[class*='profile-card']",
+    "div[class*='item']",
+    "div[class*='row']",
+    "div[class*='ProfileRow']",
+]
+ROW_SELECTORS = [
+    "tr[class*='ProfileRow']",
+    "div[class*='search-result-item']",
+    "div[class*='profile-row']",
+    "div[class*='profile_row']",
+]
+CONTAINER_ITEM_SELECTOR = (
+    "div[class*='item'], div[class*='row'], div[class*='card'], div[class*='profile']"
+)
+RESULT_CONTAINER_TERMS = [
+    "result",
+    "search",
+    "candidate",
+    "profile",
+    "card",
+    "list",
+    "container",
+]
+
+# The winning strategy, selector and container class found by the full page analysis are
+# cached as the page layout and reused on later pages. The full analysis re-runs when the
+# cached layout yields less than this share of RESULTS_PER_PAGE.
+LAYOUT_MATCH_RATIO = 0.8
+# Print every class name seen by the full page analysis
+VERBOSE_LAYOUT = False
+# Matched and valid element counts per card and row selector, kept between runs
+SELECTOR_STATS_FILE = "getprog_selector_stats.json"
+
+
+class CrawlProfiler:
+    """Count and time WebDriver commands, sleeps and phases per page
+
+    Phases nest: time is attributed to the innermost phase only, so the idle time of a
+    wait phase is the time it spent polling rather than talking to the browser.
+    """
+
+    def __init__(self):
+        self.started_at = time.perf_counter()
+        self.stats = {}
+        self.trace = []
+        self._lock = threading.Lock()
+        self._local = threading.local()
+
+    def _context(self):
+        if not hasattr(self._local, "stack"):
+            self._local.stack = []
+            self._local.page = None
+        return self._local
+
+    def _stats(self, page, phase):
+        key = (page, phase)
+        if key not in self.stats:
+            self.stats[key] = {
+                "calls": 0,
+                "wall": 0.0,
+                "sleep": 0.0,
+                "command_time": 0.0,
+                "commands": {},
+            }
+        return self.stats[key]
+
+    def _event(self, kind, name, start, duration):
+        context = self._context()
+        self.trace.append(
+            {
+                "thread": threading.current_thread().name,
+                "page": context.page,
+                "phase": context.stack[-1][0] if context.stack else "other",
+                "type": kind,
+                "name": name,
+                "start": start - self.started_at,
+                "duration": duration,
+            }
+        )
+
+    @contextmanager
+    def phase(self, name, page_number=None):
+        context = self._context()
+        previous_page = context.page
+        if page_number is not None:
+            context.page = page_number + 1
+        entry = [name, time.perf_counter(), 0.0]
+        context.stack.append(entry)
+        try:
+            yield
+        finally:
+            context.stack.pop()
+            wall = time.perf_counter() - entry[1]
+            with self._lock:
+                stats = self._stats(context.page, name)
+                stats["calls"] += 1
+                stats["wall"] += wall - entry[2]
+                self._event("phase", name, entry[1], wall)
+            if context.stack:
+                context.stack[-1][2] += wall
+            context.page = previous_page
+
+    def record_command(self, command, start, duration):
+        context = self._context()
+        phase = context.stack[-1][0] if context.stack else "other"
+        with self._lock:
+            stats = self._stats(context.page, phase)
+            count, total = stats["commands"].get(command, (0, 0.0))
+            stats["commands"][command] = (count + 1, total + duration)
+            stats["command_time"] += duration
+            if not context.stack:
+                stats["wall"] += duration
+            self._event("command", command, start, duration)
+
+    def record_sleep(self, start, duration):
+        context = self._context()
+        phase = context.stack[-1][0] if context.stack else "other"
+        with self._lock:
+            stats = self._stats(context.page, phase)
+            stats["sleep"] += duration
+            if not context.stack:
+                stats["wall"] += duration
+            self._event("sleep", "sleep", start, duration)
+
+    def print_report(self):
+        """Print a per-page breakdown of wall, WebDriver, sleep and remaining time"""
+        print("\n==== WebDriver timing per page and phase ====")
+        print(
+            f"{'Page':>5} {'Phase':<34}{'Calls':>6}{'Cmds':>7}{'Cmd (s)':>9}{'Sleep (s)':>10}{'Other (s)':>10}{'Wall (s)':>10}"
+        )
+        with self._lock:
+            rows = sorted(
+                self.stats.items(), key=lambda item: (item[0][0] or 0, item[0][1])
+            )
+            for (page, phase), stats in rows:
+                commands = sum(count for count, _ in stats["commands"].values())
+                other = stats["wall"] - stats["command_time"] - stats["sleep"]
+                print(
+                    f"{page or '-':>5} {phase:<34}{stats['calls']:>6}{commands:>7}"
+                    f"{stats['command_time']:>9.2f}{stats['sleep']:>10.2f}"
+                    f"{max(0.0, other):>10.2f}{stats['wall']:>10.2f}"
+                )
+
+            totals = {}
+            for stats in self.stats.values():
+                for command, (count, total) in stats["commands"].items():
+                    old_count, old_total = totals.get(command, (0, 0.0))
+                    totals[command] = (old_count + count, old_total + total)
+        print("\n==== WebDriver commands ====")
+        for command, (count, total) in sorted(
+            totals.items(), key=lambda item: item[1][1], reverse=True
+        ):
+            print(f"{command:<40}{count:>8}{total:>10.2f}s")
+
+    def write_trace(self, trace_file):
+        """Write every phase, command and sleep event as JSON lines"""
+        with self._lock, open(trace_file, "w", encoding="utf-8") as f:
+            for event in self.trace:
+                f.write(json.dumps(event) + "\n")
+        print(f"Trace with {len(self.trace)} events saved to {trace_file}")
+
+
+class SelectorLearner:
+    """Learn which card and row selectors find real candidates
+
+    For every selector, matched counts the elements it returned and valid the ones that
+    parsed into a candidate. Selectors run in order of smoothed precision,
+    (valid + 1) / (matched + 2), so an unseen selector starts at 0.5, precise ones move to
+    the front and broad wrapper selectors sink to the end.
+    """
+
+    def __init__(self):
+        self.stats = {}
+        self.lock = threading.Lock()
+
+    def precision(self, selector):
+        stats = self.stats.get(selector, {"matched": 0, "valid": 0})
+        return (stats["valid"] + 1) / (stats["matched"] + 2)
+
+    def ordered(self, selectors):
+        """Selectors sorted by learned precision, ties keep their configured order"""
+        with self.lock:
+            return sorted(selectors, key=lambda selector: -self.precision(selector))
+
+    def record(self, matched, valid):
+        """Add one page of matched and valid element counts per selector"""
+        with self.lock:
+            for selector, count in matched.items():
+                stats = self.stats.setdefault(
+                    selector, {"matched": 0, "valid": 0, "pages": 0}
+                )
+                stats["matched"] += count
+                stats["valid"] += valid.get(selector, 0)
+                stats["pages"] += 1
+
+    def load(self, path):
+        if not os.path.exists(path):
+            return
+        try:
+            with open(path, "r", encoding="utf-8") as f:
+                stats = json.load(f)
+        except (OSError, ValueError) as e:
+            print(f"Ignoring unreadable selector statistics {path}: {str(e)}")
+            return
+        with self.lock:
+            self.stats = stats
+        print(f"Loaded selector statistics for {len(stats)} selectors from {path}")
+
+    def save(self, path):
+        with self.lock:
+            data = json.dumps(self.stats, indent=2)
+        temp_path = f"{path}.tmp"
+        with open(temp_path, "w", encoding="utf-8") as f:
+            f.write(data)
+        os.replace(temp_path, path)
+
+    def print_report(self):
+        print("\n==== Selector statistics ====")
+        print(f"{'Selector':<40}{'Pages':>7}{'Matched':>9}{'Valid':>7}{'False +':>9}")
+        with self.lock:
+            rows = sorted(self.stats.items(), key=lambda item: -self.precision(item[0]))
+        for selector, stats in rows:
+            false_positive_rate = 1 - stats["valid"] / max(1, stats["matched"])
+            print(
+                f"{selector:<40}{stats['pages']:>7}{stats['matched']:>9}"
+                f"{stats['valid']:>7}{false_positive_rate:>9.1%}"
+            )
+
+
+_selector_learner = SelectorLearner()
+
+# Active profiler, None unless --profile is given
+_profiler = None
+_page_archive = None
+
+
+def enable_profiling():
+    """Start collecting WebDriver timings for drivers created from now on"""
+    global _profiler
+    _profiler = CrawlProfiler()
+    return _profiler
+
+
+def profile_phase(name, page_number=None):
+    """Context manager timing a crawl phase, no-op unless profiling is enabled"""
+    if _profiler is None:
+        return nullcontext()
+    return _profiler.phase(name, page_number)
+
+
+def profiled(name):
+    """Decorator timing every call of a function as a crawl phase"""
+
+    def decorator(func):
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs):
+            with profile_phase(name):
+                return func(*args, **kwargs)
+
+        return wrapper
+
+    return decorator
+
+
+def instrument_driver(driver):
+    """Time every WebDriver command, element commands also go through driver.execute"""
+    if _profiler is None:
+        return driver
+    execute = driver.execute
+
+    def timed_execute(driver_command, params=None):
+        start = time.perf_counter()
+        try:
+            return execute(driver_command, params)
+        finally:
+            if _profiler is not None:
+                _profiler.record_command(
+                    driver_command, start, time.perf_counter() - start
+                )
+
+    driver.execute = timed_execute
+    return driver
+
+
+def pause(seconds):
+    """time.sleep that is reported separately from active time when profiling"""
+    start = time.perf_counter()
+    time.sleep(seconds)
+    if _profiler is not None:
+        _profiler.record_sleep(start, time.perf_counter() - start)
 
 
 def setup_driver():
@@ -36,12 +590,20 @@ def setup_driver():
     )
 
     driver = webdriver.Chrome(options=chrome_options)
-    return driver
+    return instrument_driver(driver)
 
 
-def setup_driver_no_image():
+def setup_driver_no_image(profile_dir=None):
     """Set up and return a Chrome webdriver with appropriate options, disabling images loading."""
     chrome_options = Options()
+    if HEADLESS:
+        chrome_options.add_argument("--headless=new")
+    # Record network events so API responses can be read back in "api" mode
+    if EXTRACTION_MODE == "api":
+        chrome_options.set_capability("goog:loggingPrefs", {"performance": "ALL"})
+    # Separate profile directory, needed when several browsers run at once
+    if profile_dir:
+        chrome_options.add_argument(f"--user-data-dir={os.path.abspath(profile_dir)}")
     # Disable image loading
     chrome_options.add_argument("--blink-settings=imagesEnabled=false")
     chrome_options.add_experimental_option(
@@ -55,9 +617,28 @@ def setup_driver_no_image():
     chrome_options.add_argument(
         "--user-agent=Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36"
     )
+    if BLOCK_RESOURCES:
+        for flag in LIGHTWEIGHT_CHROME_FLAGS:
+            chrome_options.add_argument(flag)
 
     driver = webdriver.Chrome(options=chrome_options)
-    return driver
+    if BLOCK_RESOURCES:
+        block_resources(driver)
+    return instrument_driver(driver)
+
+
+def blocked_url_patterns():
+    """URL patterns blocked by the lightweight profile"""
+    patterns = list(BLOCKED_URL_PATTERNS)
+    for resource_type in BLOCKED_RESOURCE_TYPES:
+        patterns.extend(RESOURCE_TYPE_URL_PATTERNS.get(resource_type, []))
+    return patterns
+
+
+def block_resources(driver):
+    """Block the configured resource types and URL patterns for every page of the browser"""
+    driver.execute_cdp_cmd("Network.enable", {})
+    driver.execute_cdp_cmd("Network.setBlockedURLs", {"urls": blocked_url_patterns()})
 
 
 def save_page_source(driver, filename):
@@ -67,6 +648,31 @@ def save_page_source(driver, filename):
     print(f"Page source code saved to {filename}")
 
 
+def print_input_elements(inputs):
+    """Print input fields to check login page structure"""
+    for i, inp in enumerate(inputs):
+        input_type = inp.get_attribute("type")
+        input_name = inp.get_attribute("name")
+        input_id = inp.get_attribute("id")
+        input_placeholder = inp.get_attribute("placeholder")
+        print(
+            f"Input field {i+1}: type={input_type}, name={input_name}, id={input_id}, placeholder={input_placeholder}"
+        )
+
+
+@profiled("wait")
+def wait_for_element(driver, selector, timeout):
+    """Wait up to timeout seconds for an element matching selector, return whether it appeared"""
+    try:
+        WebDriverWait(driver, timeout).until(
+            EC.presence_of_element_located((By.CSS_SELECTOR, selector))
+        )
+        return True
+    except TimeoutException:
+        return False
+
+
+@profiled("login")
 def login(driver, email, password):
     """Handle step-by-step login process"""
     try:
@@ -74,19 +680,12 @@ def login(driver, email, password):
         driver.get(LOGIN_URL)
 
         # Wait for page to load
-        time.sleep(5)
+        wait_for_element(driver, "input", 5)
 
-        # Print all input fields to check login page structure
-        print("Input elements on the page:")
         inputs = driver.find_elements(By.TAG_NAME, "input")
-        for i, inp in enumerate(inputs):
-            input_type = inp.get_attribute("type")
-            input_name = inp.get_attribute("name")
-            input_id = inp.get_attribute("id")
-            input_placeholder = inp.get_attribute("placeholder")
-            print(
-                f"Input field {i+1}: type={input_type}, name={input_name}, id={input_id}, placeholder={input_placeholder}"
-            )
+        if VERBOSE_LOGIN:
+            print("Input elements on the page:")
+            print_input_elements(inputs)
 
         # Find email input field
         email_input = None
@@ -124,7 +723,8 @@ def login(driver, email, password):
 
             for button in buttons:
                 button_text = button.text.strip().lower()
-                print(f"Button text: '{button_text}'")
+                if VERBOSE_LOGIN:
+                    print(f"Button text: '{button_text}'")
                 # Added common English continue/next button texts, removed Chinese
                 if button_text in ["continue", "next"]:
                     continue_button = button
@@ -166,19 +766,16 @@ def login(driver, email, password):
 
         # Wait for password input field to appear
         print("Waiting for password input field to appear...")
-        time.sleep(5)  # Give page enough time to load second step
+        wait_for_element(
+            driver,
+            "input[type='password'], input[name='password'], input[placeholder='Password']",
+            5,
+        )
 
         # Check input elements again
-        print("Input elements on second step page:")
-        inputs = driver.find_elements(By.TAG_NAME, "input")
-        for i, inp in enumerate(inputs):
-            input_type = inp.get_attribute("type")
-            input_name = inp.get_attribute("name")
-            input_id = inp.get_attribute("id")
-            input_placeholder = inp.get_attribute("placeholder")
-            print(
-                f"Input field {i+1}: type={input_type}, name={input_name}, id={input_id}, placeholder={input_placeholder}"
-            )
+        if VERBOSE_LOGIN:
+            print("Input elements on second step page:")
+            print_input_elements(driver.find_elements(By.TAG_NAME, "input"))
 
         # Find password input field
         password_input = None
@@ -228,7 +825,8 @@ def login(driver, email, password):
 
             for button in buttons:
                 button_text = button.text.strip().lower()
-                print(f"Button text: '{button_text}'")
+                if VERBOSE_LOGIN:
+                    print(f"Button text: '{button_text}'")
                 # Added common English login button texts, removed Chinese
                 if button_text in ["sign in", "log in", "login", "signin"]:
                     login_button = button
@@ -265,7 +863,12 @@ def login(driver, email, password):
 
         # Wait for login to complete
         print("Waiting for login to complete...")
-        time.sleep(10)
+        try:
+            WebDriverWait(driver, 10, poll_frequency=0.25).until(
+                lambda d: "login" not in d.current_url.lower()
+            )
+        except TimeoutException:
+            pass
 
         # Check if login was successful
         if "login" in driver.current_url.lower():
@@ -280,61 +883,437 @@ def login(driver, email, password):
         return False
 
 
-def get_search_url(page_number, size=20):
-    """Construct search URL based on page number"""
-    return f"{BASE_SEARCH_URL}&page={page_number+1}&size={size}"
+# Parallel workers share one credentials dict
+_credentials_lock = threading.Lock()
+
+
+def prompt_credentials(credentials):
+    """Ask for login credentials once, store them in the credentials dict"""
+    with _credentials_lock:
+        if not credentials.get("email"):
+            credentials["email"] = input("Please enter your getprog.ai login email: ")
+            credentials["password"] = getpass.getpass("Please enter your password: ")
+    return credentials
+
+
+def save_session(driver, session_file=SESSION_FILE):
+    """Save cookies and localStorage of the authenticated session to disk"""
+    session = {
+        "origin": driver.execute_script("return window.location.origin"),
+        "cookies": driver.get_cookies(),
+        "local_storage": driver.execute_script(
+            "return Object.fromEntries(Object.entries(window.localStorage));"
+        ),
+        "saved_at": time.time(),
+    }
+    # Write to a temporary file first so other workers never read a partial session
+    temp_file = f"{session_file}.{threading.get_ident()}.tmp"
+    # The cookies grant access to the account, only the owner may read them
+    fd = os.open(temp_file, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o600)
+    os.chmod(temp_file, 0o600)
+    with os.fdopen(fd, "w", encoding="utf-8") as f:
+        json.dump(session, f)
+    os.replace(temp_file, session_file)
+    print(f"Session saved to {session_file}")
+
+
+@profiled("restore_session")
+def restore_session(driver, session_file=SESSION_FILE):
+    """Restore a saved session and check it is still valid, costs one page load"""
+    if not os.path.exists(session_file):
+        return False
+    try:
+        with open(session_file, "r", encoding="utf-8") as f:
+            session = json.load(f)
+
+        print("Restoring saved session...")
+        # Cookies can be set through DevTools before visiting the site
+        for cookie in session["cookies"]:
+            params = {key: value for key, value in cookie.items() if key != "expiry"}
+            if "expiry" in cookie:
+                params["expires"] = cookie["expiry"]
+            driver.execute_cdp_cmd("Network.setCookie", params)
+
+        # Seed localStorage before the app scripts run on the first page load
+        script = driver.execute_cdp_cmd(
+            "Page.addScriptToEvaluateOnNewDocument",
+            {"source": f"""
+                if (window.location.origin === {json.dumps(session["origin"])}) {{
+                    const items = {json.dumps(session["local_storage"])};
+                    for (const [key, value] of Object.entries(items)) {{
+                        if (window.localStorage.getItem(key) === null) {{
+                            window.localStorage.setItem(key, value);
+                        }}
+                    }}
+                }}
+                """},
+        )
+        try:
+            # Validate by opening the search page, an expired session redirects to login
+            driver.get(BASE_SEARCH_URL)
+            WebDriverWait(driver, PAGE_READY_TIMEOUT, poll_frequency=0.25).until(
+                lambda d: "login" in d.current_url.lower()
+                or len(d.find_elements(By.CSS_SELECTOR, RESULT_ELEMENT_SELECTOR)) > 2
+            )
+        except TimeoutException:
+            pass
+        finally:
+            driver.execute_cdp_cmd(
+                "Page.removeScriptToEvaluateOnNewDocument",
+                {"identifier": script["identifier"]},
+            )
+
+        if "login" in driver.current_url.lower():
+            print("Saved session has expired")
+            return False
+        print("Saved session restored")
+        return True
+    except Exception as e:
+        print(f"Error restoring session: {str(e)}")
+        return False
+
+
+def session_saved_at(session_file=SESSION_FILE):
+    """Return modification time of the saved session, None if there is none"""
+    try:
+        return os.path.getmtime(session_file)
+    except OSError:
+        return None
 
 
-def analyze_page_structure(driver, page_number):
-    """Analyze page structure to find elements potentially containing candidate information"""
-    print(f"==== Analyzing page structure for page {page_number+1} ====")
+# Held by the browser filling the login form, parallel workers wait for its session
+_session_lock = threading.Lock()
+
+
+def ensure_logged_in(driver, credentials, session_file=SESSION_FILE):
+    """Restore the saved session, falling back to the login form and saving the new session"""
+    saved_at = session_saved_at(session_file)
+    if saved_at and restore_session(driver, session_file):
+        return True
+
+    # Only one browser fills the login form at a time, the others reuse its session
+    with _session_lock:
+        # Another browser may have logged in while this one was checking
+        if session_saved_at(session_file) != saved_at and restore_session(
+            driver, session_file
+        ):
+            return True
+
+        prompt_credentials(credentials)
+        if not login(driver, credentials["email"], credentials["password"]):
+            return False
+        save_session(driver, session_file)
+        return True
+
+
+def get_search_url(page_number, size=None, search_url=None):
+    """Construct search URL based on page number, size defaults to RESULTS_PER_PAGE and
+    search_url to BASE_SEARCH_URL"""
+    search_url = search_url or BASE_SEARCH_URL
+    return f"{search_url}&page={page_number+1}&size={size or RESULTS_PER_PAGE}"
+
+
+def checkpoint_query(search_url=None):
+    """Checkpoint key of a search, page numbers depend on the page size"""
+    return f"{search_url or BASE_SEARCH_URL}&size={RESULTS_PER_PAGE}"
+
+
+def build_search_url(spec):
+    """Build a search URL from a spec with countries, locations, text, yo_employment and
+    yo_experience"""
+    params = []
+    for field in SEARCH_SPEC_FIELDS:
+        value = spec.get(field)
+        if not value:
+            continue
+        if field == "text":
+            params.append(f"text={quote(value, safe='')}")
+        else:
+            if isinstance(value, str):
+                value = [value]
+            params.append(f"{field}[]=" + ",".join(quote(v, safe="") for v in value))
+    return f"{SEARCH_RESULTS_URL}?" + "&".join(params)
+
+
+def _spec_label(value):
+    if isinstance(value, list):
+        value = ",".join(value)
+    value = " ".join(str(value).split())
+    return value if len(value) <= 40 else value[:37] + "..."
+
+
+def expand_search_specs(config):
+    """Expand a search spec file into a list of (name, search_url)
+
+    config is a list of specs, or one spec. A spec with a "matrix" of field -> list of
+    values stands for every combination of those values on top of its other fields.
+    Specs are named by their "name" field plus the matrix values they were built from.
+    """
+    if isinstance(config, dict):
+        config = [config]
+    queries = []
+    for index, spec in enumerate(config):
+        base = {field: value for field, value in spec.items() if field != "matrix"}
+        name = base.pop("name", f"query{index+1}")
+        matrix = spec.get("matrix", {})
+        fields = list(matrix)
+        for values in itertools.product(*(matrix[field] for field in fields)):
+            expanded = dict(base, **dict(zip(fields, values)))
+            label = ", ".join(
+                f"{field}={_spec_label(value)}" for field, value in zip(fields, values)
+            )
+            queries.append(
+                (f"{name} [{label}]" if label else name, build_search_url(expanded))
+            )
+    return queries
+
+
+def group_search_queries(queries):
+    """Group (name, search_url) pairs by search URL, return {search_url: [names]}
+
+    Searches that build the same URL are crawled once and their candidates are tagged
+    with every name.
+    """
+    names = {}
+    for name, search_url in queries:
+        if search_url in names:
+            print(
+                f"Warning: {name} builds the same search URL as {names[search_url][0]}, crawling it once"
+            )
+        names.setdefault(search_url, []).append(name)
+    return names
+
+
+# Installs a MutationObserver, scroll listener and request counters once per document, then
+# reports the number of result cards, milliseconds since the last DOM mutation or scroll
+# and requests still in flight
+# Number of result cards: the largest group of matching elements sharing one parent, not
+# nested in another group, so fields inside a card that also match and wrappers around
+# the list are not counted
+COUNT_RESULTS_FUNCTION = """
+const countResults = (selector) => {
+    const siblings = new Map();
+    for (const element of document.querySelectorAll(selector)) {
+        siblings.set(element.parentNode, (siblings.get(element.parentNode) || 0) + 1);
+    }
+    let largest = 0;
+    for (const [parent, count] of siblings) {
+        // Skip the fields of a card: groups inside a match that has matching siblings
+        let nested = false;
+        for (let node = parent; node && node.matches; node = node.parentNode) {
+            if (node.matches(selector) && siblings.get(node.parentNode) >= 2) {
+                nested = true;
+                break;
+            }
+        }
+        if (!nested) {
+            largest = Math.max(largest, count);
+        }
+    }
+    return largest;
+};
+"""
+
+READINESS_PROBE_SCRIPT = COUNT_RESULTS_FUNCTION + """
+const selector = arguments[0];
+if (!window.__getprogReadiness) {
+    const state = {lastActivity: performance.now(), inflight: 0};
+    const markActivity = () => {
+        state.lastActivity = performance.now();
+    };
+    new MutationObserver(markActivity).observe(document, {
+        childList: true,
+        subtree: true,
+        characterData: true,
+    });
+    window.addEventListener("scroll", markActivity, {passive: true});
+
+    const originalFetch = window.fetch;
+    if (originalFetch) {
+        window.fetch = function () {
+            state.inflight += 1;
+            return originalFetch.apply(this, arguments).finally(() => {
+                state.inflight -= 1;
+            });
+        };
+    }
+    const originalSend = XMLHttpRequest.prototype.send;
+    XMLHttpRequest.prototype.send = function () {
+        state.inflight += 1;
+        this.addEventListener("loadend", () => {
+            state.inflight -= 1;
+        });
+        return originalSend.apply(this, arguments);
+    };
+    window.__getprogReadiness = state;
+}
+const state = window.__getprogReadiness;
+return {
+    count: countResults(selector),
+    quietFor: performance.now() - state.lastActivity,
+    inflight: state.inflight,
+    readyState: document.readyState,
+};
+"""
+
+
+def result_count_selector():
+    """Selector of the result cards, the cached card or row layout's when there is one"""
+    layout = _page_layout
+    if layout and layout["strategy"] in ["cards", "rows"]:
+        return ", ".join(layout["selectors"])
+    return RESULT_ELEMENT_SELECTOR
+
+
+def probe_page_readiness(driver):
+    """Return result card count, DOM quiet time (ms) and pending requests of the page"""
+    return driver.execute_script(READINESS_PROBE_SCRIPT, result_count_selector())
+
+
+@profiled("wait")
+def wait_for_results_ready(
+    driver,
+    expected_count=None,
+    timeout=PAGE_READY_TIMEOUT,
+    min_count=3,
+    quiet_period=DOM_QUIET_PERIOD,
+):
+    """Wait until the result list is stable, return False if timeout is reached first
+
+    The page counts as ready once expected_count result elements are present and the DOM
+    has settled briefly, or once at least min_count are present and the DOM has been quiet
+    with no pending requests for quiet_period seconds.
+    """
+
+    def is_ready(d):
+        state = probe_page_readiness(d)
+        if state["readyState"] != "complete" or state["inflight"] > 0:
+            return False
+        if expected_count and state["count"] >= expected_count:
+            return state["quietFor"] >= 250
+        return state["count"] >= min_count and state["quietFor"] >= quiet_period * 1000
+
+    start = time.time()
+    try:
+        # The probe can fail while a navigation replaces the document, keep polling
+        WebDriverWait(
+            driver,
+            timeout,
+            poll_frequency=0.25,
+            ignored_exceptions=(JavascriptException,),
+        ).until(is_ready)
+        print(f"Page ready after {time.time() - start:.1f} seconds")
+        return True
+    except TimeoutException:
+        print(f"Page not stable after {timeout} seconds")
+        return False
 
-    # Find all div elements on the page
-    all_divs = driver.find_elements(By.TAG_NAME, "div")
-    print(f"Found {len(all_divs)} div elements on the page")
 
-    # Print all class names on the page
-    classes = set()
-    for div in all_divs:
-        class_name = div.get_attribute("class")
-        if class_name:
-            classes.add(class_name)
+@profiled("wait")
+def wait_for_url_change(driver, old_url, timeout=CLICK_NAVIGATION_TIMEOUT):
+    """Wait until the current URL differs from old_url"""
+    try:
+        WebDriverWait(driver, timeout, poll_frequency=0.25).until(
+            EC.url_changes(old_url)
+        )
+        return True
+    except TimeoutException:
+        return False
+
+
+# Scrolls to the bottom and resolves as soon as the number of result elements or the page
+# height changes, or after the timeout
+SCROLL_ROUND_SCRIPT = COUNT_RESULTS_FUNCTION + """
+const [selector, timeoutMs, done] = arguments;
+const measure = () => ({
+    count: countResults(selector),
+    height: document.documentElement.scrollHeight,
+});
+const before = measure();
+window.scrollTo(0, before.height);
+const started = performance.now();
+const check = () => {
+    const now = measure();
+    const grew = now.count !== before.count || now.height !== before.height;
+    if (grew || performance.now() - started >= timeoutMs) {
+        done({grew, count: now.count, height: now.height});
+    } else {
+        setTimeout(check, 50);
+    }
+};
+check();
+"""
+
+
+@profiled("scroll")
+def scroll_to_load_all(driver, page_number, expected_count=None):
+    """Scroll to the bottom until expected_count result elements are present or the page
+    stops growing, return the number of scroll rounds"""
+    count = probe_page_readiness(driver)["count"]
+    rounds = 0
+    stalled = 0
+    while rounds < MAX_SCROLL_ROUNDS:
+        if expected_count and count >= expected_count:
+            break
+        state = driver.execute_async_script(
+            SCROLL_ROUND_SCRIPT, result_count_selector(), SCROLL_WAIT_TIMEOUT * 1000
+        )
+        rounds += 1
+        count = state["count"]
+        stalled = 0 if state["grew"] else stalled + 1
+        if stalled >= SCROLL_STALL_ROUNDS:
+            break
 
-    print(f"Class names on page {page_number+1}:")
-    for cls in classes:
-        print(f"- {cls}")
+    # Scroll back to top
+    driver.execute_script("window.scrollTo(0, 0);")
+    print(f"Page {page_number+1}: {rounds} scroll rounds, {count} result cards loaded")
+    return rounds
 
-    # Find possible table or list elements
-    tables = driver.find_elements(By.TAG_NAME, "table")
-    print(f"Found {len(tables)} table elements")
 
-    lists = driver.find_elements(By.TAG_NAME, "ul")
-    print(f"Found {len(lists)} list elements")
+@profiled("analyze_page_structure")
+def analyze_page_structure(driver, page_number):
+    """Analyze page structure to find elements potentially containing candidate information"""
+    print(f"==== Analyzing page structure for page {page_number+1} ====")
 
-    # Find elements potentially containing search results
+    if VERBOSE_LAYOUT:
+        # Print all class names on the page
+        all_divs = driver.find_elements(By.TAG_NAME, "div")
+        print(f"Found {len(all_divs)} div elements on the page")
+        classes = set()
+        for div in all_divs:
+            class_name = div.get_attribute("class")
+            if class_name:
+                classes.add(class_name)
+
+        print(f"Class names on page {page_number+1}:")
+        for cls in classes:
+            print(f"- {cls}")
+
+        # Find possible table or list elements
+        tables = driver.find_elements(By.TAG_NAME, "table")
+        print(f"Found {len(tables)} table elements")
+
+        lists = driver.find_elements(By.TAG_NAME, "ul")
+        print(f"Found {len(lists)} list elements")
+
+    # Find elements potentially containing search results, only divs whose class matches
+    container_selector = ", ".join(
+        f"div[class*='{term}' i]" for term in RESULT_CONTAINER_TERMS
+    )
     result_candidates = []
-    possible_result_classes = [
-        "result",
-        "search",
-        "candidate",
-        "profile",
-        "card",
-        "list",
-        "container",
-    ]
-    for div in all_divs:
-        class_name = div.get_attribute("class") or ""
-        if any(term in class_name.lower() for term in possible_result_classes):
-            try:
-                text = div.text
-                if (
-                    text and len(text) > 50
-                ):  # Only consider elements with significant text
-                    result_candidates.append(
-                        {"element": div, "class": class_name, "text_length": len(text)}
-                    )
-            except:
-                pass
+    for div in driver.find_elements(By.CSS_SELECTOR, container_selector):
+        try:
+            text = div.text
+            if text and len(text) > 50:  # Only consider elements with significant text
+                result_candidates.append(
+                    {
+                        "element": div,
+                        "class": div.get_attribute("class") or "",
+                        "text_length": len(text),
+                    }
+                )
+        except:
+            pass
 
     print(
         f"Found {len(result_candidates)} elements potentially containing search results"
@@ -347,142 +1326,370 @@ def analyze_page_structure(driver, page_number):
     return result_candidates
 
 
-def extract_info_from_element(element, page_number):
-    """Extract candidate information from element, keep only clean data without HTML"""
-    try:
-        # Get raw text content
-        element_text = element.text.strip()
-        if not element_text:
-            return None  # Return None if no text content
+def find_layout_containers(driver, container_class):
+    """Find the result containers of a cached page layout without the full analysis"""
+    containers = []
+    for div in driver.find_elements(
+        By.CSS_SELECTOR, f"div[class={json.dumps(container_class)}]"
+    ):
+        text = div.text
+        if text and len(text) > 50:
+            containers.append(
+                {"element": div, "class": container_class, "text_length": len(text)}
+            )
+    return containers
+
+
+def layout_harvest_plan(layout):
+    """Card selectors, row selectors and container analysis to harvest a page with
+
+    Without a layout every strategy runs with all selectors and the full structural
+    analysis. With one, only the strategy and the selectors that won last time run, and a
+    strategy stops trying selectors once it has a page worth of elements.
+    """
+    plan = {
+        "cards": [],
+        "rows": [],
+        "container_terms": [],
+        "container_class": None,
+        "limit": RESULTS_PER_PAGE,
+    }
+    if layout is None:
+        plan["cards"] = _selector_learner.ordered(CARD_SELECTORS)
+        plan["rows"] = _selector_learner.ordered(ROW_SELECTORS)
+        plan["container_terms"] = RESULT_CONTAINER_TERMS
+        plan["limit"] = None
+    elif layout["strategy"] == "cards":
+        plan["cards"] = _selector_learner.ordered(layout["selectors"])
+    elif layout["strategy"] == "rows":
+        plan["rows"] = _selector_learner.ordered(layout["selectors"])
+    else:
+        plan["container_class"] = layout["container_class"]
+    return plan
 
-        # Filter out pure UI elements like buttons, labels, percentage matches, etc.
-        if len(element_text) < 20:  # Too short text could be a UI element
-            return None
 
-        # Filter out text that looks like UI elements
-        ui_patterns = [
+def pick_page_layout(card_valid, row_valid, container_counts):
+    """Layout of the strategy that produced the most candidates, None if none did
+
+    card_valid and row_valid map selectors to the candidates they produced.
+    """
+    options = []
+    for strategy, valid in [("cards", card_valid), ("rows", row_valid)]:
+        selectors = [selector for selector, count in valid.items() if count]
+        options.append(
+            (sum(valid.values()), {"strategy": strategy, "selectors": selectors})
+        )
+    for container_class, count in container_counts.items():
+        options.append(
+            (count, {"strategy": "containers", "container_class": container_class})
+        )
+    count, layout = max(options, key=lambda option: option[0])
+    return layout if count else None
+
+
+def mark_nested_records(records, contains):
+    """Flag records that are not a single card of their own as nested
+
+    Among records with enough text, one that contains two or more others is a wrapper
+    around several cards, one that contains a single card with the same text is a wrapper
+    around that card, and one inside a card with more text is part of that card. They are
+    skipped by the extraction and count as false positives of their selector.
+    contains(outer, inner) tells whether one record's element contains another's.
+    """
+    plausible = [record for record in records if len(record["text"].strip()) > 50]
+    wrappers = set()
+    for outer in plausible:
+        inner_count = sum(
+            1 for inner in plausible if inner is not outer and contains(outer, inner)
+        )
+        if inner_count >= 2:
+            wrappers.add(outer["key"])
+    cards = [record for record in plausible if record["key"] not in wrappers]
+    for record in plausible:
+        text = record["text"].strip()
+        if (
+            record["key"] in wrappers
+            or any(
+                other is not record
+                and contains(record, other)
+                and other["text"].strip() == text
+                for other in cards
+            )
+            or any(
+                other is not record
+                and contains(other, record)
+                and len(other["text"].strip()) > len(text)
+                for other in cards
+            )
+        ):
+            record["nested"] = True
+    return records
+
+
+def record_selector_stats(records, valid_keys):
+    """Count matched and valid records per selector, return the valid counts"""
+    matched = {}
+    valid = {}
+    for record in records:
+        matched[record["selector"]] = matched.get(record["selector"], 0) + 1
+        if record["key"] in valid_keys:
+            valid[record["selector"]] = valid.get(record["selector"], 0) + 1
+    _selector_learner.record(matched, valid)
+    return valid
+
+
+def layout_matches(candidates):
+    """Whether a page read with the cached layout yielded enough candidates"""
+    return len(candidates) >= LAYOUT_MATCH_RATIO * RESULTS_PER_PAGE
+
+
+# Layout that won the last full page analysis, reused by the following pages
+_page_layout = None
+
+
+def extract_with_page_layout(extract, page_number):
+    """Call extract(layout) with the cached page layout, re-analyzing the page when the
+    layout no longer matches
+
+    extract returns (candidates, layout), where layout is the one that won on this page.
+    """
+    layout = _page_layout
+    if layout is not None:
+        candidates, _ = extract(layout)
+        if layout_matches(candidates):
+            return candidates
+        print(
+            f"Cached page layout matched {len(candidates)} candidates on page {page_number+1}, re-analyzing page structure"
+        )
+    candidates, layout = extract(None)
+    remember_page_layout(layout)
+    return candidates
+
+
+# Parser threads of the pipelined crawl update the cached layout concurrently
+_page_layout_lock = threading.Lock()
+
+
+def remember_page_layout(layout):
+    """Cache the layout that won on a page for the following pages"""
+    global _page_layout
+    if layout is None:
+        return
+    with _page_layout_lock:
+        if layout != _page_layout:
+            print(f"Using page layout: {layout}")
+        _page_layout = layout
+
+
+def reset_page_layout(layout=None):
+    """Forget the cached page layout, or only the given one if it is still cached, the
+    next page runs the full analysis"""
+    global _page_layout
+    with _page_layout_lock:
+        if layout is None or layout == _page_layout:
+            _page_layout = None
+
+
+def _build_skill_pattern(skills):
+    """One alternation with a named group per skill, wrapped in a lookahead so that
+    overlapping skills such as "Big Data" and "Data Science" are all found"""
+    alternatives = "|".join(
+        f"(?P<skill{i}>{re.escape(skill)})" for i, skill in enumerate(skills)
+    )
+    return re.compile(r"(?=\b(?:" + alternatives + r")\b)", re.IGNORECASE)
+
+
+# Text matchers, compiled once at import time
+UI_TEXT_PATTERN = re.compile(
+    "|".join(
+        [
             r"^\d+%\s*match$",  # Match percentage
             r"^\+\d+\s*more$",  # +N more button
             r"^[a-z\-]+$",  # Single lowercase tag like "python", "rust"
             r"^(?:python|rust|spark|scale|ai|jax|robotics|throughput|multimodal|preprocessing)$",  # Common skill tags
         ]
+    )
+)
+# Typical name pattern: Capitalized two or more words
+NAME_PATTERN = re.compile(r"^[A-Z][a-z]+(?:\s+[A-Z][a-z]+)+$")
+# Job and education keywords are plain substrings of the lowercased text
+KEYWORD_PATTERN = re.compile(
+    "(?=(?P<job>"
+    + "|".join(re.escape(keyword.lower()) for keyword in JOB_KEYWORDS)
+    + ")|(?P<edu>"
+    + "|".join(re.escape(keyword.lower()) for keyword in EDU_KEYWORDS)
+    + "))"
+)
+SKILL_PATTERN = _build_skill_pattern(SKILL_KEYWORDS)
+# Horizontal whitespace only, so that no match spans two lines of the card
+EXPERIENCE_PATTERN = re.compile(
+    r"(\d+(?:\.\d+)?)[^\S\n]*(?:years?|yrs?)[^\S\n]*(?:experience|exp)?",
+    re.IGNORECASE,
+)
+SHORT_EXPERIENCE_PATTERN = re.compile(
+    r"(\d+)[^\S\n]*y[^\S\n]+experience", re.IGNORECASE
+)
+LOCATION_PATTERN = re.compile(
+    r"((?:San Francisco|San Jose|Berkeley|Oakland|Palo Alto|Mountain View)(?:,[^\S\n]*(?:California|CA))?)",
+    re.IGNORECASE,
+)
 
-        if any(re.search(pattern, element_text.lower()) for pattern in ui_patterns):
-            return None
 
-        # Save raw text, but not HTML
-        text_lines = element_text.split("\n")
-        # Filter out empty lines and lines with only whitespace
-        text_lines = [line.strip() for line in text_lines if line.strip()]
-
-        if not text_lines:
-            return None  # Return None if no valid content
-
-        # Initialize candidate information
-        candidate = {
-            "page": page_number + 1,  # Record from which page
-            "name": "Unknown",
-            "position": "",
-            "experience": "",
-            "location": "",
-            "github": "",
-            "linkedin": "",
-            "education": "",
-            "skills": [],
-        }
+def _line_starts(lines):
+    """Offsets at which each line starts once lines are joined with newlines"""
+    starts = []
+    offset = 0
+    for line in lines:
+        starts.append(offset)
+        offset += len(line) + 1
+    return starts
 
-        # Try to extract title/position information (usually the first line)
-        title_text = text_lines[0] if text_lines else ""
-
-        # Detect name and position
-        # Typical name pattern: Capitalized two or more words
-        name_pattern = r"^[A-Z][a-z]+(?:\s+[A-Z][a-z]+)+$"
-        job_keywords = [
-            "engineer",
-            "developer",
-            "scientist",
-            "manager",
-            "lead",
-            "head",
-            "architect",
-            "specialist",
-            "analyst",
-            "consultant",
-            "intern",
-            "researcher",
-            "software",
-            "data",
-            "system",
-            "director",
-            "@",
-        ]
 
-        # Name detection
-        if re.match(name_pattern, title_text) and not any(
-            keyword.lower() in title_text.lower() for keyword in job_keywords
-        ):
-            candidate["name"] = title_text
-
-            # Find position (usually in the first line after name)
-            for line in text_lines[1:]:
-                if (
-                    any(keyword.lower() in line.lower() for keyword in job_keywords)
-                    and len(line) > 5
-                ):
-                    candidate["position"] = line
+def parse_candidate_text(element_text, page_number):
+    """Parse candidate fields from the visible text of a card, return None for UI elements"""
+    if not element_text:
+        return None  # Return None if no text content
+
+    # Filter out pure UI elements like buttons, labels, percentage matches, etc.
+    if len(element_text) < 20:  # Too short text could be a UI element
+        return None
+
+    # Filter out text that looks like UI elements
+    if UI_TEXT_PATTERN.search(element_text.lower()):
+        return None
+
+    # Save raw text, but not HTML
+    text_lines = element_text.split("\n")
+    # Filter out empty lines and lines with only whitespace
+    text_lines = [line.strip() for line in text_lines if line.strip()]
+
+    if not text_lines:
+        return None  # Return None if no valid content
+
+    # Initialize candidate information
+    candidate = {
+        "page": page_number + 1,  # Record from which page
+        "name": "Unknown",
+        "position": "",
+        "experience": "",
+        "location": "",
+        "github": "",
+        "linkedin": "",
+        "education": "",
+        "skills": [],
+    }
+
+    # Scan the whole card once per matcher, then map match offsets back to lines
+    text = "\n".join(text_lines)
+    line_starts = _line_starts(text_lines)
+    # Lowercasing can change the length of a line, so it gets its own offsets
+    lowered_lines = [line.lower() for line in text_lines]
+    lowered_starts = _line_starts(lowered_lines)
+
+    job_lines = set()
+    education_line = None
+    for match in KEYWORD_PATTERN.finditer("\n".join(lowered_lines)):
+        line_index = bisect.bisect_right(lowered_starts, match.start()) - 1
+        if match.group("job") is not None:
+            job_lines.add(line_index)
+        elif education_line is None:
+            education_line = line_index
+
+    # Try to extract title/position information (usually the first line)
+    title_text = text_lines[0]
+
+    # Name detection
+    if NAME_PATTERN.match(title_text) and 0 not in job_lines:
+        candidate["name"] = title_text
+
+        # Find position (usually in the first line after name)
+        for i in range(1, len(text_lines)):
+            if i in job_lines and len(text_lines[i]) > 5:
+                candidate["position"] = text_lines[i]
+                break
+    else:
+        # If first line is not name, it could be position
+        if 0 in job_lines and len(title_text) > 5:
+            candidate["position"] = title_text
+
+            # See if name can be found from other lines
+            for i in range(1, len(text_lines)):
+                if NAME_PATTERN.match(text_lines[i]) and i not in job_lines:
+                    candidate["name"] = text_lines[i]
                     break
+
+    # Extract experience information from the first line mentioning it
+    exp_match = EXPERIENCE_PATTERN.search(text)
+    short_exp = SHORT_EXPERIENCE_PATTERN.search(text)
+    if exp_match or short_exp:
+        first = min(
+            (match for match in (exp_match, short_exp) if match),
+            key=lambda match: match.start(),
+        )
+        line_index = bisect.bisect_right(line_starts, first.start()) - 1
+        # Common experience representation takes precedence within the line
+        line_exp = EXPERIENCE_PATTERN.search(text_lines[line_index])
+        if line_exp:
+            candidate["experience"] = f"{line_exp.group(1)} years"
         else:
-            # If first line is not name, it could be position
-            if (
-                any(keyword.lower() in title_text.lower() for keyword in job_keywords)
-                and len(title_text) > 5
-            ):
-                candidate["position"] = title_text
-
-                # See if name can be found from other lines
-                for line in text_lines[1:]:
-                    if re.match(name_pattern, line) and not any(
-                        kw.lower() in line.lower() for kw in job_keywords
-                    ):
-                        candidate["name"] = line
-                        break
+            candidate["experience"] = f"{short_exp.group(1)} years"
 
-        # Extract experience information
-        for line in text_lines:
-            # Match common experience representation
-            exp_match = re.search(
-                r"(\d+(?:\.\d+)?)\s*(?:years?|yrs?)\s*(?:experience|exp)?",
-                line,
-                re.IGNORECASE,
-            )
-            if exp_match:
-                candidate["experience"] = f"{exp_match.group(1)} years"
-                break
+    # Extract location information
+    location_match = LOCATION_PATTERN.search(text)
+    if location_match:
+        location = location_match.group(1)
+        # Ensure state name is included
+        if (
+            "california" not in location.lower()
+            and "ca" not in location.lower().split()
+        ):
+            location += ", California"
+        candidate["location"] = location
+
+    # Extract education information
+    if education_line is not None:
+        candidate["education"] = text_lines[education_line]
+
+    # Extract skill keywords, remove duplicates and sort
+    candidate["skills"] = sorted(
+        {
+            SKILL_KEYWORDS[int(match.lastgroup[len("skill") :])]
+            for match in SKILL_PATTERN.finditer(text)
+        }
+    )
 
-            # Short experience representation
-            short_exp = re.search(r"(\d+)\s*y\s+experience", line, re.IGNORECASE)
-            if short_exp:
-                candidate["experience"] = f"{short_exp.group(1)} years"
-                break
+    return candidate
+
+
+def has_enough_information(candidate):
+    """Check whether a parsed card carries enough fields to be a real candidate"""
+    # If no obvious information was captured, it might not be a real candidate
+    non_empty_fields = sum(
+        1
+        for field in [
+            "name",
+            "position",
+            "location",
+            "experience",
+            "github",
+            "linkedin",
+        ]
+        if candidate[field] and candidate[field] != "Unknown"
+    )
+
+    return not (
+        non_empty_fields < 2 and not candidate["github"] and not candidate["linkedin"]
+    )
 
-        # Extract location information
-        for line in text_lines:
-            # Try to match California city
-            location_match = re.search(
-                r"((?:San Francisco|San Jose|Berkeley|Oakland|Palo Alto|Mountain View)(?:,\s*(?:California|CA))?)",
-                line,
-                re.IGNORECASE,
-            )
-            if location_match:
-                location = location_match.group(1)
-                # Ensure state name is included
-                if (
-                    "california" not in location.lower()
-                    and "ca" not in location.lower().split()
-                ):
-                    location += ", California"
-                candidate["location"] = location
-                break
+
+@profiled("extract_info_from_element")
+def extract_info_from_element(element, page_number):
+    """Extract candidate information from element, keep only clean data without HTML"""
+    try:
+        # Get raw text content
+        candidate = parse_candidate_text(element.text.strip(), page_number)
+        if not candidate:
+            return None
 
         # Extract LinkedIn and GitHub links
         github_elements = element.find_elements(
@@ -497,77 +1704,7 @@ def extract_info_from_element(element, page_number):
         if linkedin_elements:
             candidate["linkedin"] = linkedin_elements[0].get_attribute("href")
 
-        # Extract education information
-        edu_keywords = [
-            "University",
-            "College",
-            "Bachelor",
-            "Master",
-            "PhD",
-            "B.S.",
-            "M.S.",
-            "Ph.D.",
-        ]
-        for line in text_lines:
-            if any(keyword.lower() in line.lower() for keyword in edu_keywords):
-                candidate["education"] = line
-                break
-
-        # Extract skill keywords
-        skills = []
-        skill_keywords = [
-            "Python",
-            "Java",
-            "JavaScript",
-            "C++",
-            "Rust",
-            "Go",
-            "SQL",
-            "Spark",
-            "Hadoop",
-            "AWS",
-            "Azure",
-            "GCP",
-            "Docker",
-            "Kubernetes",
-            "React",
-            "Angular",
-            "Vue",
-            "Data Science",
-            "Machine Learning",
-            "AI",
-            "Deep Learning",
-            "Cloud",
-            "Big Data",
-        ]
-
-        for line in text_lines:
-            for skill in skill_keywords:
-                if re.search(r"\b" + re.escape(skill) + r"\b", line, re.IGNORECASE):
-                    skills.append(skill)
-
-        # Remove duplicates and sort
-        candidate["skills"] = sorted(list(set(skills)))
-
-        # If no obvious information was captured, it might not be a real candidate
-        non_empty_fields = sum(
-            1
-            for field in [
-                "name",
-                "position",
-                "location",
-                "experience",
-                "github",
-                "linkedin",
-            ]
-            if candidate[field] and candidate[field] != "Unknown"
-        )
-
-        if (
-            non_empty_fields < 2
-            and not candidate["github"]
-            and not candidate["linkedin"]
-        ):
+        if not has_enough_information(candidate):
             return None  # Information too little, possibly mis-extracted
 
         return candidate
@@ -576,94 +1713,1083 @@ def extract_info_from_element(element, page_number):
         return None
 
 
-def extract_candidate_info_from_page(driver, page_number):
-    """Extract candidate information from current page"""
-    candidates = []
-
-    # First analyze page structure
-    result_containers = analyze_page_structure(driver, page_number)
-
-    # Try using multiple methods to extract data
+def extract_info_from_record(record, page_number):
+    """Extract candidate information from a harvested card record (text plus link hrefs)"""
     try:
-        # Wait longer time to ensure page fully loads
-        print("Waiting for page elements to load...")
-        time.sleep(10)  # Increased wait time
+        candidate = parse_candidate_text(record["text"].strip(), page_number)
+        if not candidate:
+            return None
 
-        # Track processed elements to avoid repeats
-        processed_elements = set()
+        # Extract LinkedIn and GitHub links, first matching anchor wins
+        for href in record["hrefs"]:
+            if not candidate["github"] and "github.com" in href:
+                candidate["github"] = href
+            elif not candidate["linkedin"] and "linkedin.com" in href:
+                candidate["linkedin"] = href
 
-        # 1. Try to find complete candidate card - most reliable method
-        try:
-            print("Trying to find complete candidate card...")
-            # More comprehensive selectors for candidate cards
-            profile_cards = driver.find_elements(
-                By.CSS_SELECTOR,
-                "div[class*='candidate-card'], div[class*='profile-card'], div[class*='item'], div[class*='row'], div[class*='ProfileRow']",
-            )
+        if not has_enough_information(candidate):
+            return None  # Information too little, possibly mis-extracted
+
+        return candidate
+    except Exception as e:
+        print(f"Error extracting information from record: {str(e)}")
+        return None
+
+
+# Elements that never contribute visible text
+SKIPPED_TEXT_TAGS = {"head", "script", "style", "noscript", "template", "title"}
+# Elements rendered on their own line
+BLOCK_TAGS = {
+    "address",
+    "article",
+    "aside",
+    "blockquote",
+    "dd",
+    "div",
+    "dl",
+    "dt",
+    "fieldset",
+    "figcaption",
+    "figure",
+    "footer",
+    "form",
+    "h1",
+    "h2",
+    "h3",
+    "h4",
+    "h5",
+    "h6",
+    "header",
+    "hr",
+    "li",
+    "main",
+    "nav",
+    "ol",
+    "p",
+    "pre",
+    "section",
+    "table",
+    "tbody",
+    "tfoot",
+    "thead",
+    "tr",
+    "ul",
+}
+# Inline display values that put an element on its own line, whatever its tag
+BLOCK_DISPLAYS = {
+    "block",
+    "flex",
+    "flow-root",
+    "grid",
+    "list-item",
+    "table",
+    "table-row",
+}
+VOID_TAGS = {
+    "area",
+    "base",
+    "br",
+    "col",
+    "embed",
+    "hr",
+    "img",
+    "input",
+    "link",
+    "meta",
+    "source",
+    "track",
+    "wbr",
+}
+
+
+class SnapshotNode:
+    """Element of a parsed page snapshot, index is its position in document order"""
+
+    def __init__(self, tag, attrs, parent=None, index=0):
+        self.tag = tag
+        self.attrs = attrs
+        self.parent = parent
+        self.index = index
+        self.children = []
+        self._text = None
+
+    def get_attribute(self, name):
+        return self.attrs.get(name)
+
+    def iter_descendants(self):
+        """Yield all descendant elements in document order"""
+        stack = [
+            child for child in reversed(self.children) if not isinstance(child, str)
+        ]
+        while stack:
+            node = stack.pop()
+            yield node
+            stack.extend(
+                child for child in reversed(node.children) if not isinstance(child, str)
+            )
+
+    @property
+    def text(self):
+        """Approximate the visible text WebDriver returns for element.text
+
+        Elements hidden by the hidden attribute or by display, visibility or opacity in
+        their style attribute are skipped, and block elements and <br> start new lines.
+        Stylesheet rules, text-transform, generated content and elements hidden by size or
+        overflow are not seen, so text styled that way can differ from webdriver mode.
+        """
+        if self._text is None:
+            parts = []
+            _collect_visible_text(self, parts)
+            lines = (line.strip() for line in "".join(parts).split("\n"))
+            self._text = "\n".join(line for line in lines if line)
+        return self._text
+
+
+class SnapshotParser(HTMLParser):
+    """Build a SnapshotNode tree from page source"""
+
+    def __init__(self):
+        super().__init__(convert_charrefs=True)
+        self.root = SnapshotNode("#document", {})
+        self.stack = [self.root]
+        self.count = 0
+
+    def _add_node(self, tag, attrs):
+        self.count += 1
+        node = SnapshotNode(
+            tag, {k: v or "" for k, v in attrs}, self.stack[-1], self.count
+        )
+        self.stack[-1].children.append(node)
+        return node
+
+    def handle_starttag(self, tag, attrs):
+        node = self._add_node(tag, attrs)
+        if tag not in VOID_TAGS:
+            self.stack.append(node)
+
+    def handle_startendtag(self, tag, attrs):
+        self._add_node(tag, attrs)
+
+    def handle_endtag(self, tag):
+        # Close up to the matching open element, ignore stray end tags
+        for i in range(len(self.stack) - 1, 0, -1):
+            if self.stack[i].tag == tag:
+                del self.stack[i:]
+                break
+
+    def handle_data(self, data):
+        self.stack[-1].children.append(data)
+
+
+def _inline_style(node):
+    """Declarations of an element's style attribute, e.g. {"display": "none"}"""
+    declarations = {}
+    for declaration in node.attrs.get("style", "").split(";"):
+        name, _, value = declaration.partition(":")
+        if value.strip():
+            declarations[name.strip().lower()] = value.strip().lower()
+    return declarations
+
+
+def _is_hidden(node, style):
+    """Check whether an element and everything in it is not rendered"""
+    if "hidden" in node.attrs or style.get("display") == "none":
+        return True
+    try:
+        return float(style.get("opacity", "1")) == 0
+    except ValueError:
+        return False
+
+
+def _collect_visible_text(node, parts, visible=True):
+    # visibility is inherited, and a visible child of a hidden element is still shown
+    for child in node.children:
+        if isinstance(child, str):
+            if visible:
+                parts.append(re.sub(r"\s+", " ", child))
+            continue
+        if child.tag in SKIPPED_TEXT_TAGS:
+            continue
+        style = _inline_style(child)
+        if _is_hidden(child, style):
+            continue
+        child_visible = visible
+        if style.get("visibility") in ["hidden", "collapse"]:
+            child_visible = False
+        elif style.get("visibility") == "visible":
+            child_visible = True
+        if child.tag == "br":
+            if child_visible:
+                parts.append("\n")
+            continue
+        display = style.get("display")
+        is_block = display in BLOCK_DISPLAYS if display else child.tag in BLOCK_TAGS
+        if is_block:
+            parts.append("\n")
+        _collect_visible_text(child, parts, child_visible)
+        if is_block:
+            parts.append("\n")
+        elif child.tag in ("td", "th"):
+            parts.append(" ")
+
+
+def parse_html_snapshot(html):
+    """Parse page source into a SnapshotNode tree"""
+    parser = SnapshotParser()
+    parser.feed(html)
+    parser.close()
+    return parser.root
+
+
+def _parse_css_selector(selector):
+    """Parse a comma separated list of simple selectors like div[class*='row']"""
+    parsed = []
+    for part in selector.split(","):
+        if not part.strip():
+            continue
+        match = re.fullmatch(
+            r"\s*([a-zA-Z0-9]*|\*)(?:\[([\w-]+)(?:([*^$]?=)['\"]?([^'\"\]]*)['\"]?)?\])?\s*",
+            part,
+        )
+        if not match:
+            raise ValueError(f"Unsupported selector for snapshot parsing: {part}")
+        parsed.append(match.groups())
+    return parsed
+
+
+def _matches_selector(node, parsed_selector):
+    for tag, attr, operator, value in parsed_selector:
+        if tag and tag != "*" and node.tag != tag.lower():
+            continue
+        if attr:
+            actual = node.attrs.get(attr)
+            if actual is None:
+                continue
+            if operator == "*=" and value not in actual:
+                continue
+            if operator == "^=" and not actual.startswith(value):
+                continue
+            if operator == "$=" and not actual.endswith(value):
+                continue
+            if operator == "=" and actual != value:
+                continue
+        return True
+    return False
+
+
+def select_snapshot_nodes(root, selector):
+    """Return descendants of root matching selector, in document order like find_elements"""
+    parsed_selector = _parse_css_selector(selector)
+    if not parsed_selector:
+        return []
+    return [
+        node
+        for node in root.iter_descendants()
+        if _matches_selector(node, parsed_selector)
+    ]
 
-            # Filter out duplicates and invalid cards
-            valid_cards = []
-            for card in profile_cards:
-                # Check if already processed
-                element_id = card.id
-                if element_id in processed_elements:
-                    continue
 
-                # Check if it's a valid card
-                text = card.text.strip()
-                if len(text) > 50 and "\n" in text:  # Reduced minimum text length
-                    valid_cards.append(card)
-                    processed_elements.add(element_id)
+def snapshot_record(node, base_url=""):
+    """Convert a snapshot element to a card record with text and resolved link hrefs"""
+    return {
+        "key": id(node),
+        "text": node.text,
+        "hrefs": [
+            urljoin(base_url, anchor.attrs["href"])
+            for anchor in node.iter_descendants()
+            if anchor.tag == "a" and anchor.attrs.get("href")
+        ],
+        "className": node.attrs.get("class", ""),
+    }
+
+
+def _snapshot_contains(outer, inner):
+    node = inner["node"].parent
+    while node is not None:
+        if node is outer["node"]:
+            return True
+        node = node.parent
+    return False
 
-            print(f"Found {len(valid_cards)} valid candidate cards")
 
-            # Extract candidate information
-            for card in valid_cards:
-                candidate = extract_info_from_element(card, page_number)
-                if candidate:
-                    candidates.append(candidate)
+def harvest_cards_from_html(html, base_url="", layout=None):
+    """Collect card records for every detection strategy from one page snapshot, or only
+    for the strategy of a cached page layout"""
+    root = parse_html_snapshot(html)
+    plan = layout_harvest_plan(layout)
 
-            # If we have enough candidates, return them
+    # Structural analysis, same rules as analyze_page_structure
+    containers = []
+    for div in select_snapshot_nodes(root, "div"):
+        class_name = div.attrs.get("class", "")
+        if plan["container_class"] is not None:
+            matches = class_name == plan["container_class"]
+        else:
+            matches = any(
+                term in class_name.lower() for term in plan["container_terms"]
+            )
+        if matches and len(div.text) > 50:
+            containers.append(div)
+    # Sort by text length, prioritize longer containers
+    containers.sort(key=lambda div: len(div.text), reverse=True)
+
+    def collect(selectors):
+        # One record per element, tagged with the first selector that found it
+        records = []
+        seen = set()
+        plausible = 0
+        for selector in selectors:
+            if plan["limit"] and plausible >= plan["limit"]:
+                break
+            for node in select_snapshot_nodes(root, selector):
+                if id(node) in seen:
+                    continue
+                seen.add(id(node))
+                record = snapshot_record(node, base_url)
+                record["selector"] = selector
+                record["node"] = node
+                records.append(record)
+                if len(record["text"].strip()) > 50:
+                    plausible += 1
+        # Selectors only decide what is found, records follow the page like the results
+        records.sort(key=lambda record: record["node"].index)
+        mark_nested_records(records, _snapshot_contains)
+        for record in records:
+            del record["node"]
+        return records
+
+    return {
+        "cards": collect(plan["cards"]),
+        "rows": collect(plan["rows"]),
+        "containers": [
+            {
+                "className": div.attrs.get("class", ""),
+                "textLength": len(div.text),
+                "items": [
+                    snapshot_record(node, base_url)
+                    for node in select_snapshot_nodes(div, CONTAINER_ITEM_SELECTOR)
+                ],
+            }
+            for div in containers[:3]
+        ],
+    }
+
+
+def extract_candidates_from_harvest(harvest, page_number):
+    """Run the card, ProfileRow and container strategies over harvested card records,
+    return the candidates and the page layout that produced most of them"""
+    candidates = []
+    container_counts = {}
+    # Track processed elements to avoid repeats
+    processed_elements = set()
+
+    # 1. Complete candidate cards
+    valid_cards = []
+    for record in harvest["cards"]:
+        if record["key"] in processed_elements or record.get("nested"):
+            continue
+        text = record["text"].strip()
+        if len(text) > 50 and "\n" in text:
+            valid_cards.append(record)
+            processed_elements.add(record["key"])
+    print(f"Found {len(valid_cards)} valid candidate cards")
+
+    card_keys = set()
+    for record in valid_cards:
+        candidate = extract_info_from_record(record, page_number)
+        if candidate:
+            candidates.append(candidate)
+            card_keys.add(record["key"])
+    card_valid = record_selector_stats(harvest["cards"], card_keys)
+
+    if len(candidates) >= RESULTS_PER_PAGE:
+        print(f"Successfully extracted {len(candidates)} candidates using card layout")
+        return candidates[:RESULTS_PER_PAGE], pick_page_layout(card_valid, {}, {})
+
+    # 2. Explicit candidate rows
+    valid_rows = []
+    for record in harvest["rows"]:
+        if record["key"] in processed_elements or record.get("nested"):
+            continue
+        if len(record["text"].strip()) > 50:
+            valid_rows.append(record)
+            processed_elements.add(record["key"])
+    print(f"Found {len(valid_rows)} valid candidate rows")
+
+    row_keys = set()
+    for record in valid_rows:
+        candidate = extract_info_from_record(record, page_number)
+        if candidate:
+            candidates.append(candidate)
+            row_keys.add(record["key"])
+    row_valid = record_selector_stats(harvest["rows"], row_keys)
+
+    # 3. Elements inside the most likely result containers
+    if len(candidates) < RESULTS_PER_PAGE and harvest["containers"]:
+        print("Trying to extract candidates from page structure...")
+        for container in harvest["containers"][:3]:
+            found = 0
+            for record in container["items"]:
+                if record["key"] in processed_elements:
+                    continue
+                text = record["text"].strip()
+                if len(text) > 50 and "\n" in text:
+                    candidate = extract_info_from_record(record, page_number)
+                    if candidate:
+                        candidates.append(candidate)
+                        processed_elements.add(record["key"])
+                        found += 1
+                        if len(candidates) >= RESULTS_PER_PAGE:
+                            break
+            container_counts[container["className"]] = found
             if len(candidates) >= RESULTS_PER_PAGE:
+                break
+
+    layout = pick_page_layout(card_valid, row_valid, container_counts)
+    return candidates[:RESULTS_PER_PAGE], layout
+
+
+# Runs in the page: collects text, hrefs and className of every element matched by the card,
+# ProfileRow and container strategies in one round-trip. Card and row selectors run in the
+# given order and each record names the first selector that found it; once a strategy has
+# limit elements with enough text the remaining selectors are skipped. Records are returned in
+# document order. Wrappers and elements nested in a card are flagged as nested. A container class
+# replaces the container analysis with an exact class match.
+CARD_HARVEST_SCRIPT = """
+const [cardSelectors, rowSelectors, itemSelector, containerTerms, containerClass, limit] =
+    arguments;
+const keys = new Map();
+function toRecord(el) {
+    if (!keys.has(el)) {
+        keys.set(el, keys.size);
+    }
+    return {
+        key: keys.get(el),
+        text: el.innerText || "",
+        hrefs: Array.from(el.querySelectorAll("a[href]"), (a) => a.href),
+        className: el.getAttribute("class") || "",
+    };
+}
+
+// Same rules as mark_nested_records: wrappers of one or more cards and parts of a card
+function markNested(records, elements) {
+    const plausible = records
+        .map((record, i) => ({record, el: elements[i]}))
+        .filter((item) => item.record.text.trim().length > 50);
+    const wrappers = new Set();
+    for (const outer of plausible) {
+        const inner = plausible.filter(
+            (item) => item !== outer && outer.el.contains(item.el)
+        ).length;
+        if (inner >= 2) {
+            wrappers.add(outer);
+        }
+    }
+    const cards = plausible.filter((item) => !wrappers.has(item));
+    for (const item of plausible) {
+        const text = item.record.text.trim();
+        if (
+            wrappers.has(item) ||
+            cards.some(
+                (other) => other !== item && item.el.contains(other.el) &&
+                    other.record.text.trim() === text
+            ) ||
+            cards.some(
+                (other) => other !== item && other.el.contains(item.el) &&
+                    other.record.text.trim().length > text.length
+            )
+        ) {
+            item.record.nested = true;
+        }
+    }
+}
+
+function collect(selectors) {
+    const records = [];
+    const elements = [];
+    const seen = new Set();
+    let plausible = 0;
+    for (const selector of selectors) {
+        if (limit && plausible >= limit) {
+            break;
+        }
+        for (const el of document.querySelectorAll(selector)) {
+            if (seen.has(el)) {
+                continue;
+            }
+            seen.add(el);
+            const record = toRecord(el);
+            record.selector = selector;
+            records.push(record);
+            elements.push(el);
+            if (record.text.trim().length > 50) {
+                plausible++;
+            }
+        }
+    }
+    // Selectors only decide what is found, records follow the page like the results
+    const order = elements.map((el, i) => i).sort((a, b) =>
+        elements[a].compareDocumentPosition(elements[b]) &
+            Node.DOCUMENT_POSITION_FOLLOWING ? -1 : 1
+    );
+    markNested(order.map((i) => records[i]), order.map((i) => elements[i]));
+    return order.map((i) => records[i]);
+}
+
+const containers = [];
+for (const div of document.querySelectorAll("div")) {
+    const className = div.getAttribute("class") || "";
+    const matches = containerClass !== null
+        ? className === containerClass
+        : containerTerms.some((term) => className.toLowerCase().includes(term));
+    if (matches) {
+        const textLength = (div.innerText || "").length;
+        if (textLength > 50) {
+            containers.push({div, className, textLength});
+        }
+    }
+}
+containers.sort((a, b) => b.textLength - a.textLength);
+
+return JSON.stringify({
+    cards: collect(cardSelectors),
+    rows: collect(rowSelectors),
+    containers: containers.slice(0, 3).map((c) => ({
+        className: c.className,
+        textLength: c.textLength,
+        items: Array.from(c.div.querySelectorAll(itemSelector), toRecord),
+    })),
+});
+"""
+
+
+def harvest_cards_with_script(driver, layout=None):
+    """Collect card records for every detection strategy, or only for the strategy of a
+    cached page layout, with a single execute_script call"""
+    plan = layout_harvest_plan(layout)
+    return json.loads(
+        driver.execute_script(
+            CARD_HARVEST_SCRIPT,
+            plan["cards"],
+            plan["rows"],
+            CONTAINER_ITEM_SELECTOR,
+            plan["container_terms"],
+            plan["container_class"],
+            plan["limit"],
+        )
+    )
+
+
+def extract_candidate_info_from_html(html, page_number, base_url=""):
+    """Extract candidate information from a saved or live page source snapshot"""
+    try:
+        candidates = extract_with_page_layout(
+            lambda layout: extract_candidates_from_harvest(
+                harvest_cards_from_html(html, base_url, layout), page_number
+            ),
+            page_number,
+        )
+    except Exception as e:
+        print(f"Error extracting candidate information from snapshot: {str(e)}")
+        candidates = []
+    print(f"Extracted {len(candidates)} candidates from page {page_number+1}")
+    return candidates
+
+
+def capture_api_responses(driver):
+    """Return (url, data) for JSON responses recorded in the performance log since last call"""
+    responses = []
+    for entry in driver.get_log("performance"):
+        try:
+            message = json.loads(entry["message"])["message"]
+            if message["method"] != "Network.responseReceived":
+                continue
+            response = message["params"]["response"]
+            if "json" not in response.get("mimeType", "").lower():
+                continue
+            if not any(
+                keyword in response["url"].lower() for keyword in API_URL_KEYWORDS
+            ):
+                continue
+            body = driver.execute_cdp_cmd(
+                "Network.getResponseBody", {"requestId": message["params"]["requestId"]}
+            )
+            responses.append((response["url"], json.loads(body["body"])))
+        except Exception as e:
+            # Body may already be evicted from the buffer, or not be JSON after all
+            print(f"Error reading captured response: {str(e)}")
+    print(f"Captured {len(responses)} API responses")
+    return responses
+
+
+def _looks_like_profile(item):
+    """A profile carries a name and at least one other candidate field"""
+    if not isinstance(item, dict):
+        return False
+    fields = [
+        field
+        for field, keys in API_FIELD_KEYS.items()
+        if any(key.split(".")[0] in item for key in keys)
+    ]
+    return len(fields) >= 2 and (
+        "name" in fields or "firstName" in item or "first_name" in item
+    )
+
+
+def find_profile_records(data):
+    """Find the largest list of profile-like objects anywhere in a JSON document"""
+    best = []
+    stack = [data]
+    while stack:
+        value = stack.pop()
+        if isinstance(value, dict):
+            stack.extend(value.values())
+        elif isinstance(value, list):
+            profiles = [item for item in value if _looks_like_profile(item)]
+            if len(profiles) > len(best):
+                best = profiles
+            stack.extend(value)
+    return best
+
+
+def _api_value(profile, keys):
+    """Return the first non-empty value among keys, dotted keys address nested objects"""
+    for key in keys:
+        value = profile
+        for part in key.split("."):
+            value = value.get(part) if isinstance(value, dict) else None
+        if value not in (None, "", [], {}):
+            return value
+    return None
+
+
+def _api_text(value):
+    """Flatten an API value to display text"""
+    if isinstance(value, dict):
+        value = _api_value(value, ["name", "title", "label", "value"])
+    if isinstance(value, list):
+        value = ", ".join(_api_text(item) for item in value if _api_text(item))
+    return str(value).strip() if value is not None else ""
+
+
+def _api_urls(value):
+    """Yield every string in an API value that looks like a URL"""
+    stack = [value]
+    while stack:
+        value = stack.pop()
+        if isinstance(value, dict):
+            stack.extend(value.values())
+        elif isinstance(value, list):
+            stack.extend(value)
+        elif isinstance(value, str) and ("http" in value or ".com/" in value):
+            yield value
+
+
+def map_api_profile_to_candidate(profile, page_number):
+    """Map a structured profile from the search API to the candidate schema"""
+    candidate = {
+        "page": page_number + 1,
+        "name": "Unknown",
+        "position": "",
+        "experience": "",
+        "location": "",
+        "github": "",
+        "linkedin": "",
+        "education": "",
+        "skills": [],
+    }
+
+    name = _api_value(profile, API_FIELD_KEYS["name"])
+    if not name:
+        first = _api_value(profile, ["first_name", "firstName"])
+        last = _api_value(profile, ["last_name", "lastName"])
+        name = " ".join(part for part in [first, last] if part)
+    if name:
+        candidate["name"] = _api_text(name)
+
+    candidate["position"] = _api_text(_api_value(profile, API_FIELD_KEYS["position"]))
+    candidate["location"] = _api_text(_api_value(profile, API_FIELD_KEYS["location"]))
+
+    experience = _api_value(profile, API_FIELD_KEYS["experience"])
+    if isinstance(experience, (int, float)):
+        candidate["experience"] = f"{experience:g} years"
+    elif experience:
+        candidate["experience"] = _api_text(experience)
+
+    education = _api_value(profile, API_FIELD_KEYS["education"])
+    if isinstance(education, list):
+        education = education[0]
+    if isinstance(education, dict):
+        education = " ".join(
+            _api_text(education.get(key))
+            for key in ["degree", "field", "school", "institution", "name"]
+            if education.get(key)
+        )
+    candidate["education"] = _api_text(education)
+
+    skills = _api_value(profile, API_FIELD_KEYS["skills"]) or []
+    if isinstance(skills, str):
+        skills = skills.split(",")
+    candidate["skills"] = sorted(
+        {_api_text(skill) for skill in skills if _api_text(skill)}
+    )
+
+    # Profile links, explicit fields first then any URL in the profile
+    for field in ["github", "linkedin"]:
+        link = _api_value(profile, API_FIELD_KEYS[field])
+        if not link:
+            link = next(
+                (url for url in _api_urls(profile) if f"{field}.com" in url.lower()),
+                "",
+            )
+        candidate[field] = _api_text(link)
+
+    return candidate
+
+
+def drain_api_responses(driver):
+    """Discard the performance log before a navigation in "api" mode, so responses of
+    earlier loads (session checks, refreshes, probes) are never read for the next page
+    """
+    if EXTRACTION_MODE == "api":
+        driver.get_log("performance")
+
+
+def api_response_matches(url, page_number, size=None):
+    """Whether a search API request URL asks for this page at this page size"""
+    params = parse_qs(urlsplit(url).query)
+    size = size or RESULTS_PER_PAGE
+    for keys, expected in [
+        (API_PAGE_KEYS, page_number + 1),
+        (API_SIZE_KEYS, size),
+        (API_OFFSET_KEYS, page_number * size),
+    ]:
+        for key in keys:
+            if key not in params:
+                continue
+            try:
+                if int(params[key][-1]) != expected:
+                    return False
+            except ValueError:
+                return False
+    return True
+
+
+def select_api_response(responses, page_number):
+    """Return the latest captured (url, data) with profiles requested for this page, or
+    None"""
+    for url, data in reversed(responses):
+        if api_response_matches(url, page_number) and find_profile_records(data):
+            return url, data
+    return None
+
+
+def extract_candidates_from_api_responses(responses, page_number):
+    """Map the captured search API response of this page to candidates"""
+    response = select_api_response(responses, page_number)
+    if response is None:
+        return []
+    url, data = response
+    profiles = find_profile_records(data)
+    print(f"Found {len(profiles)} profiles in response from {url}")
+    candidates = [
+        map_api_profile_to_candidate(profile, page_number) for profile in profiles
+    ]
+    return candidates[:RESULTS_PER_PAGE]
+
+
+@profiled("extract")
+def extract_candidate_info_from_page(driver, page_number):
+    """Extract candidate information from current page"""
+    candidates = []
+
+    if EXTRACTION_MODE == "api":
+        # Structured JSON behind the results page, no DOM parsing needed
+        candidates = extract_candidates_from_api_responses(
+            capture_api_responses(driver), page_number
+        )
+        if candidates:
+            print(f"Extracted {len(candidates)} candidates from page {page_number+1}")
+            return candidates
+        print("No candidates found in API responses, falling back to page content")
+        wait_for_results_ready(driver, RESULTS_PER_PAGE)
+        candidates = extract_with_page_layout(
+            lambda layout: extract_candidates_from_harvest(
+                harvest_cards_with_script(driver, layout), page_number
+            ),
+            page_number,
+        )
+        print(f"Extracted {len(candidates)} candidates from page {page_number+1}")
+        return candidates
+
+    if EXTRACTION_MODE == "script":
+        # Make sure the result list is stable before reading it
+        print("Waiting for page elements to load...")
+        wait_for_results_ready(driver, RESULTS_PER_PAGE)
+        # One execute_script round-trip, all cards parsed from the returned records
+        try:
+            candidates = extract_with_page_layout(
+                lambda layout: extract_candidates_from_harvest(
+                    harvest_cards_with_script(driver, layout), page_number
+                ),
+                page_number,
+            )
+        except Exception as e:
+            print(f"Error harvesting candidate cards with script: {str(e)}")
+        print(f"Extracted {len(candidates)} candidates from page {page_number+1}")
+        return candidates
+
+    if EXTRACTION_MODE == "html":
+        # Make sure the result list is stable before reading it
+        print("Waiting for page elements to load...")
+        wait_for_results_ready(driver, RESULTS_PER_PAGE)
+        # One page_source round-trip, all cards parsed in-process
+        return extract_candidate_info_from_html(
+            driver.page_source, page_number, driver.current_url
+        )
+
+    # Make sure the result list is stable before reading it
+    print("Waiting for page elements to load...")
+    wait_for_results_ready(driver, RESULTS_PER_PAGE)
+    candidates = extract_with_page_layout(
+        lambda layout: extract_candidates_with_webdriver(driver, page_number, layout),
+        page_number,
+    )
+    print(f"Extracted {len(candidates)} candidates from page {page_number+1}")
+    return candidates
+
+
+@profiled("snapshot")
+def capture_page_snapshot(driver, page_number):
+    """Read everything extraction needs from the loaded page without parsing it
+
+    Returns the search API responses in "api" mode, the card records of the cached page
+    layout, or of every detection strategy without one, in "script" mode (and as the "api"
+    fallback) and the page source otherwise. The snapshot is parsed by
+    parse_page_snapshot, possibly on another thread.
+    """
+    if EXTRACTION_MODE == "api":
+        responses = capture_api_responses(driver)
+        if select_api_response(responses, page_number):
+            return {"kind": "api", "responses": responses}
+        print("No candidates found in API responses, falling back to page content")
+
+    # Make sure the result list is stable before reading it
+    print("Waiting for page elements to load...")
+    wait_for_results_ready(driver, RESULTS_PER_PAGE)
+    if EXTRACTION_MODE in ["script", "api"]:
+        layout = _page_layout
+        try:
+            return {
+                "kind": "harvest",
+                "harvest": harvest_cards_with_script(driver, layout),
+                "layout": layout,
+            }
+        except Exception as e:
+            print(f"Error harvesting candidate cards with script: {str(e)}")
+    return {"kind": "html", "html": driver.page_source, "base_url": driver.current_url}
+
+
+def parse_page_snapshot(snapshot, page_number):
+    """Extract candidates from a snapshot taken by capture_page_snapshot"""
+    with profile_phase("parse", page_number):
+        if snapshot["kind"] == "html":
+            return extract_candidate_info_from_html(
+                snapshot["html"], page_number, snapshot["base_url"]
+            )
+        if snapshot["kind"] == "api":
+            candidates = extract_candidates_from_api_responses(
+                snapshot["responses"], page_number
+            )
+        else:
+            try:
+                candidates, layout = extract_candidates_from_harvest(
+                    snapshot["harvest"], page_number
+                )
+            except Exception as e:
+                print(f"Error extracting candidates from harvested cards: {str(e)}")
+                candidates, layout = [], None
+            if snapshot["layout"] is None:
+                remember_page_layout(layout)
+            elif not layout_matches(candidates):
+                # The parser cannot go back to the page, the retry harvests every strategy
                 print(
-                    f"Successfully extracted {len(candidates)} candidates using card layout"
+                    f"Cached page layout matched {len(candidates)} candidates on page {page_number+1}, re-analyzing page structure on the next load"
                 )
-                return candidates[:RESULTS_PER_PAGE]
+                reset_page_layout(snapshot["layout"])
+        print(f"Extracted {len(candidates)} candidates from page {page_number+1}")
+        return candidates
+
+
+# Indices of the given elements in document order, and pairs [i, j] where element i
+# contains element j
+ELEMENT_NESTING_SCRIPT = """
+const elements = arguments[0];
+const pairs = [];
+elements.forEach((outer, i) => {
+    elements.forEach((inner, j) => {
+        if (i !== j && outer.contains(inner)) {
+            pairs.push([i, j]);
+        }
+    });
+});
+const order = elements.map((el, i) => i).sort((a, b) =>
+    elements[a].compareDocumentPosition(elements[b]) &
+        Node.DOCUMENT_POSITION_FOLLOWING ? -1 : 1
+);
+return {order: order, pairs: pairs};
+"""
+
+
+def find_elements_by_selectors(driver, selectors, limit=None):
+    """Find elements for each selector in order, return records with the element, the
+    selector and its text
+
+    Each element is listed once, under the first selector that found it. Once limit
+    elements with enough text are found the remaining selectors are skipped. Document
+    order and nesting are read from the DOM with one execute_script call over the elements
+    with enough text, which come first in document order, followed by the rest.
+    """
+    records = []
+    seen = set()
+    plausible = 0
+    for selector in selectors:
+        if limit and plausible >= limit:
+            break
+        for element in driver.find_elements(By.CSS_SELECTOR, selector):
+            if element.id in seen:
+                continue
+            seen.add(element.id)
+            text = element.text.strip()
+            records.append(
+                {
+                    "key": element.id,
+                    "selector": selector,
+                    "text": text,
+                    "element": element,
+                }
+            )
+            if len(text) > 50:
+                plausible += 1
+    # Only records with enough text can be cards and are compared by mark_nested_records
+    plausible = [record for record in records if len(record["text"]) > 50]
+    positions = {record["key"]: i for i, record in enumerate(plausible)}
+    pairs = set()
+    if len(plausible) > 1:
+        nesting = driver.execute_script(
+            ELEMENT_NESTING_SCRIPT, [record["element"] for record in plausible]
+        )
+        # Pairs use the positions the elements were passed in at
+        pairs = {tuple(pair) for pair in nesting["pairs"]}
+        plausible = [plausible[i] for i in nesting["order"]]
+    records = plausible + [record for record in records if len(record["text"]) <= 50]
+    return mark_nested_records(
+        records,
+        lambda outer, inner: (positions[outer["key"]], positions[inner["key"]])
+        in pairs,
+    )
 
-        except Exception as e:
-            print(f"Error extracting candidate card: {str(e)}")
+
+def extract_candidates_with_webdriver(driver, page_number, layout=None):
+    """Run the card, ProfileRow and container strategies through WebDriver element calls,
+    return the candidates and the page layout that produced most of them"""
+    candidates = []
+    card_valid = {}
+    row_valid = {}
+    container_counts = {}
+    plan = layout_harvest_plan(layout)
+
+    # Full structural analysis only without a cached layout
+    if layout is None:
+        result_containers = analyze_page_structure(driver, page_number)
+    elif plan["container_class"] is not None:
+        result_containers = find_layout_containers(driver, plan["container_class"])
+    else:
+        result_containers = []
+
+    # Try using multiple methods to extract data
+    try:
+        # Track processed elements to avoid repeats
+        processed_elements = set()
+
+        # 1. Try to find complete candidate card - most reliable method
+        if plan["cards"]:
+            try:
+                print("Trying to find complete candidate card...")
+                # Most precise selectors first
+                profile_cards = find_elements_by_selectors(
+                    driver, plan["cards"], plan["limit"]
+                )
+
+                # Filter out duplicates and invalid cards
+                valid_cards = []
+                for record in profile_cards:
+                    # Check if already processed or part of another card
+                    element_id = record["key"]
+                    if element_id in processed_elements or record.get("nested"):
+                        continue
+
+                    # Check if it's a valid card
+                    text = record["text"]
+                    if len(text) > 50 and "\n" in text:  # Reduced minimum text length
+                        valid_cards.append(record["element"])
+                        processed_elements.add(element_id)
+
+                print(f"Found {len(valid_cards)} valid candidate cards")
+
+                # Extract candidate information
+                card_keys = set()
+                for card in valid_cards:
+                    candidate = extract_info_from_element(card, page_number)
+                    if candidate:
+                        candidates.append(candidate)
+                        card_keys.add(card.id)
+                card_valid = record_selector_stats(profile_cards, card_keys)
+
+                # If we have enough candidates, return them
+                if len(candidates) >= RESULTS_PER_PAGE:
+                    print(
+                        f"Successfully extracted {len(candidates)} candidates using card layout"
+                    )
+                    return candidates[:RESULTS_PER_PAGE], pick_page_layout(
+                        card_valid, {}, {}
+                    )
+
+            except Exception as e:
+                print(f"Error extracting candidate card: {str(e)}")
 
         # 2. If card method didn't work, try finding explicit candidate rows
-        if len(candidates) < RESULTS_PER_PAGE:
+        if len(candidates) < RESULTS_PER_PAGE and plan["rows"]:
             try:
                 print("Trying to find ProfileRow elements...")
-                # More comprehensive selectors for profile rows
-                main_profile_rows = driver.find_elements(
-                    By.CSS_SELECTOR,
-                    "tr[class*='ProfileRow'], div[class*='search-result-item'], div[class*='profile-row'], div[class*='profile_row']",
+                # Most precise selectors first
+                main_profile_rows = find_elements_by_selectors(
+                    driver, plan["rows"], plan["limit"]
                 )
 
                 # Filter out possible child elements, only keep main rows
                 valid_rows = []
-                for row in main_profile_rows:
-                    # If element already processed, skip
-                    element_id = row.id
-                    if element_id in processed_elements:
+                for record in main_profile_rows:
+                    # If element already processed or part of another row, skip
+                    element_id = record["key"]
+                    if element_id in processed_elements or record.get("nested"):
                         continue
 
                     # Check if it contains enough content
-                    text = row.text.strip()
-                    if len(text) > 50:  # Reduced minimum text length
-                        valid_rows.append(row)
+                    if len(record["text"]) > 50:  # Reduced minimum text length
+                        valid_rows.append(record["element"])
                         processed_elements.add(element_id)
 
                 print(f"Found {len(valid_rows)} valid candidate rows")
 
                 # Extract information from valid rows
+                row_keys = set()
                 for row in valid_rows:
                     candidate = extract_info_from_element(row, page_number)
                     if candidate:
                         candidates.append(candidate)
+                        row_keys.add(row.id)
+                row_valid = record_selector_stats(main_profile_rows, row_keys)
 
             except Exception as e:
                 print(f"Error extracting data using ProfileRow selector: {str(e)}")
@@ -678,11 +2804,11 @@ def extract_candidate_info_from_page(driver, page_number):
                 :3
             ]:  # Try first 3 most likely containers
                 container = container_info["element"]
+                found = 0
                 try:
                     # Find possible candidate elements in container
                     potential_elements = container.find_elements(
-                        By.CSS_SELECTOR,
-                        "div[class*='item'], div[class*='row'], div[class*='card'], div[class*='profile']",
+                        By.CSS_SELECTOR, CONTAINER_ITEM_SELECTOR
                     )
 
                     # Filter elements
@@ -701,6 +2827,7 @@ def extract_candidate_info_from_page(driver, page_number):
                             if candidate:
                                 candidates.append(candidate)
                                 processed_elements.add(element_id)
+                                found += 1
 
                                 # Stop when reach per page limit
                                 if len(candidates) >= RESULTS_PER_PAGE:
@@ -710,16 +2837,18 @@ def extract_candidate_info_from_page(driver, page_number):
                         break
                 except Exception as e:
                     print(f"Error extracting information from container: {str(e)}")
+                finally:
+                    container_counts[container_info["class"]] = found
 
     except Exception as e:
         print(f"Error extracting candidate information: {str(e)}")
 
     # Return extracted candidate information, up to per page limit
-    candidates = candidates[:RESULTS_PER_PAGE]
-    print(f"Extracted {len(candidates)} candidates from page {page_number+1}")
-    return candidates
+    layout = pick_page_layout(card_valid, row_valid, container_counts)
+    return candidates[:RESULTS_PER_PAGE], layout
 
 
+@profiled("find_pagination_elements")
 def find_pagination_elements(driver):
     """Find all possible pagination elements and return detailed information"""
     pagination_elements = []
@@ -888,167 +3017,231 @@ def find_pagination_elements(driver):
     return pagination_elements
 
 
-def navigate_to_page(driver, page_number):
-    """Navigate to specified page number"""
-    current_url = driver.current_url
+def navigate_by_click(driver, page_number, current_url):
+    """Click the pagination button for page_number, or "Next", return True if the URL changed"""
+    # Attempt to navigate by clicking pagination button
+    try:
+        # Find and analyze all pagination elements
+        pagination_elements = find_pagination_elements(driver)
+
+        # First find the button for the specified page number
+        page_button = None
+        for el in pagination_elements:
+            if el["type"] == "page" and el["text"] == str(page_number + 1):
+                page_button = el
+                print(f"Found button for page {page_number+1}")
+                break
 
-    if page_number == 0:
-        # First page, visit directly
-        url = BASE_SEARCH_URL
-        print(f"Navigating to page 1: {url}")
-        driver.get(url)
-    else:
-        # Subsequent pages attempt to navigate using multiple methods
-        print(f"Attempting to navigate to page {page_number+1}")
+        # If the specified page number is not found, try using the "Next page" button
+        if not page_button and page_number > 0:
+            # Find the "Next page" button
+            next_buttons = [el for el in pagination_elements if el["type"] == "next"]
 
-        # First check if already on the correct page
-        if f"page={page_number+1}" in current_url:
-            print(f"Already on page {page_number+1}, no navigation needed")
-            return True
+            if next_buttons:
+                # Prioritize using non-disabled buttons
+                active_next_buttons = [
+                    btn for btn in next_buttons if not btn.get("is_disabled", False)
+                ]
+                if active_next_buttons:
+                    page_button = active_next_buttons[0]
+                    print(f"Found next page button: {page_button['text']}")
+                elif next_buttons:
+                    page_button = next_buttons[0]
+                    print(
+                        f"Found next page button (possibly disabled): {page_button['text']}"
+                    )
 
-        # Attempt to navigate by clicking pagination button
-        try:
-            # Find and analyze all pagination elements
-            pagination_elements = find_pagination_elements(driver)
-
-            # First find the button for the specified page number
-            page_button = None
-            for el in pagination_elements:
-                if el["type"] == "page" and el["text"] == str(page_number + 1):
-                    page_button = el
-                    print(f"Found button for page {page_number+1}")
-                    break
+        # Attempt to click the found button
+        if page_button:
+            element = page_button["element"]
+            # Scroll element into view
+            driver.execute_script(
+                "arguments[0].scrollIntoView({block: 'center'});", element
+            )
 
-            # If the specified page number is not found, try using the "Next page" button
-            if not page_button and page_number > 0:
-                # Find the "Next page" button
-                next_buttons = [
-                    el for el in pagination_elements if el["type"] == "next"
-                ]
+            try:
+                # Attempt to click the button
+                print(f"Attempting to click pagination element: {page_button['text']}")
+                element.click()
+                print(f"Pagination element clicked")
+
+                # Wait for URL to change
+                if wait_for_url_change(driver, current_url):
+                    print(f"URL changed: {driver.current_url}")
+                    return True
+                else:
+                    print("URL did not change after click, trying JavaScript click")
+                    # Attempt to use JavaScript click
+                    driver.execute_script("arguments[0].click();", element)
 
-                if next_buttons:
-                    # Prioritize using non-disabled buttons
-                    active_next_buttons = [
-                        btn for btn in next_buttons if not btn.get("is_disabled", False)
-                    ]
-                    if active_next_buttons:
-                        page_button = active_next_buttons[0]
-                        print(f"Found next page button: {page_button['text']}")
-                    elif next_buttons:
-                        page_button = next_buttons[0]
+                    # Check URL again
+                    if wait_for_url_change(driver, current_url):
                         print(
-                            f"Found next page button (possibly disabled): {page_button['text']}"
+                            f"URL changed after JavaScript click: {driver.current_url}"
                         )
+                        return True
 
-            # Attempt to click the found button
-            if page_button:
-                element = page_button["element"]
-                # Scroll element into view
-                driver.execute_script(
-                    "arguments[0].scrollIntoView({block: 'center'});", element
-                )
-                time.sleep(2)
-
+            except (
+                ElementNotInteractableException,
+                ElementClickInterceptedException,
+            ) as e:
+                print(f"Direct click failed: {str(e)}, trying JavaScript click")
                 try:
-                    # Attempt to click the button
-                    print(
-                        f"Attempting to click pagination element: {page_button['text']}"
-                    )
-                    element.click()
-                    print(f"Pagination element clicked")
-                    # Wait for page to load
-                    time.sleep(5)
+                    # Attempt to use JavaScript click
+                    driver.execute_script("arguments[0].click();", element)
 
                     # Check if URL changed
-                    new_url = driver.current_url
-                    if new_url != current_url:
-                        print(f"URL changed: {new_url}")
+                    if wait_for_url_change(driver, current_url):
+                        print(
+                            f"URL changed after JavaScript click: {driver.current_url}"
+                        )
                         return True
-                    else:
-                        print("URL did not change after click, trying JavaScript click")
-                        # Attempt to use JavaScript click
-                        driver.execute_script("arguments[0].click();", element)
-                        time.sleep(5)
-
-                        # Check URL again
-                        if driver.current_url != current_url:
-                            print(
-                                f"URL changed after JavaScript click: {driver.current_url}"
-                            )
-                            return True
+                except Exception as js_e:
+                    print(f"JavaScript click also failed: {str(js_e)}")
 
-                except (
-                    ElementNotInteractableException,
-                    ElementClickInterceptedException,
-                ) as e:
-                    print(f"Direct click failed: {str(e)}, trying JavaScript click")
-                    try:
-                        # Attempt to use JavaScript click
-                        driver.execute_script("arguments[0].click();", element)
-                        time.sleep(5)
+            except Exception as e:
+                print(f"Error clicking pagination element: {str(e)}")
 
-                        # Check if URL changed
-                        if driver.current_url != current_url:
-                            print(
-                                f"URL changed after JavaScript click: {driver.current_url}"
-                            )
-                            return True
-                    except Exception as js_e:
-                        print(f"JavaScript click also failed: {str(js_e)}")
+    except Exception as e:
+        print(f"Error navigating via pagination button: {str(e)}")
 
-                except Exception as e:
-                    print(f"Error clicking pagination element: {str(e)}")
+    return False
 
-        except Exception as e:
-            print(f"Error navigating via pagination button: {str(e)}")
+
+# Text of the first three result elements
+PAGE_SIGNATURE_SCRIPT = """
+return Array.from(document.querySelectorAll(arguments[0]))
+    .slice(0, 3)
+    .map((el) => el.innerText || "")
+    .join("\\n");
+"""
+
+
+def page_signature(driver):
+    """Text of the first result elements, tells apart pages with different results"""
+    return driver.execute_script(PAGE_SIGNATURE_SCRIPT, RESULT_ELEMENT_SELECTOR)
+
+
+# Confirmed pagination strategy ("url" or "click") and page 1 signature per search URL
+_pagination_strategies = {}
+_first_page_signatures = {}
+
+
+def pagination_strategy(search_url=None):
+    """Pagination strategy for a search, None until confirmed"""
+    if PAGINATION_MODE != "auto":
+        return PAGINATION_MODE
+    return _pagination_strategies.get(search_url or BASE_SEARCH_URL)
+
+
+def confirm_url_pagination(driver, page_number, search_url=None):
+    """Whether a page loaded by URL shows its own results rather than page 1 again"""
+    if f"page={page_number+1}" not in driver.current_url:
+        return False
+    signature = page_signature(driver)
+    if not signature:
+        return False
+    first_signature = _first_page_signatures.get(search_url or BASE_SEARCH_URL)
+    return first_signature is None or signature != first_signature
+
+
+def record_first_page_signature(driver, search_url=None):
+    """Load page 1 of a search and remember its results, for probing page URLs when the
+    crawl did not start at page 1"""
+    search_url = search_url or BASE_SEARCH_URL
+    print("Loading page 1 to compare page URLs against")
+    drain_api_responses(driver)
+    driver.get(get_search_url(0, search_url=search_url))
+    wait_for_results_ready(driver, RESULTS_PER_PAGE)
+    _first_page_signatures[search_url] = page_signature(driver)
+
+
+@profiled("navigate")
+def navigate_to_page(driver, page_number, direct=False, search_url=None):
+    """Navigate to specified page number of a search (BASE_SEARCH_URL by default),
+    direct=True skips click-based pagination"""
+    search_url = search_url or BASE_SEARCH_URL
+    current_url = driver.current_url
+    strategy = pagination_strategy(search_url)
+    probing = False
+
+    if page_number == 0:
+        # First page, visit directly with the configured page size
+        url = get_search_url(0, search_url=search_url)
+        print(f"Navigating to page 1: {url}")
+        drain_api_responses(driver)
+        driver.get(url)
+    elif direct or strategy != "click":
+        if strategy == "click":
+            print(
+                f"Page URLs do not load other pages of this search, cannot jump to page {page_number+1}"
+            )
+            return False
+        # Page URLs give random access to any page, unconfirmed until this page loads
+        probing = strategy is None
+        if probing and search_url not in _first_page_signatures:
+            # Resuming without page 1, whose results tell whether page URLs are honoured
+            record_first_page_signature(driver, search_url)
+        url = get_search_url(page_number, search_url=search_url)
+        print(f"Navigating to page {page_number+1}: {url}")
+        drain_api_responses(driver)
+        driver.get(url)
+    else:
+        # Subsequent pages attempt to navigate using multiple methods
+        print(f"Attempting to navigate to page {page_number+1}")
+
+        # First check if already on the correct page
+        if f"page={page_number+1}" in current_url:
+            print(f"Already on page {page_number+1}, no navigation needed")
+            return True
+
+        drain_api_responses(driver)
+        if navigate_by_click(driver, page_number, current_url):
+            return True
 
         # If click navigation fails, try direct URL navigation
         print("Navigation via button failed, attempting direct URL visit")
-        url = get_search_url(page_number)
+        url = get_search_url(page_number, search_url=search_url)
+        drain_api_responses(driver)
         driver.get(url)
 
-    # Wait for page to load (increased wait time)
+    # Wait until candidate information appears on the page and stops changing
     print(f"Waiting for page {page_number+1} to load...")
-    time.sleep(10)  # Wait 10 seconds first
-
-    # Check if page content actually loaded
-    try:
-        # Wait for candidate information to appear on the page
-        WebDriverWait(driver, 10).until(
-            lambda d: len(
-                d.find_elements(
-                    By.CSS_SELECTOR,
-                    "[class*='profile'], [class*='candidate'], [class*='card'], [class*='result-item']",
-                )
-            )
-            > 2
-        )
-    except TimeoutException:
+    if not wait_for_results_ready(driver, RESULTS_PER_PAGE):
         print(
             f"Timeout waiting for candidate information, attempting to refresh page..."
         )
         driver.refresh()
-        time.sleep(10)
-
-    # Scroll page to load all content
-    print(f"Scrolling page {page_number+1} to load all content...")
-    # Scroll multiple times to ensure all content is loaded
-    total_height = driver.execute_script("return document.body.scrollHeight")
-    for i in range(5):  # Increase scroll count
-        scroll_point = total_height * (i + 1) / 6
-        driver.execute_script(f"window.scrollTo(0, {scroll_point});")
-        print(f"Scrolled to position: {scroll_point}")
-        time.sleep(3)  # Wait a moment after each scroll
+        wait_for_results_ready(driver, RESULTS_PER_PAGE)
+
+    if page_number == 0 and strategy is None:
+        _first_page_signatures[search_url] = page_signature(driver)
+    elif probing:
+        if confirm_url_pagination(driver, page_number, search_url):
+            print("Page URLs work for this search, navigating by URL from now on")
+            _pagination_strategies[search_url] = "url"
+        else:
+            print("Page URL did not load the requested page, using pagination clicks")
+            _pagination_strategies[search_url] = "click"
+            # The browser shows another page's results, never report this page as loaded
+            if direct:
+                print(f"Cannot jump to page {page_number+1} without page URLs")
+                return False
+            driver.get(current_url)
+            wait_for_results_ready(driver, RESULTS_PER_PAGE)
+            drain_api_responses(driver)
+            if navigate_by_click(driver, page_number, current_url):
+                return True
+            print(f"Navigation via button failed, page {page_number+1} not loaded")
+            return False
 
-    # Scroll back to top
-    driver.execute_script("window.scrollTo(0, 0);")
-    time.sleep(2)
+    # Scroll page to load all content, API capture reads the data without lazy-loading cards
+    if EXTRACTION_MODE != "api":
+        print(f"Scrolling page {page_number+1} to load all content...")
+        scroll_to_load_all(driver, page_number, RESULTS_PER_PAGE)
 
     # Check if the page actually displays search results
-    profile_elements = driver.find_elements(
-        By.CSS_SELECTOR,
-        "[class*='profile'], [class*='candidate'], [class*='card'], [class*='result-item']",
-    )
+    profile_elements = driver.find_elements(By.CSS_SELECTOR, RESULT_ELEMENT_SELECTOR)
     print(f"Found {len(profile_elements)} potential candidate elements on the page")
 
     if len(profile_elements) < 3:
@@ -1077,6 +3270,7 @@ def navigate_to_page(driver, page_number):
     return True
 
 
+@profiled("clean_data")
 def clean_data(candidates):
     """Clean and check data quality"""
     cleaned = []
@@ -1208,6 +3402,8 @@ def merge_candidate_entries(entries):
 
     # Use first entry as base
     merged = entries[0].copy()
+    skills = set(merged["skills"])
+    queries = list(merged.get("queries", []))
 
     # Iterate over remaining entries to fill missing information
     for entry in entries[1:]:
@@ -1228,9 +3424,14 @@ def merge_candidate_entries(entries):
             ):
                 merged[field] = entry[field]
 
-        # Merge skills
-        if entry["skills"]:
-            merged["skills"] = sorted(list(set(merged["skills"] + entry["skills"])))
+        # Merge skills and the searches the candidate was found by
+        skills.update(entry["skills"])
+        queries.extend(name for name in entry.get("queries", []) if name not in queries)
+
+    if len(entries) > 1:
+        merged["skills"] = sorted(skills)
+        if queries:
+            merged["queries"] = queries
 
     # Ensure name is not "Unknown" if there are other identifier information
     if merged["name"] == "Unknown" and (merged["github"] or merged["linkedin"]):
@@ -1247,113 +3448,95 @@ def merge_candidate_entries(entries):
     return merged
 
 
-def remove_duplicates(candidates):
-    """Remove duplicate candidate information and merge related entries"""
-    print("Starting duplicate removal...")
+def normalize_profile_url(url):
+    """Normalize a GitHub or LinkedIn URL so trivial variants share one key"""
+    url = url.strip().lower()
+    url = re.sub(r"^https?://", "", url)
+    url = re.sub(r"^www\.", "", url)
+    return url.split("?")[0].split("#")[0].rstrip("/")
 
-    # First step: Group by GitHub and LinkedIn
-    grouped_by_links = {}
 
-    # First handle candidates with GitHub or LinkedIn
-    for candidate in candidates:
-        key = None
-        if candidate["github"]:
-            key = f"github:{candidate['github']}"
-        elif candidate["linkedin"]:
-            key = f"linkedin:{candidate['linkedin']}"
-
-        if key:
-            if key not in grouped_by_links:
-                grouped_by_links[key] = []
-            grouped_by_links[key].append(candidate)
-
-    # Second step: Group remaining candidates by name
-    name_grouped = {}
-    for candidate in candidates:
-        if (
-            candidate["name"] != "Unknown"
-            and not candidate["github"]
-            and not candidate["linkedin"]
-        ):
-            key = f"name:{candidate['name']}"
-            if key not in name_grouped:
-                name_grouped[key] = []
-            name_grouped[key].append(candidate)
-
-    # Third step: Merge entries
-    merged_candidates = []
-
-    # Merge GitHub/LinkedIn groups
-    for key, group in grouped_by_links.items():
-        if len(group) == 1:
-            merged_candidates.append(group[0])
-        else:
-            # Merge multiple entries
-            merged = merge_candidate_entries(group)
-            merged_candidates.append(merged)
-
-    # Merge name groups
-    for key, group in name_grouped.items():
-        if len(group) == 1:
-            # Check if this candidate already added via GitHub/LinkedIn
-            name = group[0]["name"]
-            is_duplicate = False
-            for cand in merged_candidates:
-                if cand["name"] == name:
-                    is_duplicate = True
-                    break
+def normalize_name(name):
+    """Normalize a candidate name for matching"""
+    return " ".join(name.split()).casefold()
 
-            if not is_duplicate:
-                merged_candidates.append(group[0])
-        else:
-            # Merge multiple entries
-            merged = merge_candidate_entries(group)
-
-            # Check if already exists
-            is_duplicate = False
-            for cand in merged_candidates:
-                if cand["name"] == merged["name"]:
-                    is_duplicate = True
-                    break
 
-            if not is_duplicate:
-                merged_candidates.append(merged)
+def remove_duplicates(candidates):
+    """Remove duplicate candidate information and merge related entries
 
-    # Add remaining unclassified candidates (no GitHub, LinkedIn, name Unknown cases)
-    position_grouped = {}
-    for candidate in candidates:
-        if (
-            candidate["name"] == "Unknown"
-            and not candidate["github"]
-            and not candidate["linkedin"]
-            and candidate["position"]
-            and len(candidate["position"]) > 10
-        ):
+    Entries are linked with union-find through hash indexes: entries sharing a GitHub or
+    LinkedIn URL always collapse into one record. Entries without profile links are
+    attached by name, or by (position, location, experience) when the name is unknown.
+    Entries without any of these identifiers are dropped.
+    """
+    print("Starting duplicate removal...")
 
-            # Use position and location as key
-            key = f"pos:{candidate['position']}|loc:{candidate['location']}"
-            if key not in position_grouped:
-                position_grouped[key] = []
-            position_grouped[key].append(candidate)
-
-    # Merge position groups unique entries
-    for key, group in position_grouped.items():
-        if len(group) > 0:
-            merged = merge_candidate_entries(group)
-
-            # Check if duplicate with existing entries (based on position and location)
-            is_duplicate = False
-            for cand in merged_candidates:
-                if (
-                    cand["position"] == merged["position"]
-                    and cand["location"] == merged["location"]
-                    and cand["experience"] == merged["experience"]
-                ):
-                    is_duplicate = True
-                    break
+    # Union-find over candidate indexes, the earliest entry stays the root
+    parent = list(range(len(candidates)))
+
+    def find(i):
+        while parent[i] != i:
+            parent[i] = parent[parent[i]]
+            i = parent[i]
+        return i
+
+    def union(i, j):
+        root_i, root_j = find(i), find(j)
+        if root_i != root_j:
+            parent[max(root_i, root_j)] = min(root_i, root_j)
+
+    keyed = [False] * len(candidates)
+    link_index = {}
+    name_index = {}
+    profile_index = {}
+
+    def profile_key(candidate):
+        return (candidate["position"], candidate["location"], candidate["experience"])
+
+    # First step: GitHub and LinkedIn link any two entries. Names and profiles are indexed
+    # from linked entries first, so entries without links join a linked entry when one
+    # exists, wherever it appears in the list
+    for i, candidate in enumerate(candidates):
+        if not candidate["github"] and not candidate["linkedin"]:
+            continue
+        for field in ["github", "linkedin"]:
+            if candidate[field]:
+                key = (field, normalize_profile_url(candidate[field]))
+                union(i, link_index.setdefault(key, i))
+        keyed[i] = True
+        if candidate["name"] != "Unknown":
+            name_index.setdefault(normalize_name(candidate["name"]), i)
+        if candidate["position"]:
+            profile_index.setdefault(profile_key(candidate), i)
 
-            if not is_duplicate:
-                merged_candidates.append(merged)
+    # Second step: attach entries without links by name.
+    # Two entries with different profile links are never merged just for sharing a name
+    for i, candidate in enumerate(candidates):
+        if keyed[i] or candidate["name"] == "Unknown":
+            continue
+        union(i, name_index.setdefault(normalize_name(candidate["name"]), i))
+        keyed[i] = True
+        if candidate["position"]:
+            profile_index.setdefault(profile_key(candidate), i)
+
+    # Third step: attach unnamed entries without links by position and location
+    for i, candidate in enumerate(candidates):
+        if keyed[i] or candidate["github"] or candidate["linkedin"]:
+            continue
+        if candidate["position"] and len(candidate["position"]) > 10:
+            union(i, profile_index.setdefault(profile_key(candidate), i))
+            keyed[i] = True
+
+    # Finally merge each group, in order of first appearance
+    groups = {}
+    for i in range(len(candidates)):
+        if keyed[i]:
+            groups.setdefault(find(i), []).append(candidates[i])
+
+    merged_candidates = [
+        group[0] if len(group) == 1 else merge_candidate_entries(group)
+        for group in groups.values()
+    ]
 
     print(
         f"Before removing duplicates: {len(candidates)} records, After removing duplicates: {len(merged_candidates)} records"
@@ -1361,113 +3544,1437 @@ def remove_duplicates(candidates):
     return merged_candidates
 
 
-def main():
-    """Run main program, complete login and data scraping"""
+def append_candidates_to_stream(candidates, stream_file=STREAM_FILE):
+    """Append one page of cleaned candidates to the NDJSON stream and fsync it"""
+    with open(stream_file, "a", encoding="utf-8") as f:
+        for candidate in candidates:
+            f.write(json.dumps(candidate, ensure_ascii=False) + "\n")
+        f.flush()
+        os.fsync(f.fileno())
+
+
+def read_candidate_stream(stream_file=STREAM_FILE):
+    """Yield candidates from the NDJSON stream, skipping a line cut off by a crash"""
+    with open(stream_file, "r", encoding="utf-8") as f:
+        for line_number, line in enumerate(f, 1):
+            if not line.strip():
+                continue
+            try:
+                yield json.loads(line)
+            except json.JSONDecodeError:
+                print(f"Skipping incomplete line {line_number} in {stream_file}")
+
+
+def write_unique_candidates(all_candidates, output_file=OUTPUT_FILE):
+    """Deduplicate candidates in page order and write the final JSON array"""
+    # Keep page order stable whatever order the pages were written in
+    all_candidates.sort(key=lambda candidate: candidate["page"])
+
+    # Remove duplicates
+    unique_candidates = remove_duplicates(all_candidates)
+
+    # Save results to JSON file, replace the previous file only once fully written
+    temp_file = f"{output_file}.tmp"
+    with open(temp_file, "w", encoding="utf-8") as f:
+        json.dump(unique_candidates, f, ensure_ascii=False, indent=2)
+    os.replace(temp_file, output_file)
+    return unique_candidates
+
+
+def compact_candidate_stream(stream_file=STREAM_FILE, output_file=OUTPUT_FILE):
+    """Deduplicate the NDJSON stream and write the final JSON array"""
+    return write_unique_candidates(
+        list(read_candidate_stream(stream_file)), output_file
+    )
+
+
+def parse_experience_years(experience):
+    """Years of experience as a number ("8 years" -> 8.0), None when not stated"""
+    match = re.search(r"\d+(?:\.\d+)?", experience or "")
+    return float(match.group()) if match else None
+
+
+def candidates_to_table(candidates):
+    """Build a pyarrow table of candidates: skills and queries as list columns, page and
+    experience_years numeric, location dictionary-encoded"""
+    string_fields = [
+        "name",
+        "position",
+        "experience",
+        "github",
+        "linkedin",
+        "education",
+    ]
+    columns = {
+        "page": pyarrow.array(
+            [candidate["page"] for candidate in candidates], pyarrow.int32()
+        ),
+        "experience_years": pyarrow.array(
+            [
+                parse_experience_years(candidate["experience"])
+                for candidate in candidates
+            ],
+            pyarrow.float32(),
+        ),
+        # Few distinct locations, stored once each
+        "location": pyarrow.array(
+            [candidate["location"] for candidate in candidates], pyarrow.string()
+        ).dictionary_encode(),
+        "skills": pyarrow.array(
+            [candidate["skills"] for candidate in candidates],
+            pyarrow.list_(pyarrow.string()),
+        ),
+        "queries": pyarrow.array(
+            [candidate.get("queries", []) for candidate in candidates],
+            pyarrow.list_(pyarrow.string()),
+        ),
+    }
+    for field in string_fields:
+        columns[field] = pyarrow.array(
+            [candidate[field] for candidate in candidates], pyarrow.string()
+        )
+    order = ["page", "name", "position", "experience", "experience_years"]
+    order += ["location", "github", "linkedin", "education", "skills", "queries"]
+    return pyarrow.table({name: columns[name] for name in order})
+
+
+def export_candidates(candidates, export_format, output_file=None):
+    """Write candidates to a Parquet or Arrow IPC file next to the JSON output"""
+    if pyarrow is None:
+        print(f"pyarrow is not installed, skipping the {export_format} export")
+        return None
+    output_file = output_file or EXPORT_FILES[export_format]
+    table = candidates_to_table(candidates)
+    temp_file = f"{output_file}.tmp"
+    if export_format == "parquet":
+        pyarrow.parquet.write_table(table, temp_file, compression="zstd")
+    else:
+        pyarrow.feather.write_feather(table, temp_file, compression="zstd")
+    os.replace(temp_file, output_file)
+    print(f"{len(candidates)} candidates exported to {output_file}")
+    return output_file
+
+
+def compress_page(data, compression):
+    """Compress page bytes with zstd or gzip"""
+    level = ARCHIVE_COMPRESSION_LEVELS[compression]
+    if compression == "zstd":
+        return zstandard.ZstdCompressor(level=level).compress(data)
+    return gzip.compress(data, compresslevel=level)
+
+
+def read_page_file(path):
+    """Read a saved results page, plain or compressed by the page archive"""
+    with open(path, "rb") as f:
+        data = f.read()
+    if path.endswith(ARCHIVE_EXTENSIONS["zstd"]):
+        if zstandard is None:
+            raise RuntimeError(f"The zstandard package is needed to read {path}")
+        data = zstandard.ZstdDecompressor().decompress(data)
+    elif path.endswith(ARCHIVE_EXTENSIONS["gzip"]):
+        data = gzip.decompress(data)
+    return data.decode("utf-8")
+
+
+class PageArchive:
+    """Raw results pages, compressed and content-addressed, indexed by search and page
+
+    Each distinct page content is stored once as objects/<hash[:2]>/<hash>.html.zst (or
+    .gz), so pages that did not change between crawls or retries cost nothing. Every
+    stored page appends a line to index.jsonl; the last line for a (query, page) wins.
+    """
+
+    def __init__(self, directory=ARCHIVE_DIR, compression=ARCHIVE_COMPRESSION):
+        if compression == "zstd" and zstandard is None:
+            compression = "gzip"
+        self.directory = directory
+        self.compression = compression
+        self.index_file = os.path.join(directory, "index.jsonl")
+        self.entries = {}
+        self._lock = threading.Lock()
+
+    def load(self):
+        if not os.path.exists(self.index_file):
+            return self
+        with open(self.index_file, "r", encoding="utf-8") as f:
+            for line in f:
+                if not line.strip():
+                    continue
+                try:
+                    entry = json.loads(line)
+                except json.JSONDecodeError:
+                    continue
+                self.entries[(entry["query"], entry["page"])] = entry
+        print(f"Loaded {len(self.entries)} archived pages from {self.directory}")
+        return self
+
+    def object_path(self, content_hash, compression=None):
+        extension = ARCHIVE_EXTENSIONS[compression or self.compression]
+        return os.path.join(
+            self.directory,
+            "objects",
+            content_hash[:2],
+            f"{content_hash}.html{extension}",
+        )
+
+    def find_object(self, content_hash):
+        """Path of a stored page content whatever it was compressed with, or None"""
+        for compression in ARCHIVE_EXTENSIONS:
+            path = self.object_path(content_hash, compression)
+            if os.path.exists(path):
+                return path
+        return None
+
+    def put(self, query, page_number, content, kind="page"):
+        """Store a page's content unless the same content is already stored, and index it"""
+        data = content.encode("utf-8")
+        content_hash = hashlib.sha256(data).hexdigest()
+        path = self.find_object(content_hash)
+        if path is None:
+            path = self.object_path(content_hash)
+            os.makedirs(os.path.dirname(path), exist_ok=True)
+            # Parallel workers may store the same content at once, each writes its own file
+            temp_path = f"{path}.{threading.get_ident()}.tmp"
+            with open(temp_path, "wb") as f:
+                f.write(compress_page(data, self.compression))
+            os.replace(temp_path, path)
+        entry = {
+            "query": query,
+            "page": page_number,
+            "hash": content_hash,
+            "kind": kind,
+            "size": len(data),
+            "stored_size": os.path.getsize(path),
+            "saved_at": time.time(),
+        }
+        with self._lock:
+            with open(self.index_file, "a", encoding="utf-8") as f:
+                f.write(json.dumps(entry) + "\n")
+            self.entries[(query, page_number)] = entry
+        return entry
+
+    def read(self, content_hash):
+        path = self.find_object(content_hash)
+        if path is None:
+            raise KeyError(f"Page {content_hash} is not in {self.directory}")
+        return read_page_file(path)
+
+    def get(self, query, page_number):
+        """Return the last archived content of a page, or None"""
+        entry = self.entries.get((query, page_number))
+        return self.read(entry["hash"]) if entry else None
+
+    def saved_pages(self):
+        """Return (page_number, object path) for every indexed page, ordered by search and
+        page"""
+        return [
+            (page_number, self.find_object(entry["hash"]))
+            for (_, page_number), entry in sorted(self.entries.items())
+        ]
+
+    def print_summary(self):
+        hashes = {entry["hash"]: entry for entry in self.entries.values()}
+        size = sum(entry["size"] for entry in self.entries.values())
+        stored_size = sum(entry["stored_size"] for entry in hashes.values())
+        print(
+            f"Page archive {self.directory}: {len(self.entries)} pages in {len(hashes)} objects, "
+            f"{size / 2**20:.1f} MB of HTML stored in {stored_size / 2**20:.2f} MB"
+        )
+
+
+# Concatenated outerHTML of the outermost elements matching the first selector that matches
+CARD_FRAGMENT_SCRIPT = """
+const selectors = arguments[0];
+for (const selector of selectors) {
+    const nodes = Array.from(document.querySelectorAll(selector)).filter(
+        (node) => !node.parentElement || !node.parentElement.closest(selector)
+    );
+    if (nodes.length) {
+        return nodes.map((node) => node.outerHTML).join("\\n");
+    }
+}
+return null;
+"""
+
+
+def capture_card_fragments(driver):
+    """Return the card elements of the cached page layout as a minimal HTML document, or
+    None when there is no card or row layout to go by"""
+    layout = _page_layout
+    if not layout or layout["strategy"] not in ["cards", "rows"]:
+        return None
+    fragments = driver.execute_script(CARD_FRAGMENT_SCRIPT, layout["selectors"])
+    if not fragments:
+        return None
+    return f"<html><body>\n{fragments}\n</body></html>"
+
+
+def archive_page(driver, page_number, search_url=None, html=None):
+    """Store the loaded results page in the page archive when --archive is on
+
+    html is the page source when the caller already has it.
+    """
+    if _page_archive is None:
+        return
     try:
-        # Set up WebDriver, use the version that disables images
-        driver = setup_driver_no_image()
+        content, kind = None, "page"
+        if ARCHIVE_CONTENT == "cards":
+            content, kind = capture_card_fragments(driver), "cards"
+        if content is None:
+            content, kind = html or driver.page_source, "page"
+        _page_archive.put(checkpoint_query(search_url), page_number, content, kind)
+    except Exception as e:
+        print(f"Error archiving page {page_number+1}: {str(e)}")
+
+
+def list_saved_pages(directory):
+    """Return (page_number, path) for every saved results page in a directory, in page
+    order
+
+    A page archive directory lists the pages of its index. Otherwise files without a
+    number in their name are numbered after the last numbered page.
+    """
+    if os.path.exists(os.path.join(directory, "index.jsonl")):
+        return PageArchive(directory).load().saved_pages()
+    numbered = []
+    unnumbered = []
+    for filename in sorted(os.listdir(directory)):
+        stem, extension = os.path.splitext(filename)
+        if extension.lower() not in SAVED_PAGE_EXTENSIONS:
+            continue
+        path = os.path.join(directory, filename)
+        numbers = re.findall(r"\d+", stem)
+        if numbers:
+            numbered.append((int(numbers[-1]) - 1, path))
+        else:
+            unnumbered.append(path)
+    numbered.sort()
+    next_page = numbered[-1][0] + 1 if numbered else 0
+    return numbered + [
+        (next_page + index, path) for index, path in enumerate(unnumbered)
+    ]
 
-        # Get login credentials
-        email = input("Please enter your getprog.ai login email: ")
-        password = getpass.getpass("Please enter your password: ")
 
-        # Try to login
-        login_success = login(driver, email, password)
+def _init_reextract_worker(results_per_page):
+    global RESULTS_PER_PAGE
+    RESULTS_PER_PAGE = results_per_page
+    with redirect_stdout(io.StringIO()):
+        _selector_learner.load(SELECTOR_STATS_FILE)
 
-        if not login_success:
-            print("Login failed, please check credentials and try again.")
-            driver.quit()
+
+def reextract_saved_page(page_number, path):
+    """Extract and clean the candidates of one saved results page, in a worker process"""
+    html = read_page_file(path)
+    # Per-page progress would interleave across processes, only errors are reported
+    log = io.StringIO()
+    with redirect_stdout(log):
+        candidates = clean_data(
+            extract_candidate_info_from_html(html, page_number, SEARCH_RESULTS_URL)
+        )
+    errors = [line for line in log.getvalue().splitlines() if "Error" in line]
+    return candidates, errors
+
+
+def reextract_saved_pages(directory, output_file=OUTPUT_FILE, processes=None):
+    """Re-run extraction, clean_data and remove_duplicates over a directory of saved
+    results pages with a process pool, write the result like a crawl does
+
+    No browser or login is needed, so improved parsing heuristics can be applied to
+    earlier crawls.
+    """
+    pages = list_saved_pages(directory)
+    if not pages:
+        print(f"No saved results pages found in {directory}")
+        return []
+    processes = processes or REEXTRACT_PROCESSES or os.cpu_count() or 1
+    print(f"Re-extracting {len(pages)} saved pages with {processes} processes...")
+
+    start = time.perf_counter()
+    all_candidates = []
+    # Large chunks keep inter-process overhead low, enough of them to balance the load
+    chunksize = max(1, len(pages) // (processes * 4))
+    with ProcessPoolExecutor(
+        processes, initializer=_init_reextract_worker, initargs=(RESULTS_PER_PAGE,)
+    ) as executor:
+        results = executor.map(
+            reextract_saved_page,
+            [page_number for page_number, _ in pages],
+            [path for _, path in pages],
+            chunksize=chunksize,
+        )
+        for (page_number, path), (candidates, errors) in zip(pages, results):
+            for error in errors:
+                print(f"{os.path.basename(path)}: {error}")
+            if not candidates:
+                print(f"No candidates found on page {page_number+1} ({path})")
+            all_candidates.extend(candidates)
+    elapsed = time.perf_counter() - start
+    print(
+        f"Extracted {len(all_candidates)} candidates from {len(pages)} pages in {elapsed:.2f}s"
+    )
+    return write_unique_candidates(all_candidates, output_file)
+
+
+def candidates_hash(candidates):
+    """Content hash of a page of candidates"""
+    content = json.dumps(candidates, ensure_ascii=False, sort_keys=True)
+    return hashlib.sha256(content.encode("utf-8")).hexdigest()
+
+
+def _append_checkpoint(record, checkpoint_file):
+    with open(checkpoint_file, "a", encoding="utf-8") as f:
+        f.write(json.dumps(record, ensure_ascii=False) + "\n")
+        f.flush()
+        os.fsync(f.fileno())
+
+
+def record_page_checkpoint(
+    search_url, page_number, candidates, checkpoint_file=CHECKPOINT_FILE
+):
+    """Record a finished page, a page without candidates is recorded as failed"""
+    _append_checkpoint(
+        {
+            "query": search_url,
+            "page": page_number,
+            "status": "done" if candidates else "failed",
+            "count": len(candidates),
+            "hash": candidates_hash(candidates),
+            "finished_at": time.time(),
+        },
+        checkpoint_file,
+    )
+
+
+def reset_checkpoint(search_url, checkpoint_file=CHECKPOINT_FILE):
+    """Forget finished pages of a search URL, used when a fresh crawl starts"""
+    _append_checkpoint(
+        {"query": search_url, "status": "reset", "finished_at": time.time()},
+        checkpoint_file,
+    )
+
+
+def load_checkpoint(search_url, checkpoint_file=CHECKPOINT_FILE):
+    """Return the latest journal record of each page of a search URL"""
+    pages = {}
+    if not os.path.exists(checkpoint_file):
+        return pages
+    with open(checkpoint_file, "r", encoding="utf-8") as f:
+        for line in f:
+            try:
+                record = json.loads(line)
+            except json.JSONDecodeError:
+                continue  # Line cut off by a crash
+            if record.get("query") != search_url:
+                continue
+            if record["status"] == "reset":
+                pages = {}
+            else:
+                pages[record["page"]] = record
+    return pages
+
+
+def candidate_identity_keys(candidate):
+    """Keys identifying a candidate across runs, same rules as remove_duplicates
+
+    Profile links identify a candidate on their own, name and position only count for
+    entries without links.
+    """
+    keys = [
+        f"{field}:{normalize_profile_url(candidate[field])}"
+        for field in ["github", "linkedin"]
+        if candidate.get(field)
+    ]
+    if not keys and candidate.get("name", "Unknown") != "Unknown":
+        keys.append(
+            f"name:{normalize_name(candidate['name'])}|{candidate.get('position', '')}"
+        )
+    return keys
+
+
+def candidate_content_hash(candidate):
+    """Content hash of a candidate's profile fields, ignoring where it was found"""
+    content = {
+        field: value
+        for field, value in candidate.items()
+        if field not in ["page", "queries"]
+    }
+    content["skills"] = sorted(content.get("skills", []))
+    for field in ["github", "linkedin"]:
+        content[field] = normalize_profile_url(content.get(field, ""))
+    return candidates_hash([content])
+
+
+class KnownCandidateIndex:
+    """Identity keys and content hashes of candidates seen by earlier crawls"""
+
+    def __init__(self):
+        self.hashes = {}
+        self.new = []
+        self.changed = []
+
+    def load(self, path=KNOWN_CANDIDATES_FILE):
+        if not os.path.exists(path):
             return
+        with open(path, "r", encoding="utf-8") as f:
+            self.hashes = json.load(f)["hashes"]
+        print(f"Loaded {len(self.hashes)} known candidate keys from {path}")
+
+    def save(self, path=KNOWN_CANDIDATES_FILE):
+        temp_path = f"{path}.tmp"
+        with open(temp_path, "w", encoding="utf-8") as f:
+            json.dump({"updated_at": time.time(), "hashes": self.hashes}, f)
+        os.replace(temp_path, path)
+
+    def classify(self, candidates):
+        """Sort a page into new, changed and unchanged candidates and remember them all
+
+        Returns (new, changed, unchanged) counts.
+        """
+        counts = [0, 0, 0]
+        for candidate in candidates:
+            keys = candidate_identity_keys(candidate)
+            if not keys:
+                continue
+            content_hash = candidate_content_hash(candidate)
+            known = [self.hashes[key] for key in keys if key in self.hashes]
+            if not known:
+                self.new.append(candidate)
+                counts[0] += 1
+            elif any(known_hash != content_hash for known_hash in known):
+                self.changed.append(candidate)
+                counts[1] += 1
+            else:
+                counts[2] += 1
+            for key in keys:
+                self.hashes[key] = content_hash
+        return tuple(counts)
+
+    def write_changes(self, path=CHANGES_FILE):
+        """Save the new and changed candidates found by this run"""
+        with open(path, "w", encoding="utf-8") as f:
+            json.dump(
+                {"new": self.new, "changed": self.changed},
+                f,
+                ensure_ascii=False,
+                indent=2,
+            )
+
+
+class KnownPageRuns:
+    """Pages of each search holding only known, unchanged candidates, by page number
+
+    Parallel and pipelined crawls finish pages out of order, so runs are counted over
+    neighbouring page numbers rather than over the order pages arrive in.
+    """
+
+    def __init__(self):
+        self.pages = {}
+
+    def record(self, search_url, page_number, known):
+        """Remember whether a page held only known candidates, returns the length of the
+        run of consecutive known pages through it"""
+        pages = self.pages.setdefault(search_url, {})
+        pages[page_number] = known
+        if not known:
+            return 0
+        first = page_number
+        while pages.get(first - 1):
+            first -= 1
+        last = page_number
+        while pages.get(last + 1):
+            last += 1
+        return last - first + 1
+
+
+def page_complete(candidates):
+    """Whether a page yielded enough candidates to be accepted without a retry"""
+    return len(candidates) >= RESULTS_PER_PAGE * MIN_PAGE_COMPLETENESS
 
-        # Scrape multiple pages of candidate information
-        all_candidates = []
-        page_number = 0
-        max_pages = 3  # We want exactly 3 pages
-        max_retries = 3  # Maximum number of retries per page
-        retry_delay = 10  # Seconds to wait between retries
-
-        # Main scraping loop
-        while page_number < max_pages:
-            print(f"\n==== Processing page {page_number+1} ====")
-            retry_count = 0
-            page_success = False
-
-            while retry_count < max_retries and not page_success:
-                # Navigate to specified page
-                page_loaded = navigate_to_page(driver, page_number)
-
-                # If page load fails, session might have expired, try to login again
-                if not page_loaded:
-                    print("Page load failed, trying to login again...")
-                    login_success = login(driver, email, password)
-                    if login_success:
-                        # Try navigation again
-                        page_loaded = navigate_to_page(driver, page_number)
-                        if not page_loaded:
-                            print(
-                                f"Still unable to load page {page_number+1} after re-login"
-                            )
-                            retry_count += 1
-                            if retry_count < max_retries:
-                                print(
-                                    f"Retrying in {retry_delay} seconds... (Attempt {retry_count + 1}/{max_retries})"
-                                )
-                                time.sleep(retry_delay)
-                            continue
-                    else:
-                        print("Re-login failed, terminating program")
-                        break
 
+def open_page(driver, page_number, credentials, direct=False, search_url=None):
+    """Navigate to a page of a search, logging in again if the session has expired
+
+    Returns True once the page loaded, False if it still failed after re-login and None
+    if re-login failed.
+    """
+    if navigate_to_page(driver, page_number, direct, search_url):
+        return True
+
+    # If page load fails, session might have expired, try to login again
+    print("Page load failed, trying to login again...")
+    if not ensure_logged_in(driver, credentials):
+        print("Re-login failed")
+        return None
+
+    # Try navigation again
+    if navigate_to_page(driver, page_number, direct, search_url):
+        return True
+    print(f"Still unable to load page {page_number+1} after re-login")
+    return False
+
+
+def scrape_page(
+    driver,
+    page_number,
+    credentials,
+    direct=False,
+    search_url=None,
+    max_retries=MAX_PAGE_RETRIES,
+    retry_delay=RETRY_DELAY,
+):
+    """Navigate to a page of a search and return its cleaned candidates, retrying and
+    re-logging in
+
+    Returns an empty list if the page kept failing, or None if re-login failed.
+    """
+    with profile_phase("page", page_number):
+        retry_count = 0
+        while retry_count < max_retries:
+            # Navigate to specified page
+            page_loaded = open_page(
+                driver, page_number, credentials, direct, search_url
+            )
+            if page_loaded is None:
+                return None
+
+            if page_loaded:
                 # Extract candidate information
                 candidates = extract_candidate_info_from_page(driver, page_number)
+                archive_page(driver, page_number, search_url)
 
                 # Check if we got enough candidates
-                if (
-                    len(candidates) >= RESULTS_PER_PAGE * 0.8
-                ):  # At least 80% of expected candidates
-                    page_success = True
-                    # Clean data
-                    candidates = clean_data(candidates)
-                    # Add to total list
-                    all_candidates.extend(candidates)
-                    print(
-                        f"Page {page_number+1}: Retrieved {len(candidates)} candidates, Total: {len(all_candidates)}"
-                    )
-                    page_number += 1
-                else:
-                    print(
-                        f"Retrieved only {len(candidates)} candidates, expected {RESULTS_PER_PAGE}"
+                if page_complete(candidates):
+                    return clean_data(candidates)
+
+                print(
+                    f"Retrieved only {len(candidates)} candidates, expected {RESULTS_PER_PAGE}"
+                )
+            retry_count += 1
+            if retry_count < max_retries:
+                print(
+                    f"Retrying in {retry_delay} seconds... (Attempt {retry_count + 1}/{max_retries})"
+                )
+                pause(retry_delay)
+
+        print(
+            f"Failed to get enough candidates after {max_retries} attempts, moving to next page"
+        )
+        return []
+
+
+@profiled("autotune")
+def autotune_page_size(driver, sizes=PAGE_SIZE_CANDIDATES):
+    """Load the first page at each size and set RESULTS_PER_PAGE to the size with the most
+    candidates per second among those that returned a complete page
+
+    The time per page includes PAGE_DELAY, which larger pages pay less often.
+    """
+    global RESULTS_PER_PAGE
+    configured_size = RESULTS_PER_PAGE
+
+    # Warm up the browser cache so the first size is not measured cold
+    navigate_to_page(driver, 0)
+
+    results = []
+    for size in sizes:
+        RESULTS_PER_PAGE = size
+        start = time.perf_counter()
+        loaded = navigate_to_page(driver, 0)
+        candidates = extract_candidate_info_from_page(driver, 0) if loaded else []
+        elapsed = time.perf_counter() - start
+        complete = len(candidates) >= size * MIN_PAGE_COMPLETENESS
+        throughput = len(candidates) / (elapsed + PAGE_DELAY)
+        results.append({"size": size, "complete": complete, "throughput": throughput})
+        print(
+            f"Page size {size}: {len(candidates)} candidates in {elapsed:.2f}s, "
+            f"{throughput:.2f} candidates/sec{'' if complete else ', truncated'}"
+        )
+
+    complete_results = [result for result in results if result["complete"]]
+    if complete_results:
+        best = max(complete_results, key=lambda result: result["throughput"])
+        RESULTS_PER_PAGE = best["size"]
+        print(f"Using page size {RESULTS_PER_PAGE}")
+    else:
+        RESULTS_PER_PAGE = configured_size
+        print(f"No page size returned complete pages, keeping {RESULTS_PER_PAGE}")
+    return RESULTS_PER_PAGE
+
+
+def process_tree_rss_mb(pid):
+    """Resident memory of a process and all its descendants in MB, None without /proc"""
+    if not os.path.isdir("/proc"):
+        return None
+    children = {}
+    resident = {}
+    page_size = os.sysconf("SC_PAGE_SIZE")
+    for entry in os.listdir("/proc"):
+        if not entry.isdigit():
+            continue
+        try:
+            with open(f"/proc/{entry}/stat", "r") as f:
+                stat = f.read()
+            with open(f"/proc/{entry}/statm", "r") as f:
+                pages = int(f.read().split()[1])
+        except (OSError, IndexError, ValueError):
+            # The process exited while being read
+            continue
+        # The command name may contain spaces, the parent pid follows it and the state
+        parent = int(stat.rsplit(")", 1)[1].split()[1])
+        children.setdefault(parent, []).append(int(entry))
+        resident[int(entry)] = pages * page_size
+    if pid not in resident:
+        return None
+    total = 0
+    pending = [pid]
+    while pending:
+        current = pending.pop()
+        total += resident.get(current, 0)
+        pending.extend(children.get(current, []))
+    return total / 2**20
+
+
+class DriverPool:
+    """Logged-in browsers lent to the crawl and recycled before they grow too large
+
+    Each slot holds one browser. borrow(slot) lends it for one page; afterwards the pool
+    counts the page and reads the memory of the browser. As the browser nears
+    DRIVER_MAX_PAGES or DRIVER_MAX_MEMORY_MB a replacement is started in the background,
+    restoring the freshly saved session, and once a limit is reached the two are swapped.
+    Recycling therefore neither waits for Chrome to start nor logs in again. A replacement
+    that fails to start is retried in the background, and once more in the foreground at
+    the limit. If that fails too, the old browser is quit and the slot is left empty; the
+    next borrow starts a new browser and lends None when it cannot, so the page just
+    scraped is never lost to a recycling error.
+    """
+
+    def __init__(
+        self,
+        size=1,
+        credentials=None,
+        profile_root=None,
+        max_pages=DRIVER_MAX_PAGES,
+        max_memory_mb=DRIVER_MAX_MEMORY_MB,
+    ):
+        self.credentials = credentials if credentials is not None else {}
+        self.profile_root = profile_root
+        self.max_pages = max_pages
+        self.max_memory_mb = max_memory_mb
+        self.slots = [
+            {
+                "driver": None,
+                "pages": 0,
+                "generation": 0,
+                "spare": None,
+                "warming": None,
+            }
+            for _ in range(size)
+        ]
+
+    def _profile_dir(self, slot, generation):
+        if not self.profile_root:
+            return None
+        # Alternate between two directories, Chrome locks the one a running browser uses
+        suffix = "" if generation % 2 == 0 else "_b"
+        return os.path.join(self.profile_root, f"worker_{slot+1}{suffix}")
+
+    def _new_driver(self, slot, generation):
+        driver = setup_driver_no_image(self._profile_dir(slot, generation))
+        if not ensure_logged_in(driver, self.credentials):
+            driver.quit()
+            return None
+        driver.execute_cdp_cmd("Performance.enable", {})
+        return driver
+
+    def start(self, slot=0):
+        """Start and log in the browser of a slot, return False if login failed"""
+        self.slots[slot]["driver"] = self._new_driver(slot, 0)
+        return self.slots[slot]["driver"] is not None
+
+    def memory_mb(self, driver):
+        """Resident memory of the driver's browser processes in MB, the JS heap of its tab
+        where process memory cannot be read"""
+        try:
+            memory = process_tree_rss_mb(driver.service.process.pid)
+        except AttributeError:
+            memory = None
+        if memory is not None:
+            return memory
+        metrics = driver.execute_cdp_cmd("Performance.getMetrics", {})["metrics"]
+        values = {metric["name"]: metric["value"] for metric in metrics}
+        return values.get("JSHeapTotalSize", 0) / 2**20
+
+    @contextmanager
+    def borrow(self, slot=0):
+        """Lend the browser of a slot for one page, None when no browser could be started"""
+        state = self.slots[slot]
+        if state["driver"] is None:
+            self._restart(slot)
+        try:
+            yield state["driver"]
+        finally:
+            if state["driver"] is not None:
+                state["pages"] += 1
+                # Recycling errors must not hide the page's own result or exception
+                try:
+                    self._maintain(slot)
+                except Exception as e:
+                    print(f"Error recycling browser {slot+1}: {str(e)}")
+
+    def _restart(self, slot):
+        state = self.slots[slot]
+        print(f"Starting a new browser {slot+1}")
+        try:
+            state["driver"] = self._new_driver(slot, state["generation"] + 1)
+        except Exception as e:
+            print(f"Error starting browser {slot+1}: {str(e)}")
+        if state["driver"] is None:
+            print(f"No browser left in slot {slot+1}")
+            return
+        state["pages"] = 0
+        state["generation"] += 1
+
+    def _maintain(self, slot):
+        state = self.slots[slot]
+        try:
+            memory = self.memory_mb(state["driver"])
+        except Exception:
+            memory = 0
+
+        warming = state["warming"]
+        if warming is not None and not warming.is_alive() and state["spare"] is None:
+            # The replacement failed to start, try again while the old browser works on
+            print(f"Retrying the replacement of browser {slot+1}")
+            state["warming"] = None
+
+        if state["warming"] is None and (
+            state["pages"] >= self.max_pages * DRIVER_PREWARM_AT
+            or memory >= self.max_memory_mb * DRIVER_PREWARM_AT
+        ):
+            self._prewarm(slot)
+
+        if state["pages"] >= self.max_pages or memory >= self.max_memory_mb:
+            print(
+                f"Recycling browser {slot+1} after {state['pages']} pages, {memory:.0f} MB"
+            )
+            self._recycle(slot)
+
+    def _prewarm(self, slot):
+        state = self.slots[slot]
+        # The replacement restores the session as it is now
+        try:
+            save_session(state["driver"])
+        except Exception as e:
+            print(f"Could not save session before recycling: {str(e)}")
+
+        def warm():
+            try:
+                state["spare"] = self._new_driver(slot, state["generation"] + 1)
+            except Exception as e:
+                print(f"Error starting replacement browser {slot+1}: {str(e)}")
+
+        state["warming"] = threading.Thread(target=warm, daemon=True)
+        state["warming"].start()
+
+    def _recycle(self, slot):
+        state = self.slots[slot]
+        state["warming"].join()
+        state["warming"] = None
+        spare, state["spare"] = state["spare"], None
+        if spare is None:
+            print(f"Replacement browser {slot+1} failed to start, starting another one")
+            try:
+                spare = self._new_driver(slot, state["generation"] + 1)
+            except Exception as e:
+                print(f"Error starting replacement browser {slot+1}: {str(e)}")
+        old_driver = state["driver"]
+        # Without a replacement the slot is left empty, the next borrow tries again
+        state["driver"] = spare
+        state["pages"] = 0
+        state["generation"] += 1
+        try:
+            old_driver.quit()
+        except:
+            pass
+
+    def close(self, slot=None):
+        """Quit the browsers of one slot or of all, including replacements still starting"""
+        for state in self.slots if slot is None else [self.slots[slot]]:
+            if state["warming"] is not None:
+                state["warming"].join()
+            for driver in [state["driver"], state["spare"]]:
+                if driver:
+                    try:
+                        driver.quit()
+                    except:
+                        pass
+            state["driver"] = state["spare"] = state["warming"] = None
+
+
+def crawl_pages_sequential(pool, tasks, credentials, stopped_queries=None):
+    """Scrape (search_url, page_number) tasks one after another with the browser of a
+    one-slot DriverPool, yield (search_url, page_number, candidates)
+
+    Tasks of searches added to stopped_queries while crawling are skipped.
+    """
+    stopped_queries = stopped_queries if stopped_queries is not None else set()
+    previous_task = None
+    for index, (search_url, page_number) in enumerate(tasks):
+        if search_url in stopped_queries:
+            continue
+        print(f"\n==== Processing page {page_number+1} ====")
+        # Pagination buttons only reach the next page, jump by URL after skipped pages
+        direct = page_number > 0 and previous_task != (search_url, page_number - 1)
+        with pool.borrow() as driver:
+            if driver is None:
+                print("No browser left, terminating program")
+                return
+            candidates = scrape_page(
+                driver, page_number, credentials, direct, search_url
+            )
+        previous_task = (search_url, page_number)
+        if candidates is None:
+            print("Re-login failed, terminating program")
+            return
+        yield search_url, page_number, candidates
+
+        # Pause between pages to avoid too rapid requests
+        if any(url not in stopped_queries for url, _ in tasks[index + 1 :]):
+            print(f"Waiting {PAGE_DELAY} seconds before loading the next page...")
+            pause(PAGE_DELAY)
+
+
+def crawl_pages_parallel(
+    tasks,
+    credentials,
+    workers=DEFAULT_WORKERS,
+    rate_limit=PAGE_DELAY,
+    stopped_queries=None,
+):
+    """Scrape (search_url, page_number) tasks with a pool of logged-in browsers, yield
+    (search_url, page_number, candidates)
+
+    Tasks are handed out from a shared queue and each worker navigates straight to
+    get_search_url(page). Every worker borrows its own slot of a DriverPool, and workers
+    share one saved login session. rate_limit is the minimum number of seconds between two
+    page loads of the same worker. Results are yielded as soon as any worker finishes a page.
+    Tasks of searches added to stopped_queries while crawling are skipped.
+    """
+    stopped_queries = stopped_queries if stopped_queries is not None else set()
+    page_queue = queue.Queue()
+    for task in tasks:
+        page_queue.put(task)
+    results = queue.Queue()
+    worker_count = max(1, min(workers, len(tasks)))
+    pool = DriverPool(worker_count, credentials, WORKER_PROFILE_ROOT)
+
+    def worker(index):
+        try:
+            if not pool.start(index):
+                print(f"Worker {index+1}: login failed, stopping worker")
+                return
+
+            last_page_start = 0
+            while True:
+                try:
+                    search_url, page_number = page_queue.get_nowait()
+                except queue.Empty:
+                    return
+                if search_url in stopped_queries:
+                    continue
+
+                # Per-worker rate limit
+                wait = rate_limit - (time.time() - last_page_start)
+                if wait > 0:
+                    pause(wait)
+                last_page_start = time.time()
+
+                print(f"\n==== Worker {index+1}: processing page {page_number+1} ====")
+                with pool.borrow(index) as driver:
+                    if driver is None:
+                        # Leave the page for the other workers
+                        print(f"Worker {index+1}: no browser left, stopping worker")
+                        page_queue.put((search_url, page_number))
+                        return
+                    candidates = scrape_page(
+                        driver, page_number, credentials, True, search_url
                     )
-                    retry_count += 1
-                    if retry_count < max_retries:
-                        print(
-                            f"Retrying in {retry_delay} seconds... (Attempt {retry_count + 1}/{max_retries})"
-                        )
-                        time.sleep(retry_delay)
-                    else:
-                        print(
-                            f"Failed to get enough candidates after {max_retries} attempts, moving to next page"
+                if candidates is None:
+                    # Leave the page for the other workers
+                    print(f"Worker {index+1}: re-login failed, stopping worker")
+                    page_queue.put((search_url, page_number))
+                    return
+                results.put((search_url, page_number, candidates))
+        except Exception as e:
+            print(f"Worker {index+1} error: {str(e)}")
+        finally:
+            pool.close(index)
+
+    threads = [
+        threading.Thread(target=worker, args=(i,), daemon=True)
+        for i in range(worker_count)
+    ]
+    for thread in threads:
+        thread.start()
+
+    # Merge worker results into one stream
+    try:
+        while any(thread.is_alive() for thread in threads) or not results.empty():
+            try:
+                yield results.get(timeout=1)
+            except queue.Empty:
+                continue
+    except GeneratorExit:
+        # The caller stopped early, workers finish their current page and exit
+        while True:
+            try:
+                page_queue.get_nowait()
+            except queue.Empty:
+                break
+        raise
+
+    if not page_queue.empty():
+        print(f"{page_queue.qsize()} pages were not scraped, all workers stopped")
+
+
+def crawl_pages_pipelined(
+    pool,
+    tasks,
+    credentials,
+    parsers=PARSER_WORKERS,
+    rate_limit=PAGE_DELAY,
+    stopped_queries=None,
+    max_retries=MAX_PAGE_RETRIES,
+    on_parsed=None,
+):
+    """Scrape (search_url, page_number) tasks with the browser of a one-slot DriverPool
+    while parser threads extract the pages already loaded, yield
+    (search_url, page_number, candidates)
+
+    The browser thread only navigates and hands page snapshots to a bounded queue, so it
+    is loading the next page while the last one is parsed and cleaned. rate_limit is the
+    minimum number of seconds between two page loads. Incomplete pages go back to the
+    browser thread and are loaded again, up to max_retries times, as are pages whose
+    parsing failed. Tasks of searches added to stopped_queries while crawling are skipped.
+    on_parsed(search_url, page_number, candidates) is called by the parser threads, one
+    page at a time, as soon as a page is cleaned.
+    """
+    stopped_queries = stopped_queries if stopped_queries is not None else set()
+    pending = queue.Queue()
+    for search_url, page_number in tasks:
+        pending.put((search_url, page_number, 0))
+    retries = queue.Queue()
+    snapshots = queue.Queue(maxsize=SNAPSHOT_QUEUE_SIZE)
+    results = queue.Queue()
+    stopping = threading.Event()
+    parsed_lock = threading.Lock()
+    parser_count = max(1, parsers)
+
+    def next_task():
+        # Retries first, then new pages, waiting while parsers may still ask for a retry
+        while not stopping.is_set():
+            for source in [retries, pending]:
+                try:
+                    return source.get_nowait()
+                except queue.Empty:
+                    pass
+            if snapshots.unfinished_tasks == 0 and retries.empty():
+                return None
+            try:
+                return retries.get(timeout=0.2)
+            except queue.Empty:
+                continue
+        return None
+
+    def retry_or_give_up(search_url, page_number, attempt):
+        if attempt + 1 < max_retries and not stopping.is_set():
+            retries.put((search_url, page_number, attempt + 1))
+            return
+        print(
+            f"Failed to get enough candidates for page {page_number+1} after {max_retries} attempts, moving to next page"
+        )
+        results.put((search_url, page_number, []))
+
+    def fetch():
+        try:
+            previous_task = None
+            last_page_start = 0
+            while True:
+                task = next_task()
+                if task is None:
+                    return
+                search_url, page_number, attempt = task
+                if search_url in stopped_queries:
+                    continue
+
+                # Pause between pages to avoid too rapid requests
+                wait = rate_limit - (time.time() - last_page_start)
+                if wait > 0:
+                    pause(wait)
+                last_page_start = time.time()
+
+                print(f"\n==== Loading page {page_number+1} ====")
+                # Pagination buttons only reach the next page, jump by URL otherwise
+                direct = page_number > 0 and previous_task != (
+                    search_url,
+                    page_number - 1,
+                )
+                with profile_phase("page", page_number):
+                    with pool.borrow() as driver:
+                        if driver is None:
+                            print("No browser left, terminating program")
+                            return
+                        page_loaded = open_page(
+                            driver, page_number, credentials, direct, search_url
                         )
-                        page_number += 1
+                        snapshot = None
+                        if page_loaded:
+                            snapshot = capture_page_snapshot(driver, page_number)
+                            archive_page(
+                                driver, page_number, search_url, snapshot.get("html")
+                            )
+                previous_task = (search_url, page_number)
+                if page_loaded is None:
+                    print("Re-login failed, terminating program")
+                    return
+                if snapshot is not None:
+                    snapshots.put((search_url, page_number, attempt, snapshot))
+                else:
+                    retry_or_give_up(search_url, page_number, attempt)
+        except Exception as e:
+            print(f"Browser thread error: {str(e)}")
+        finally:
+            for _ in range(parser_count):
+                snapshots.put(None)
+
+    def parse():
+        while True:
+            item = snapshots.get()
+            try:
+                if item is None:
+                    return
+                search_url, page_number, attempt, snapshot = item
+                candidates = parse_page_snapshot(snapshot, page_number)
+                if page_complete(candidates):
+                    candidates = clean_data(candidates)
+                    if on_parsed is not None:
+                        with parsed_lock:
+                            on_parsed(search_url, page_number, candidates)
+                    results.put((search_url, page_number, candidates))
+                    continue
+                print(
+                    f"Retrieved only {len(candidates)} candidates on page {page_number+1}, expected {RESULTS_PER_PAGE}"
+                )
+                retry_or_give_up(search_url, page_number, attempt)
+            except Exception as e:
+                # Retried like a short page, the next load may parse
+                print(f"Parser error on page {page_number+1}: {str(e)}")
+                retry_or_give_up(search_url, page_number, attempt)
+            finally:
+                snapshots.task_done()
+
+    threads = [threading.Thread(target=fetch, name="browser", daemon=True)] + [
+        threading.Thread(target=parse, name=f"parser-{i+1}", daemon=True)
+        for i in range(parser_count)
+    ]
+    for thread in threads:
+        thread.start()
 
-            # Pause between pages to avoid too rapid requests
-            if page_number < max_pages:
+    try:
+        while any(thread.is_alive() for thread in threads) or not results.empty():
+            try:
+                yield results.get(timeout=1)
+            except queue.Empty:
+                continue
+    except GeneratorExit:
+        # The caller stopped early, the browser thread stops after its current page
+        stopping.set()
+        raise
+
+
+def parse_args(argv=None):
+    """Parse command line options"""
+    parser = argparse.ArgumentParser(
+        description="Scrape candidate profiles from GetProg.ai"
+    )
+    parser.add_argument(
+        "--max-pages",
+        type=int,
+        help="Number of result pages to scrape, defaults to enough pages for MAX_CANDIDATES",
+    )
+    parser.add_argument(
+        "--page-size",
+        type=int,
+        help=f"Results per page, defaults to {RESULTS_PER_PAGE}",
+    )
+    parser.add_argument(
+        "--autotune",
+        action="store_true",
+        help="Try the sizes in PAGE_SIZE_CANDIDATES on the first page and crawl with the fastest complete one",
+    )
+    parser.add_argument(
+        "--workers",
+        type=int,
+        default=DEFAULT_WORKERS,
+        help="Number of parallel browsers, 1 crawls sequentially",
+    )
+    parser.add_argument(
+        "--pipeline",
+        action="store_true",
+        help="With one browser, parse pages on --parsers threads while the next page loads",
+    )
+    parser.add_argument(
+        "--parsers",
+        type=int,
+        default=PARSER_WORKERS,
+        help="Parser threads of the --pipeline crawl",
+    )
+    parser.add_argument(
+        "--rate-limit",
+        type=float,
+        default=PAGE_DELAY,
+        help="Minimum seconds between page loads of one worker",
+    )
+    parser.add_argument(
+        "--specs",
+        metavar="SPEC_FILE",
+        help="JSON file of search specs to crawl instead of BASE_SEARCH_URL, see README",
+    )
+    parser.add_argument(
+        "--resume",
+        action="store_true",
+        help="Skip pages already finished for this search URL and append to the existing stream",
+    )
+    parser.add_argument(
+        "--incremental",
+        action="store_true",
+        help=f"Report new and changed candidates against {KNOWN_CANDIDATES_FILE} and stop after --stop-after pages with only known ones",
+    )
+    parser.add_argument(
+        "--stop-after",
+        type=int,
+        default=INCREMENTAL_STOP_PAGES,
+        metavar="PAGES",
+        help="Consecutive pages of known, unchanged candidates that end an incremental crawl",
+    )
+    parser.add_argument(
+        "--profile",
+        metavar="TRACE_FILE",
+        help="Time every WebDriver command and sleep per page and phase, print a breakdown and write a JSON lines trace",
+    )
+    parser.add_argument(
+        "--compact",
+        action="store_true",
+        help=f"Only rebuild {OUTPUT_FILE} from an existing {STREAM_FILE}, e.g. after a crash",
+    )
+    parser.add_argument(
+        "--reextract",
+        metavar="DIR",
+        help=f"Only re-extract candidates from the results pages saved in DIR into {OUTPUT_FILE}, without a browser",
+    )
+    parser.add_argument(
+        "--export",
+        choices=list(EXPORT_FILES),
+        help="Also write the final candidates as a Parquet or Arrow IPC table, needs pyarrow",
+    )
+    parser.add_argument(
+        "--archive",
+        nargs="?",
+        const=ARCHIVE_DIR,
+        metavar="DIR",
+        help=f"Store every results page compressed in a content-addressed archive, {ARCHIVE_DIR} by default",
+    )
+    parser.add_argument(
+        "--processes",
+        type=int,
+        help="Worker processes of --reextract, defaults to one per CPU core",
+    )
+    return parser.parse_args(argv)
+
+
+def main():
+    """Run main program, complete login and data scraping"""
+    global RESULTS_PER_PAGE, _page_archive
+    args = parse_args()
+    pool = None
+    profiler = enable_profiling() if args.profile else None
+    try:
+        if args.compact:
+            unique_candidates = compact_candidate_stream(STREAM_FILE, OUTPUT_FILE)
+            print(
+                f"Compacted {STREAM_FILE}: {len(unique_candidates)} unique candidate profiles saved to {OUTPUT_FILE}"
+            )
+            if args.export:
+                export_candidates(unique_candidates, args.export)
+            return
+
+        if args.reextract:
+            if args.page_size:
+                RESULTS_PER_PAGE = args.page_size
+            unique_candidates = reextract_saved_pages(
+                args.reextract, OUTPUT_FILE, args.processes
+            )
+            print(
+                f"Re-extracted {len(unique_candidates)} unique candidate profiles, saved to {OUTPUT_FILE}"
+            )
+            if args.export:
+                export_candidates(unique_candidates, args.export)
+            return
+
+        # Start from the selector order learned on earlier runs
+        _selector_learner.load(SELECTOR_STATS_FILE)
+
+        if args.archive:
+            os.makedirs(args.archive, exist_ok=True)
+            _page_archive = PageArchive(args.archive).load()
+            if _page_archive.compression != ARCHIVE_COMPRESSION:
+                print(
+                    f"{ARCHIVE_COMPRESSION} is not available, archiving pages with {_page_archive.compression}"
+                )
+
+        known_index = None
+        if args.incremental:
+            known_index = KnownCandidateIndex()
+            known_index.load()
+
+        # Login credentials are only asked for when no saved session is valid
+        credentials = {}
+
+        if args.page_size:
+            RESULTS_PER_PAGE = args.page_size
+        if args.autotune:
+            # Page numbers depend on the page size, pick it before planning the crawl
+            pool = DriverPool(1, credentials)
+            if not pool.start():
+                print("Login failed, please check credentials and try again.")
+                return
+            with pool.borrow() as driver:
+                autotune_page_size(driver)
+
+        queries = [(None, BASE_SEARCH_URL)]
+        if args.specs:
+            with open(args.specs, "r", encoding="utf-8") as f:
+                queries = expand_search_specs(json.load(f))
+        query_names = group_search_queries(queries)
+        if args.specs:
+            print(f"Crawling {len(query_names)} searches from {args.specs}")
+        # Printed names of the searches, tags exist only with --specs
+        query_labels = {
+            search_url: ", ".join(name for name in names if name) or "search"
+            for search_url, names in query_names.items()
+        }
+
+        max_pages = args.max_pages or math.ceil(MAX_CANDIDATES / RESULTS_PER_PAGE)
+        if not args.resume:
+            # Start a fresh stream, each finished page is written to disk right away
+            open(STREAM_FILE, "w", encoding="utf-8").close()
+        tasks = []
+        for search_url in query_names:
+            page_numbers = list(range(max_pages))
+            if args.resume:
+                finished = load_checkpoint(checkpoint_query(search_url))
+                page_numbers = [
+                    page_number
+                    for page_number in page_numbers
+                    if finished.get(page_number, {}).get("status") != "done"
+                ]
+                print(
+                    f"Resuming {query_labels[search_url]}: {max_pages - len(page_numbers)} pages already done, {len(page_numbers)} to scrape"
+                )
+            else:
+                reset_checkpoint(checkpoint_query(search_url))
+            tasks.extend((search_url, page_number) for page_number in page_numbers)
+
+        # Searches stopped early by --incremental, their remaining pages are skipped
+        stopped_queries = set()
+        known_runs = KnownPageRuns()
+        tracked_by_parsers = False
+
+        def track_known_candidates(search_url, page_number, candidates):
+            # Compare a page with earlier runs and stop its search after enough known pages
+            new, changed, unchanged = known_index.classify(candidates)
+            print(
+                f"Page {page_number+1}: {new} new, {changed} changed, {unchanged} known candidates"
+            )
+            known = known_runs.record(search_url, page_number, not new and not changed)
+            if known >= args.stop_after and search_url not in stopped_queries:
                 print(
-                    f"Waiting {retry_delay} seconds before loading page {page_number+1}..."
+                    f"{known} consecutive pages without new or changed candidates, stopping {query_labels[search_url]}"
+                )
+                stopped_queries.add(search_url)
+
+        if not tasks:
+            pages = []
+        elif args.workers > 1:
+            if pool:
+                pool.close()
+                pool = None
+            # Each worker sets up and logs in its own browser
+            pages = crawl_pages_parallel(
+                tasks, credentials, args.workers, args.rate_limit, stopped_queries
+            )
+        else:
+            if not pool:
+                # One browser with images disabled, reusing the saved session or logging in
+                pool = DriverPool(1, credentials)
+                if not pool.start():
+                    print("Login failed, please check credentials and try again.")
+                    return
+
+            if args.pipeline:
+                pages = crawl_pages_pipelined(
+                    pool,
+                    tasks,
+                    credentials,
+                    args.parsers,
+                    args.rate_limit,
+                    stopped_queries,
+                    on_parsed=(
+                        track_known_candidates if known_index is not None else None
+                    ),
                 )
-                time.sleep(retry_delay)
+                # The parsers compare each page with earlier runs as they finish it
+                tracked_by_parsers = known_index is not None
+            else:
+                pages = crawl_pages_sequential(
+                    pool, tasks, credentials, stopped_queries
+                )
+
+        # Scrape multiple pages of candidate information
+        total_candidates = 0
+        for search_url, page_number, candidates in pages:
+            names = [name for name in query_names[search_url] if name]
+            if names:
+                for candidate in candidates:
+                    candidate["queries"] = list(names)
+            # Stream first, so a page recorded as done is always on disk
+            append_candidates_to_stream(candidates, STREAM_FILE)
+            record_page_checkpoint(
+                checkpoint_query(search_url), page_number, candidates
+            )
+            total_candidates += len(candidates)
+            print(
+                f"Page {page_number+1}: Retrieved {len(candidates)} candidates, Total: {total_candidates}"
+            )
 
-        # Remove duplicates
-        unique_candidates = remove_duplicates(all_candidates)
+            if known_index is not None and candidates and not tracked_by_parsers:
+                track_known_candidates(search_url, page_number, candidates)
 
-        # Save results to JSON file
-        output_file = "getprog_candidates.json"
-        with open(output_file, "w", encoding="utf-8") as f:
-            json.dump(unique_candidates, f, ensure_ascii=False, indent=2)
+        # Deduplicate the stream into the final JSON array
+        unique_candidates = compact_candidate_stream(STREAM_FILE, OUTPUT_FILE)
 
         print(
-            f"\nScraping complete! Retrieved {len(unique_candidates)} unique candidate profiles, saved to {output_file}"
+            f"\nScraping complete! Retrieved {len(unique_candidates)} unique candidate profiles, saved to {OUTPUT_FILE}"
         )
+        if args.export:
+            export_candidates(unique_candidates, args.export)
+
+        if known_index is not None:
+            known_index.save()
+            known_index.write_changes()
+            print(
+                f"{len(known_index.new)} new and {len(known_index.changed)} changed candidates saved to {CHANGES_FILE}"
+            )
 
     except Exception as e:
         print(f"An error occurred: {str(e)}")
@@ -1475,11 +4982,20 @@ def main():
 
         traceback.print_exc()
     finally:
-        # Close browser
-        try:
-            driver.quit()
-        except:
-            pass
+        # Close browsers
+        if pool:
+            pool.close()
+
+        if _selector_learner.stats:
+            _selector_learner.save(SELECTOR_STATS_FILE)
+
+        if _page_archive is not None:
+            _page_archive.print_summary()
+
+        if profiler:
+            profiler.print_report()
+            _selector_learner.print_report()
+            profiler.write_trace(args.profile)
 
 
 if __name__ == "__main__":
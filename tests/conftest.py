@@ -0,0 +1,61 @@
+import os
+import sys
+
+import pytest
+
+# The crawler and the mock site are top-level scripts in the repository root
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import scraping_v1
+from mock_getprog_server import start_mock_server
+
+
+@pytest.fixture(autouse=True)
+def fresh_page_layout():
+    """Every test starts without a cached page layout"""
+    scraping_v1.reset_page_layout()
+    yield
+    scraping_v1.reset_page_layout()
+
+
+@pytest.fixture
+def mock_site():
+    """Yield a function starting the mock site with the given options, return its URL"""
+    servers = []
+
+    def start(**options):
+        server, base_url = start_mock_server(**options)
+        servers.append(server)
+        return base_url
+
+    yield start
+    for server in servers:
+        server.shutdown()
+
+
+@pytest.fixture
+def logged_in_browser(monkeypatch):
+    """Yield a function pointing the crawler at a mock site and returning a logged-in
+    headless Chrome, skip the test when Chrome is not available"""
+    drivers = []
+
+    def start(base_url, size):
+        monkeypatch.setattr(scraping_v1, "LOGIN_URL", f"{base_url}/login")
+        monkeypatch.setattr(
+            scraping_v1, "BASE_SEARCH_URL", f"{base_url}/search/results?text=test"
+        )
+        monkeypatch.setattr(scraping_v1, "RESULTS_PER_PAGE", size)
+        monkeypatch.setattr(scraping_v1, "HEADLESS", True)
+        monkeypatch.setattr(scraping_v1, "PAGE_DELAY", 0)
+        try:
+            driver = scraping_v1.setup_driver_no_image()
+        except Exception as e:
+            pytest.skip(f"Chrome is not available: {e}")
+        drivers.append(driver)
+        if not scraping_v1.login(driver, "test@example.com", "test"):
+            pytest.fail("Login to the mock site failed")
+        return driver
+
+    yield start
+    for driver in drivers:
+        driver.quit()
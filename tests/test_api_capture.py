@@ -0,0 +1,96 @@
+import json
+import os
+
+import pytest
+
+import scraping_v1
+
+FIXTURE = os.path.join(
+    os.path.dirname(__file__), "fixtures", "api_performance_log.json"
+)
+
+
+class RecordedDriver:
+    """Replays a recorded Chrome performance log and the response bodies it refers to
+
+    The log holds, in order: the session check load of page 1 at the site's default size
+    of 20, the previous page 2 at size 50, the requested page 3 at size 50 and a
+    stylesheet.
+    """
+
+    def __init__(self):
+        with open(FIXTURE, "r", encoding="utf-8") as f:
+            recording = json.load(f)
+        self.log = recording["log"]
+        self.bodies = recording["bodies"]
+
+    def get_log(self, log_type):
+        entries, self.log = self.log, []
+        return entries
+
+    def execute_cdp_cmd(self, command, params):
+        return {"body": self.bodies[params["requestId"]], "base64Encoded": False}
+
+
+@pytest.fixture
+def api_mode(monkeypatch):
+    monkeypatch.setattr(scraping_v1, "EXTRACTION_MODE", "api")
+    monkeypatch.setattr(scraping_v1, "RESULTS_PER_PAGE", 50)
+
+
+def test_only_the_requested_page_is_read(api_mode):
+    responses = scraping_v1.capture_api_responses(RecordedDriver())
+    assert len(responses) == 3
+
+    candidates = scraping_v1.extract_candidates_from_api_responses(responses, 2)
+
+    assert len(candidates) == 50
+    assert {candidate["page"] for candidate in candidates} == {3}
+    expected = json.loads(RecordedDriver().bodies["3"])["results"]
+    assert [candidate["name"] for candidate in candidates] == [
+        profile["name"] for profile in expected
+    ]
+    assert candidates[0]["github"] == expected[0]["github"]
+
+
+def test_responses_of_other_pages_or_sizes_are_ignored(api_mode):
+    responses = scraping_v1.capture_api_responses(RecordedDriver())
+
+    # Page 1 was only loaded at the default size of 20, never at 50
+    assert scraping_v1.extract_candidates_from_api_responses(responses, 0) == []
+    assert scraping_v1.extract_candidates_from_api_responses(responses, 4) == []
+
+
+def test_latest_response_of_a_page_wins(api_mode):
+    responses = scraping_v1.capture_api_responses(RecordedDriver())
+    url, data = responses[2]
+    refreshed = dict(data, results=data["results"][:10])
+
+    candidates = scraping_v1.extract_candidates_from_api_responses(
+        responses + [(url, refreshed)], 2
+    )
+
+    assert len(candidates) == 10
+
+
+def test_log_is_drained_before_navigation(api_mode):
+    driver = RecordedDriver()
+
+    scraping_v1.drain_api_responses(driver)
+
+    assert scraping_v1.capture_api_responses(driver) == []
+
+
+@pytest.mark.parametrize(
+    "url, page_number, size, matches",
+    [
+        ("https://x/api/search?page=3&size=50", 2, 50, True),
+        ("https://x/api/search?page=3&size=20", 2, 50, False),
+        ("https://x/api/search?page=2&size=50", 2, 50, False),
+        ("https://x/api/search?offset=100&limit=50", 2, 50, True),
+        ("https://x/api/search?offset=50&limit=50", 2, 50, False),
+        ("https://x/api/search", 2, 50, True),
+    ],
+)
+def test_api_response_matches(url, page_number, size, matches):
+    assert scraping_v1.api_response_matches(url, page_number, size) == matches
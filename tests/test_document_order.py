@@ -0,0 +1,38 @@
+"""Candidates come out in page order whichever selectors found their cards"""
+
+import pytest
+
+import scraping_v1
+
+FIRST_NAMES = ["Maya", "Grace", "Carla", "Hiro", "Omar"]
+LAST_NAMES = ["Nguyen", "Evans", "Kim", "Patel"]
+NAMES = [f"{first} {last}" for last in LAST_NAMES for first in FIRST_NAMES]
+
+
+def card(index, name):
+    # Cards alternate between two classes found by different card selectors
+    class_name = "candidate-card" if index % 2 == 0 else "profile-row-item"
+    handle = name.lower().replace(" ", "")
+    return f"""<div class="{class_name}">
+        <div class="c-name">{name}</div>
+        <div class="c-title">Senior Software Engineer @ Acme</div>
+        <div class="c-location">San Francisco, California</div>
+        <div class="c-experience">{index + 3} years experience</div>
+        <div class="c-skills"><span>Python</span> <span>Go</span></div>
+        <a href="https://github.com/{handle}">GitHub</a>
+        <a href="https://www.linkedin.com/in/{handle}">LinkedIn</a>
+    </div>"""
+
+
+def mixed_page():
+    cards = "\n".join(card(index, name) for index, name in enumerate(NAMES))
+    return f"<html><body><div class='results'>{cards}</div></body></html>"
+
+
+@pytest.mark.parametrize("page_size", [20, 5])
+def test_mixed_card_classes_keep_page_order(monkeypatch, page_size):
+    monkeypatch.setattr(scraping_v1, "RESULTS_PER_PAGE", page_size)
+
+    candidates = scraping_v1.extract_candidate_info_from_html(mixed_page(), 0)
+
+    assert [candidate["name"] for candidate in candidates] == NAMES[:page_size]
@@ -0,0 +1,134 @@
+"""DriverPool recycling when replacement browsers fail to start"""
+
+import os
+
+import pytest
+
+import scraping_v1
+
+
+class FakeDriver:
+    def __init__(self, name):
+        self.name = name
+        self.quit_called = False
+
+    def execute_cdp_cmd(self, command, params):
+        return {"metrics": [{"name": "JSHeapTotalSize", "value": 0}]}
+
+    def quit(self):
+        self.quit_called = True
+
+
+@pytest.fixture
+def pool(monkeypatch):
+    monkeypatch.setattr(scraping_v1, "save_session", lambda driver: None)
+    pool = scraping_v1.DriverPool(1)
+    pool.slots[0]["driver"] = FakeDriver("first")
+    yield pool
+    pool.close()
+
+
+def start_drivers(pool, monkeypatch, results):
+    """Make the pool's browser starts return results in turn"""
+    results = iter(results)
+    monkeypatch.setattr(pool, "_new_driver", lambda slot, generation: next(results))
+
+
+def borrow_pages(pool, count):
+    for _ in range(count):
+        with pool.borrow():
+            pass
+        if pool.slots[0]["warming"] is not None:
+            pool.slots[0]["warming"].join()
+
+
+def test_failed_prewarm_is_retried(pool, monkeypatch):
+    replacement = FakeDriver("replacement")
+    pool.max_pages = 20
+    start_drivers(pool, monkeypatch, [None, replacement])
+    # The first replacement starts at page 18 and fails, the next page starts another
+    borrow_pages(pool, 19)
+    assert pool.slots[0]["spare"] is replacement
+    borrow_pages(pool, 1)
+    assert pool.slots[0]["driver"] is replacement
+
+
+def test_recycle_starts_a_replacement_in_the_foreground(pool, monkeypatch):
+    replacement = FakeDriver("replacement")
+    pool.max_pages = 1
+    start_drivers(pool, monkeypatch, [None, replacement])
+    borrow_pages(pool, 1)
+    assert pool.slots[0]["driver"] is replacement
+
+
+def test_failed_recycle_leaves_the_slot_empty_without_raising(pool, monkeypatch):
+    first = pool.slots[0]["driver"]
+    pool.max_pages = 1
+    start_drivers(pool, monkeypatch, [None, None])
+    borrow_pages(pool, 1)
+    assert pool.slots[0]["driver"] is None
+    assert first.quit_called
+
+
+def test_borrow_restarts_an_empty_slot(pool, monkeypatch):
+    pool.max_pages = 1
+    restarted = FakeDriver("restarted")
+    start_drivers(pool, monkeypatch, [None, None, restarted])
+    borrow_pages(pool, 1)
+    with pool.borrow() as driver:
+        assert driver is restarted
+
+
+def test_borrow_lends_none_when_no_browser_starts(pool, monkeypatch):
+    pool.max_pages = 1
+    start_drivers(pool, monkeypatch, [None, None, None])
+    borrow_pages(pool, 1)
+    with pool.borrow() as driver:
+        assert driver is None
+    # Without a browser the page is not counted
+    assert pool.slots[0]["pages"] == 0
+
+
+def test_recycling_error_does_not_hide_the_page(pool, monkeypatch):
+    def fail(slot):
+        raise RuntimeError("recycling failed")
+
+    monkeypatch.setattr(pool, "_maintain", fail)
+    with pytest.raises(ValueError):
+        with pool.borrow():
+            raise ValueError("page error")
+    with pool.borrow() as driver:
+        pages = [driver.name]
+    assert pages == ["first"]
+
+
+@pytest.mark.skipif(not os.path.isdir("/proc"), reason="needs /proc")
+def test_process_tree_memory_includes_this_process():
+    assert scraping_v1.process_tree_rss_mb(os.getpid()) > 0
+    assert scraping_v1.process_tree_rss_mb(1) >= scraping_v1.process_tree_rss_mb(
+        os.getpid()
+    )
+
+
+def test_parallel_pages_survive_a_failed_recycle(monkeypatch):
+    def fail(pool, slot):
+        raise RuntimeError("recycling failed")
+
+    monkeypatch.setattr(
+        scraping_v1.DriverPool, "_new_driver", lambda pool, slot, gen: FakeDriver("w")
+    )
+    monkeypatch.setattr(scraping_v1.DriverPool, "_maintain", fail)
+    monkeypatch.setattr(
+        scraping_v1,
+        "scrape_page",
+        lambda driver, page_number, *args: [{"name": f"candidate {page_number}"}],
+    )
+
+    pages = scraping_v1.crawl_pages_parallel(
+        [("https://example.com/search", page) for page in range(3)],
+        {},
+        workers=1,
+        rate_limit=0,
+    )
+
+    assert sorted(page for _, page, _ in pages) == [0, 1, 2]
@@ -0,0 +1,27 @@
+import pytest
+
+import scraping_v1
+
+
+@pytest.mark.parametrize("lazy_batch", [0, 5])
+def test_html_mode_matches_webdriver_mode(
+    mock_site, logged_in_browser, monkeypatch, lazy_batch
+):
+    """Candidates parsed from a page_source snapshot equal the ones read element by
+    element through WebDriver"""
+    size = 20
+    driver = logged_in_browser(
+        mock_site(total=3 * size, size=size, lazy_batch=lazy_batch), size
+    )
+    for page_number in range(3):
+        assert scraping_v1.navigate_to_page(driver, page_number, direct=True)
+        results = {}
+        for mode in ["webdriver", "html", "script"]:
+            monkeypatch.setattr(scraping_v1, "EXTRACTION_MODE", mode)
+            scraping_v1.reset_page_layout()
+            results[mode] = scraping_v1.extract_candidate_info_from_page(
+                driver, page_number
+            )
+        assert len(results["webdriver"]) == size
+        assert results["html"] == results["webdriver"]
+        assert results["script"] == results["webdriver"]
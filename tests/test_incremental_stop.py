@@ -0,0 +1,34 @@
+"""Runs of known pages for --incremental, counted by page number"""
+
+from scraping_v1 import KnownPageRuns
+
+SEARCH = "https://example.com/search"
+
+
+def test_pages_in_order():
+    runs = KnownPageRuns()
+    assert runs.record(SEARCH, 0, True) == 1
+    assert runs.record(SEARCH, 1, True) == 2
+    assert runs.record(SEARCH, 2, False) == 0
+    assert runs.record(SEARCH, 3, True) == 1
+
+
+def test_out_of_order_pages_are_not_a_run():
+    runs = KnownPageRuns()
+    # Pages 1 and 5 arrive back to back but are not neighbours
+    assert runs.record(SEARCH, 1, True) == 1
+    assert runs.record(SEARCH, 5, True) == 1
+    assert runs.record(SEARCH, 3, False) == 0
+
+
+def test_late_page_joins_runs_on_both_sides():
+    runs = KnownPageRuns()
+    runs.record(SEARCH, 2, True)
+    runs.record(SEARCH, 4, True)
+    assert runs.record(SEARCH, 3, True) == 3
+
+
+def test_searches_are_counted_separately():
+    runs = KnownPageRuns()
+    runs.record(SEARCH, 0, True)
+    assert runs.record(SEARCH + "?q=go", 1, True) == 1
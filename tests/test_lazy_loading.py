@@ -0,0 +1,28 @@
+import scraping_v1
+
+
+def test_scroll_loads_every_card_when_fields_match_result_selector(
+    mock_site, logged_in_browser
+):
+    """Fields named candidate-* inside each card must not count as extra results"""
+    size = 20
+    base_url = mock_site(total=size, size=size, lazy_batch=5, nested_classes=True)
+    driver = logged_in_browser(base_url, size)
+    driver.get(scraping_v1.get_search_url(0))
+    scraping_v1.wait_for_results_ready(driver)
+
+    scraping_v1.scroll_to_load_all(driver, 0, size)
+
+    cards = driver.find_elements("css selector", "div.candidate-card")
+    assert len(cards) == size
+
+
+def test_readiness_probe_counts_cards_not_their_fields(mock_site, logged_in_browser):
+    """Before scrolling only the first lazy batch is rendered, its fields do not count"""
+    size = 20
+    base_url = mock_site(total=size, size=size, lazy_batch=5, nested_classes=True)
+    driver = logged_in_browser(base_url, size)
+    driver.get(scraping_v1.get_search_url(0))
+    scraping_v1.wait_for_results_ready(driver)
+
+    assert scraping_v1.probe_page_readiness(driver)["count"] == 5
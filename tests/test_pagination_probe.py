@@ -0,0 +1,63 @@
+"""URL pagination probing in navigate_to_page against a site that ignores page URLs"""
+
+import pytest
+
+import scraping_v1
+
+
+class PagingDriver:
+    """Browser fake whose result signature follows the page parameter only when the
+    site honours page URLs"""
+
+    def __init__(self, honours_page_urls):
+        self.honours_page_urls = honours_page_urls
+        self.current_url = ""
+        self.visited = []
+        self.signature = ""
+        self.page_source = "x" * 6000
+
+    def get(self, url):
+        self.visited.append(url)
+        self.current_url = url
+        page = url.split("page=")[1].split("&")[0] if "page=" in url else "1"
+        self.signature = f"page {page}" if self.honours_page_urls else "page 1"
+
+    def refresh(self):
+        pass
+
+    def find_elements(self, by, selector):
+        return [object()] * 5
+
+
+@pytest.fixture
+def paging(monkeypatch):
+    monkeypatch.setattr(scraping_v1, "_pagination_strategies", {})
+    monkeypatch.setattr(scraping_v1, "_first_page_signatures", {})
+    monkeypatch.setattr(scraping_v1, "wait_for_results_ready", lambda *a, **k: True)
+    monkeypatch.setattr(scraping_v1, "scroll_to_load_all", lambda *a, **k: None)
+    monkeypatch.setattr(scraping_v1, "drain_api_responses", lambda driver: [])
+    monkeypatch.setattr(scraping_v1, "navigate_by_click", lambda *a: False)
+    monkeypatch.setattr(scraping_v1, "page_signature", lambda driver: driver.signature)
+
+
+def test_failed_probe_and_click_reports_failure(paging):
+    driver = PagingDriver(honours_page_urls=False)
+    assert scraping_v1.navigate_to_page(driver, 0)
+    assert not scraping_v1.navigate_to_page(driver, 1)
+    assert scraping_v1.pagination_strategy(scraping_v1.BASE_SEARCH_URL) == "click"
+
+
+def test_resume_compares_against_page_one(paging):
+    driver = PagingDriver(honours_page_urls=False)
+    assert not scraping_v1.navigate_to_page(driver, 4, direct=True)
+    assert "page=1" in driver.visited[0]
+    assert scraping_v1.pagination_strategy(scraping_v1.BASE_SEARCH_URL) == "click"
+    # Later jumps are refused instead of loading page 1 again
+    assert not scraping_v1.navigate_to_page(driver, 5, direct=True)
+    assert len(driver.visited) == 2
+
+
+def test_resume_trusts_honoured_page_urls(paging):
+    driver = PagingDriver(honours_page_urls=True)
+    assert scraping_v1.navigate_to_page(driver, 4, direct=True)
+    assert scraping_v1.pagination_strategy(scraping_v1.BASE_SEARCH_URL) == "url"
@@ -0,0 +1,140 @@
+"""Pipelined crawl handing parsed pages to the incremental comparison as they arrive"""
+
+import threading
+from contextlib import contextmanager
+
+import pytest
+
+import scraping_v1
+
+SEARCH = "https://example.com/search"
+
+
+class FakePool:
+    @contextmanager
+    def borrow(self, slot=0):
+        yield object()
+
+
+@pytest.fixture
+def pipeline(monkeypatch):
+    loaded = []
+
+    def capture(driver, page_number):
+        loaded.append(page_number)
+        return {"page": page_number}
+
+    monkeypatch.setattr(scraping_v1, "open_page", lambda *a: True)
+    monkeypatch.setattr(scraping_v1, "capture_page_snapshot", capture)
+    monkeypatch.setattr(scraping_v1, "archive_page", lambda *a: None)
+    monkeypatch.setattr(
+        scraping_v1,
+        "parse_page_snapshot",
+        lambda snapshot, page_number: [{"name": f"candidate {page_number}"}],
+    )
+    monkeypatch.setattr(scraping_v1, "page_complete", lambda candidates: True)
+    monkeypatch.setattr(scraping_v1, "clean_data", lambda candidates: candidates)
+    return loaded
+
+
+def test_parsed_pages_reach_on_parsed_in_the_parser_threads(pipeline):
+    seen = []
+
+    def on_parsed(search_url, page_number, candidates):
+        seen.append((page_number, threading.current_thread().name))
+
+    pages = list(
+        scraping_v1.crawl_pages_pipelined(
+            FakePool(),
+            [(SEARCH, page) for page in range(4)],
+            {},
+            parsers=2,
+            rate_limit=0,
+            on_parsed=on_parsed,
+        )
+    )
+    assert sorted(page for _, page, _ in pages) == [0, 1, 2, 3]
+    assert sorted(page for page, _ in seen) == [0, 1, 2, 3]
+    assert all(name.startswith("parser-") for _, name in seen)
+
+
+def test_on_parsed_can_stop_a_search(pipeline):
+    stopped = set()
+
+    def on_parsed(search_url, page_number, candidates):
+        stopped.add(search_url)
+
+    list(
+        scraping_v1.crawl_pages_pipelined(
+            FakePool(),
+            [(SEARCH, page) for page in range(50)],
+            {},
+            parsers=1,
+            rate_limit=0,
+            stopped_queries=stopped,
+            on_parsed=on_parsed,
+        )
+    )
+    # Only the pages loaded before the first one was parsed are fetched
+    assert len(pipeline) < 50
+
+
+class HarvestDriver:
+    """Records the card selectors each harvest script call is given"""
+
+    def __init__(self):
+        self.card_selectors = []
+
+    def execute_script(self, script, cards, rows, *args):
+        self.card_selectors.append(cards)
+        return '{"cards": [], "rows": [], "containers": []}'
+
+
+LAYOUT = {"strategy": "cards", "selectors": ["div[class*='candidate-card']"]}
+
+
+def test_script_snapshots_use_the_cached_layout(monkeypatch):
+    monkeypatch.setattr(scraping_v1, "EXTRACTION_MODE", "script")
+    monkeypatch.setattr(scraping_v1, "wait_for_results_ready", lambda *a: True)
+    driver = HarvestDriver()
+
+    scraping_v1.remember_page_layout(LAYOUT)
+    snapshot = scraping_v1.capture_page_snapshot(driver, 1)
+
+    assert snapshot["layout"] == LAYOUT
+    assert driver.card_selectors == [LAYOUT["selectors"]]
+
+
+def test_mismatched_layout_is_dropped_for_the_retry(monkeypatch):
+    monkeypatch.setattr(scraping_v1, "EXTRACTION_MODE", "script")
+    monkeypatch.setattr(scraping_v1, "wait_for_results_ready", lambda *a: True)
+    driver = HarvestDriver()
+    scraping_v1.remember_page_layout(LAYOUT)
+
+    snapshot = scraping_v1.capture_page_snapshot(driver, 1)
+    assert scraping_v1.parse_page_snapshot(snapshot, 1) == []
+
+    # The page is retried with every strategy
+    scraping_v1.capture_page_snapshot(driver, 1)
+    assert len(driver.card_selectors[1]) == len(scraping_v1.CARD_SELECTORS)
+
+
+def test_parser_errors_are_retried(pipeline, monkeypatch):
+    attempts = []
+
+    def parse(snapshot, page_number):
+        attempts.append(page_number)
+        if len(attempts) == 1:
+            raise ValueError("broken snapshot")
+        return [{"name": f"candidate {page_number}"}]
+
+    monkeypatch.setattr(scraping_v1, "parse_page_snapshot", parse)
+
+    pages = list(
+        scraping_v1.crawl_pages_pipelined(
+            FakePool(), [(SEARCH, 0)], {}, parsers=1, rate_limit=0
+        )
+    )
+
+    assert pages == [(SEARCH, 0, [{"name": "candidate 0"}])]
+    assert pipeline == [0, 0]
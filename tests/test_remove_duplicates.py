@@ -0,0 +1,82 @@
+import pytest
+
+import scraping_v1
+
+
+def candidate(name, github="", linkedin="", position="", page=1, **fields):
+    return dict(
+        {
+            "page": page,
+            "name": name,
+            "position": position,
+            "experience": "",
+            "location": "",
+            "github": github,
+            "linkedin": linkedin,
+            "education": "",
+            "skills": [],
+        },
+        **fields,
+    )
+
+
+@pytest.mark.parametrize("reverse", [False, True])
+def test_linkless_entry_joins_linked_entry_of_same_name(reverse):
+    entries = [
+        candidate("Alice Smith", skills=["Rust"]),
+        candidate("Alice Smith", github="https://github.com/alice", skills=["Go"]),
+    ]
+    if reverse:
+        entries.reverse()
+
+    unique = scraping_v1.remove_duplicates(entries)
+
+    assert len(unique) == 1
+    assert unique[0]["github"] == "https://github.com/alice"
+    assert unique[0]["skills"] == ["Go", "Rust"]
+
+
+@pytest.mark.parametrize("reverse", [False, True])
+def test_linkless_entries_of_same_name_merge_without_linked_entry(reverse):
+    entries = [
+        candidate("Bob Jones", position="Data Engineer"),
+        candidate("bob  jones", skills=["SQL"]),
+        candidate("Carol White"),
+    ]
+    if reverse:
+        entries.reverse()
+
+    unique = scraping_v1.remove_duplicates(entries)
+
+    assert sorted(scraping_v1.normalize_name(entry["name"]) for entry in unique) == [
+        "bob jones",
+        "carol white",
+    ]
+
+
+def test_different_links_with_same_name_stay_apart():
+    entries = [
+        candidate("Alice Smith", github="https://github.com/alice"),
+        candidate("Alice Smith", github="https://github.com/alice-smith"),
+        candidate("Alice Smith"),
+    ]
+
+    unique = scraping_v1.remove_duplicates(entries)
+
+    assert len(unique) == 2
+
+
+@pytest.mark.parametrize("reverse", [False, True])
+def test_unknown_name_joins_entry_with_same_profile(reverse):
+    profile = {"position": "Senior Software Engineer", "location": "Berkeley, CA"}
+    entries = [
+        candidate("Unknown", **profile),
+        candidate("Dana Lee", linkedin="https://www.linkedin.com/in/dana", **profile),
+    ]
+    if reverse:
+        entries.reverse()
+
+    unique = scraping_v1.remove_duplicates(entries)
+
+    assert len(unique) == 1
+    assert unique[0]["name"] == "Dana Lee"
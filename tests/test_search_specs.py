@@ -0,0 +1,23 @@
+"""Search specs that build the same URL are crawled once under every name"""
+
+import scraping_v1
+
+
+def test_specs_building_the_same_url_keep_every_name():
+    queries = scraping_v1.expand_search_specs(
+        [
+            {"name": "backend", "text": "python", "countries": ["United States"]},
+            {"name": "python-us", "text": "python", "countries": "United States"},
+            {"name": "frontend", "text": "react"},
+        ]
+    )
+
+    names = scraping_v1.group_search_queries(queries)
+
+    assert list(names.values()) == [["backend", "python-us"], ["frontend"]]
+
+
+def test_default_search_has_no_name():
+    names = scraping_v1.group_search_queries([(None, scraping_v1.BASE_SEARCH_URL)])
+
+    assert names == {scraping_v1.BASE_SEARCH_URL: [None]}
@@ -0,0 +1,76 @@
+import scraping_v1
+
+CARD_TEXT = (
+    "Alice Smith\nSenior Software Engineer @ Acme\nSan Francisco, California\n{}"
+)
+
+
+class FakeElement:
+    def __init__(self, element_id, text, children=(), position=0):
+        self.id = element_id
+        self.text = text
+        self.children = list(children)
+        self.position = position
+
+    def contains(self, other):
+        return any(child is other or child.contains(other) for child in self.children)
+
+
+class FakeDriver:
+    """Answers find_elements per selector and the nesting script from a fake tree"""
+
+    def __init__(self, elements_by_selector):
+        self.elements_by_selector = elements_by_selector
+
+    def find_elements(self, by, selector):
+        return self.elements_by_selector.get(selector, [])
+
+    def execute_script(self, script, elements):
+        assert script == scraping_v1.ELEMENT_NESTING_SCRIPT
+        return {
+            "order": sorted(range(len(elements)), key=lambda i: elements[i].position),
+            "pairs": [
+                [i, j]
+                for i, outer in enumerate(elements)
+                for j, inner in enumerate(elements)
+                if i != j and outer.contains(inner)
+            ],
+        }
+
+
+def test_nesting_comes_from_the_dom_not_element_ids():
+    # Element ids are opaque, the wrapper's id sorts after its card's
+    card = FakeElement("b-card", CARD_TEXT.format("Python Rust"))
+    wrapper = FakeElement("a-wrapper", card.text, [card])
+    other = FakeElement("c-other", CARD_TEXT.format("Go SQL"))
+    driver = FakeDriver({"div.wrapper": [wrapper], "div.card": [card, other]})
+
+    records = scraping_v1.find_elements_by_selectors(
+        driver, ["div.wrapper", "div.card"]
+    )
+
+    nested = {record["key"] for record in records if record.get("nested")}
+    assert nested == {"a-wrapper"}
+
+
+def test_cards_with_identical_text_are_not_nested():
+    first = FakeElement("z-first", CARD_TEXT.format("Python"))
+    second = FakeElement("a-second", first.text)
+    driver = FakeDriver({"div.card": [first, second]})
+
+    records = scraping_v1.find_elements_by_selectors(driver, ["div.card"])
+
+    assert not any(record.get("nested") for record in records)
+
+
+def test_records_follow_document_order_across_selectors():
+    cards = [
+        FakeElement(f"id-{i}", CARD_TEXT.format(f"skill {i}"), position=i)
+        for i in range(4)
+    ]
+    driver = FakeDriver({"div.card": cards[::2], "div.row": cards[1::2]})
+
+    records = scraping_v1.find_elements_by_selectors(driver, ["div.card", "div.row"])
+
+    assert [record["key"] for record in records] == ["id-0", "id-1", "id-2", "id-3"]
+    assert [record["selector"] for record in records] == ["div.card", "div.row"] * 2
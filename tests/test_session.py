@@ -0,0 +1,29 @@
+import os
+import stat
+
+import pytest
+
+import scraping_v1
+
+
+class FakeDriver:
+    def execute_script(self, script):
+        if "origin" in script:
+            return "https://app.getprog.ai"
+        return {"token": "secret"}
+
+    def get_cookies(self):
+        return [{"name": "session", "value": "secret"}]
+
+
+@pytest.mark.skipif(os.name != "posix", reason="POSIX file modes")
+def test_saved_session_is_readable_by_owner_only(tmp_path):
+    session_file = tmp_path / "session.json"
+    # An older session file written with default permissions is replaced
+    session_file.write_text("{}")
+    os.chmod(session_file, 0o644)
+
+    scraping_v1.save_session(FakeDriver(), str(session_file))
+
+    assert stat.S_IMODE(os.stat(session_file).st_mode) == 0o600
+    assert scraping_v1.session_saved_at(str(session_file)) is not None
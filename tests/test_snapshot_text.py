@@ -0,0 +1,42 @@
+import pytest
+
+import scraping_v1
+
+
+def snapshot_text(html):
+    root = scraping_v1.parse_html_snapshot(
+        f"<html><body><div id='card'>{html}</div></body></html>"
+    )
+    return next(
+        node for node in root.iter_descendants() if node.get_attribute("id") == "card"
+    ).text
+
+
+@pytest.mark.parametrize(
+    "html, text",
+    [
+        ("<div>Alice Smith</div><div>Engineer</div>", "Alice Smith\nEngineer"),
+        ("<span>Alice</span> <span>Smith</span>", "Alice Smith"),
+        ("Alice<br>Smith", "Alice\nSmith"),
+        ("<p>  lots   of\n spaces </p>", "lots of spaces"),
+        ("<div hidden>secret</div>shown", "shown"),
+        ("<div style='display: none'>secret</div>shown", "shown"),
+        ("<div style='opacity:0'>secret</div>shown", "shown"),
+        ("<span style='visibility:hidden'>secret</span>shown", "shown"),
+        (
+            "<div style='visibility:hidden'>a<span style='visibility:visible'>b</span></div>",
+            "b",
+        ),
+        # aria-hidden only hides from assistive technology, WebDriver still returns it
+        ("<span aria-hidden='true'>icon</span> label", "icon label"),
+        ("<span style='display:block'>one</span><span>two</span>", "one\ntwo"),
+        (
+            "<div style='display:inline'>one</div> <div style='display:inline'>two</div>",
+            "one two",
+        ),
+        ("<script>var x = 1;</script><style>p {}</style>text", "text"),
+        ("<table><tr><td>a</td><td>b</td></tr><tr><td>c</td></tr></table>", "a b\nc"),
+    ],
+)
+def test_snapshot_text_matches_webdriver_text(html, text):
+    assert snapshot_text(html) == text